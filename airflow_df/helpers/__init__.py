@@ -1,12 +1,19 @@
+import os
 import inspect
 import functools
+import pandas as pd
 from airflow.decorators import task
+from airflow.exceptions import AirflowException
+from airflow.operators.python import get_current_context
+from .results import ResultBackend, ParquetBackend, FeatherBackend, SharedMemoryBackend
 
 class Helpers:
     r"""
     This auxiliary class groups a series of static methods to help you to do some operations
     """
 
+    result_backend = ResultBackend.get(os.environ.get('AIRFLOW_DF_RESULT_BACKEND') or None)
+
     @staticmethod
     def decorator(declared_decorator):
         r"""
@@ -75,6 +82,7 @@ class Helpers:
                 if not fn_name.startswith('_'):
 
                     doc = fn.__doc__
+                    fn.__signature__ = Helpers.get_task_signature(fn)
                     setattr(cls, fn_name, task(fn))
                     fn = getattr(cls, fn_name)
                     fn.__doc__ = doc             
@@ -91,6 +99,13 @@ class Helpers:
 
         Every method compatible with airflow task must be decorated with this decorator.
 
+        Airflow context arguments are removed, unless the method declares them explicitly, i.e. *data_interval_start*.
+
+        DataFrames returned by the method are stored by the result backend, if any, and only a reference is pushed
+        through XCom, see [set_result_backend](#set_result_backend). References received as arguments are loaded before
+        calling the method. The backend can be overridden by task with the *result_backend* argument. Results are stored
+        by DAG run, the *run_id* is taken from the current Airflow context when the method does not receive it.
+
         ```python
         from airflow_df.helpers import Helpers
 
@@ -106,16 +121,131 @@ class Helpers:
         """
         _kwargs = kwargs.copy()
         default_args = dict()
+        declared = Helpers.get_declared_args(func)
         for key in _kwargs.keys():
 
-            if key in Helpers.get_default_args_in_tasks():
+            if key in Helpers.get_default_args_in_tasks() and key not in declared:
 
                 default_args[key] = kwargs.pop(key)
 
+        backend = ResultBackend.get(kwargs.pop('result_backend', Helpers.result_backend))
+        args = [Helpers.load_result(arg) for arg in args]
+        kwargs = {key: Helpers.load_result(value) for key, value in kwargs.items()}
+
         result = func(*args, **kwargs)
 
+        if backend is not None and isinstance(result, pd.DataFrame):
+
+            return backend.write(result, lease=default_args.get('run_id') or Helpers.get_run_id())
+
         return result
 
+    @staticmethod
+    def set_result_backend(backend=None):
+        r"""
+        Set the backend used to pass DataFrames between tasks out of XCom. It can be also set with the environment
+        variable *AIRFLOW_DF_RESULT_BACKEND*.
+
+        **Parameters**
+
+        - **backend:** (ResultBackend, str or None) 'parquet' or 'feather', with an optional folder shared by the workers,
+        i.e. 'parquet:/mnt/shared/results', or 'shm' to hand off column buffers through shared memory between tasks on the
+        same host. None to push DataFrames through XCom.
+
+        Stored DataFrames belong to the DAG run that wrote them, use [release_results](#release_results) to remove them
+        when the run ends.
+
+        ```python
+        from airflow_df.helpers import Helpers
+
+        Helpers.set_result_backend('feather:/mnt/shared/results')
+        ```
+        """
+        Helpers.result_backend = ResultBackend.get(backend)
+
+    @staticmethod
+    def release_results(context:dict=None, backend=None):
+        r"""
+        Remove the DataFrames stored by the result backend for a DAG run. Its signature allows to use it as DAG callback.
+
+        **Parameters**
+
+        - **context:** (dict) Airflow context, *run_id* is used.
+        - **backend:** (ResultBackend or str, optional) by default the backend set with
+        [set_result_backend](#set_result_backend).
+
+        ```python
+        from airflow import DAG
+        from airflow_df.helpers import Helpers
+
+        Helpers.set_result_backend('shm')
+
+        with DAG(
+            dag_id="demo",
+            on_success_callback=Helpers.release_results,
+            on_failure_callback=Helpers.release_results
+        ) as dag:
+
+            pass
+        ```
+        """
+        backend = ResultBackend.get(backend) or Helpers.result_backend
+
+        if backend is not None:
+
+            backend.release((context or dict()).get('run_id'))
+
+    @staticmethod
+    def load_result(value):
+        r"""
+        Load the DataFrame of a result backend reference, any other value is returned as is.
+        """
+        if ResultBackend.is_reference(value):
+
+            return ResultBackend.load(value)
+
+        return value
+
+    @staticmethod
+    def get_run_id()->str:
+        r"""
+        Run id of the current Airflow context, None out of a running task.
+        """
+        try:
+
+            return get_current_context().get('run_id')
+
+        except AirflowException:
+
+            return None
+
+    @staticmethod
+    def get_task_signature(func)->inspect.Signature:
+        r"""
+        Signature of a task, *result_backend* is added as keyword argument to methods without **kwargs, so Airflow accepts
+        it when the task is called.
+        """
+        signature = inspect.signature(func)
+        parameters = list(signature.parameters.values())
+
+        if any(parameter.kind == inspect.Parameter.VAR_KEYWORD for parameter in parameters):
+
+            return signature
+
+        parameters.append(inspect.Parameter('result_backend', inspect.Parameter.KEYWORD_ONLY, default=None))
+
+        return signature.replace(parameters=parameters)
+
+    @staticmethod
+    def get_declared_args(func)->list:
+        r"""
+        Helps to you know which arguments are declared explicitly by a function, *args and **kwargs excluded.
+        """
+        func = getattr(func, '__func__', func)
+        kinds = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+
+        return [name for name, parameter in inspect.signature(func).parameters.items() if parameter.kind in kinds]
+
     @staticmethod
     def get_default_args_in_tasks():
         r"""
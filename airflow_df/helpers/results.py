@@ -0,0 +1,324 @@
+import os
+import mmap
+import uuid
+import pickle
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+import pandas as pd
+from multiprocessing import shared_memory, resource_tracker
+
+REFERENCE = '__airflow_df__'
+
+
+class ResultBackend:
+    r"""
+    Base class of result backends.
+
+    A result backend stores the DataFrames returned by tasks out of the Airflow metadata database, only a small reference
+    (dict) is pushed through XCom, and the consumer task loads the DataFrame from the reference.
+
+    Subclasses must define *name*, *write* and *read*.
+    """
+
+    name = None
+    extension = None
+    backends = dict()
+
+    def __init__(self, path:str=None):
+
+        if path is None:
+
+            path = os.path.join(tempfile.gettempdir(), 'airflow_df', 'results')
+
+        self.path = path
+
+    def __init_subclass__(cls, **kwargs):
+
+        super().__init_subclass__(**kwargs)
+
+        if cls.name:
+
+            ResultBackend.backends[cls.name] = cls
+
+    @classmethod
+    def get(cls, spec):
+        r"""
+        Get a result backend from a specification.
+
+        **Parameters**
+
+        - **spec:** (ResultBackend or str) backend instance, or backend name with an optional folder, i.e. 'parquet' or
+        'feather:/mnt/shared/results'.
+
+        **Returns**
+
+        - **backend:** (ResultBackend or None)
+        """
+        if spec is None or spec is False or isinstance(spec, ResultBackend):
+
+            return spec or None
+
+        name, _, path = str(spec).partition(':')
+
+        if name not in cls.backends:
+
+            raise ValueError(f"Unknown result backend {name!r}, available backends are {list(cls.backends)}")
+
+        return cls.backends[name](path or None)
+
+    @staticmethod
+    def is_reference(value)->bool:
+        r"""
+        True if *value* is a reference written by a result backend.
+        """
+        return isinstance(value, dict) and REFERENCE in value
+
+    @classmethod
+    def load(cls, reference:dict, columns:list=None)->pd.DataFrame:
+        r"""
+        Load the DataFrame of a reference with the backend that wrote it.
+
+        **Parameters**
+
+        - **reference:** (dict)
+        - **columns:** (list, optional) columns to load.
+
+        **Returns**
+
+        - **df:** (pd.DataFrame)
+        """
+        backend = cls.backends[reference[REFERENCE]](reference['root'])
+
+        return backend.read(reference, columns=columns)
+
+    @staticmethod
+    def lease_name(lease:str=None)->str:
+        r"""
+        Short file system safe name of a lease, i.e. an Airflow *run_id*.
+        """
+        if lease is None:
+
+            return 'default'
+
+        return hashlib.sha1(str(lease).encode()).hexdigest()[:16]
+
+    def new_path(self, lease:str=None)->str:
+        r"""
+        Unique file path inside the lease folder.
+        """
+        folder = os.path.join(self.path, self.lease_name(lease))
+        os.makedirs(folder, exist_ok=True)
+
+        return os.path.join(folder, f"{uuid.uuid4().hex}{self.extension}")
+
+    def reference(self, df:pd.DataFrame, **kwargs)->dict:
+        r"""
+        Builds the reference pushed through XCom.
+        """
+        return {REFERENCE: self.name, 'root': self.path, 'shape': list(df.shape), **kwargs}
+
+    def write(self, df:pd.DataFrame, lease:str=None)->dict:
+        r"""
+        Store a DataFrame.
+
+        **Parameters**
+
+        - **df:** (pd.DataFrame)
+        - **lease:** (str, optional) owner of the stored data, i.e. the Airflow *run_id*, see [release](#release).
+
+        **Returns**
+
+        - **reference:** (dict)
+        """
+        raise NotImplementedError
+
+    def read(self, reference:dict, columns:list=None)->pd.DataFrame:
+        r"""
+        Load a stored DataFrame.
+        """
+        raise NotImplementedError
+
+    def release(self, lease:str=None):
+        r"""
+        Remove all DataFrames stored for a lease, i.e. when the DAG run ends.
+        """
+        shutil.rmtree(os.path.join(self.path, self.lease_name(lease)), ignore_errors=True)
+
+
+class ParquetBackend(ResultBackend):
+    r"""
+    Stores DataFrames as Parquet files, suited for shared storage between workers. It requires *pyarrow*.
+    """
+
+    name = 'parquet'
+    extension = '.parquet'
+
+    def write(self, df:pd.DataFrame, lease:str=None)->dict:
+
+        path = self.new_path(lease)
+        df.to_parquet(path)
+
+        return self.reference(df, path=path)
+
+    def read(self, reference:dict, columns:list=None)->pd.DataFrame:
+
+        return pd.read_parquet(reference['path'], columns=columns)
+
+
+class FeatherBackend(ResultBackend):
+    r"""
+    Stores DataFrames as uncompressed Arrow IPC (Feather) files, which are memory-mapped on read. It requires *pyarrow*.
+    """
+
+    name = 'feather'
+    extension = '.feather'
+
+    def write(self, df:pd.DataFrame, lease:str=None)->dict:
+
+        import pyarrow
+        from pyarrow import feather
+
+        path = self.new_path(lease)
+        feather.write_feather(pyarrow.Table.from_pandas(df), path, compression='uncompressed')
+
+        return self.reference(df, path=path)
+
+    def read(self, reference:dict, columns:list=None)->pd.DataFrame:
+
+        from pyarrow import feather
+
+        return feather.read_table(reference['path'], columns=columns, memory_map=True).to_pandas()
+
+
+class SharedMemoryBackend(ResultBackend):
+    r"""
+    Stores the column buffers of DataFrames in POSIX shared memory, for tasks running on the same host (LocalExecutor or
+    *airflow tasks test*). The consumer maps numeric, boolean and datetime columns by name without copying them, through
+    private copy-on-write mappings, so a page is only copied when the loaded DataFrame writes on it and the segment is
+    never changed; any other column, the index and the attrs are pickled in one more segment.
+
+    Segments are not removed when tasks end, the names of the segments of each lease are kept in a manifest file in
+    *path* and they are removed by [release](#release), i.e. with [Helpers.release_results](#release_results) as DAG
+    callback.
+    """
+
+    name = 'shm'
+    extension = '.txt'
+
+    def write(self, df:pd.DataFrame, lease:str=None)->dict:
+
+        lease = self.lease_name(lease)
+        prefix = f"adf_{lease[:8]}_{uuid.uuid4().hex[:12]}"
+        columns = list()
+        others = dict()
+
+        for position in range(df.shape[1]):
+
+            values = df.iloc[:, position]
+            dtype = values.dtype
+
+            if isinstance(dtype, np.dtype) and dtype.kind in 'biufcmM':
+
+                name = f"{prefix}_{position}"
+                self.__create(name, np.ascontiguousarray(values.to_numpy()), lease)
+                columns.append([position, name, dtype.str, len(values)])
+
+            else:
+
+                others[position] = values.array
+
+        skeleton = {'index': df.index, 'columns': df.columns, 'others': others, 'attrs': df.attrs}
+        self.__create(f"{prefix}_s", np.frombuffer(pickle.dumps(skeleton, protocol=pickle.HIGHEST_PROTOCOL), dtype=np.uint8), lease)
+
+        return self.reference(df, lease=lease, skeleton=f"{prefix}_s", columns=columns)
+
+    def read(self, reference:dict, columns:list=None)->pd.DataFrame:
+
+        skeleton = pickle.loads(self.__map(reference['skeleton']))
+        data = dict(skeleton['others'])
+
+        for position, name, dtype, length in reference['columns']:
+
+            data[position] = np.ndarray((length,), dtype=np.dtype(dtype), buffer=self.__map(name))
+
+        df = pd.DataFrame({position: data[position] for position in sorted(data)}, index=skeleton['index'], copy=False)
+        df.columns = skeleton['columns']
+        df.attrs = skeleton['attrs']
+
+        if columns is not None:
+
+            df = df[columns]
+
+        return df
+
+    def release(self, lease:str=None):
+
+        manifest = os.path.join(self.path, f"{self.lease_name(lease)}{self.extension}")
+
+        try:
+
+            with open(manifest, 'r') as file:
+
+                names = file.read().split()
+
+        except FileNotFoundError:
+
+            return
+
+        for name in names:
+
+            try:
+
+                # unlink also unregisters the segment from the resource tracker
+                segment = shared_memory.SharedMemory(name=name)
+                segment.unlink()
+                segment.close()
+
+            except FileNotFoundError:
+
+                pass
+
+        os.remove(manifest)
+
+    def __create(self, name:str, values:np.ndarray, lease:str):
+
+        os.makedirs(self.path, exist_ok=True)
+
+        with open(os.path.join(self.path, f"{lease}{self.extension}"), 'a') as file:
+
+            file.write(f"{name}\n")
+
+        segment = shared_memory.SharedMemory(name=name, create=True, size=max(values.nbytes, 1))
+        self.__untrack(segment)
+        buffer = np.ndarray(values.shape, dtype=values.dtype, buffer=segment.buf)
+        buffer[:] = values
+        del buffer
+        segment.close()
+
+    def __map(self, name:str)->mmap.mmap:
+
+        segment = shared_memory.SharedMemory(name=name)
+        self.__untrack(segment)
+
+        try:
+
+            # The map keeps its own file descriptor and is closed with the last array that uses it
+            return mmap.mmap(segment._fd, segment.size, access=mmap.ACCESS_COPY)
+
+        finally:
+
+            segment.close()
+
+    @staticmethod
+    def __untrack(segment:shared_memory.SharedMemory):
+
+        # The resource tracker would unlink the segments when the task process ends
+        try:
+
+            resource_tracker.unregister(segment._name, 'shared_memory')
+
+        except Exception:
+
+            pass
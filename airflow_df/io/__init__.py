@@ -1,6 +1,12 @@
 from ..helpers import Helpers
 from .csv import CSVFormatter
 from .olga import OlgaFormatter
+from .olga.units import UnitConverter
+from .memory import MemoryOptimizer
+from .pkl import PickleFormatter
+from .sql import SQLFormatter
+from .parquet import ParquetFormatter
+from .formats import Formatter
 import pandas as pd
 
 @Helpers.as_airflow_tasks()
@@ -12,7 +18,98 @@ class IO:
 
     @Helpers.check_airflow_task_args
     @staticmethod
-    def read_csv(filepath:str, **kwargs)->pd.DataFrame:
+    def read(filepath:str, format:str=None, options:dict=None, **kwargs):
+        """
+Read a file of any registered format, i.e. from a landing folder with mixed files.
+
+The format is detected from the first bytes of each file, without parsing it, so files with any extension or none are routed to their reader:
+
+- Parquet ('PAR1'), Feather ('ARROW1') and pickles (protocol header or columnar pickle magic) by their magic numbers.
+- OLGA trends by their 'OLGA x.y' header line followed by 'TIME PLOT'.
+- OLGA input decks by their '!****' banner or their first keywords.
+- Delimited text files by their delimiter, detected with *csv.Sniffer* on the first lines.
+
+The file extension is only used when the content is not recognized. New formats are registered by subclassing [Formatter](#formatter).
+
+**Parameters**
+
+- **filepath:**  path string.
+
+It could be a file, a directory, a glob pattern or a Parquet dataset folder. A path without extension that does not exist is completed with the extension of a registered format, i.e. 'data/csv/Employee Sample Data'.
+
+- **format:** str, optional
+
+Skip the detection and use this formatter, i.e. 'csv', 'tpl', 'genkey', 'parquet', 'feather' or 'pkl'.
+
+- **options:** dict, optional
+
+Keyword arguments by format name, for folders with mixed files, i.e. {'csv': {'encoding': 'unicode_escape'}, 'tpl': {'units': 'SI'}}.
+
+- **optimize_memory:** bool or dict, default False
+
+Shrink the DataFrames after reading them, see [read_csv](#read_csv).
+
+Any other keyword argument is passed to the reader of the format, i.e. *encoding* to [read_csv](#read_csv), *usecols* or *units* to [read_tpl](#read_tpl).
+
+**Returns**
+
+**DataFrame, Genkey or dict**
+
+The result of the reader. Several files of one format are read together by its reader, i.e. tpl cases are concatenated with a 'CASE' index level. Several files of different formats give a dict of results by format name.
+
+```python
+from airflow_df.io import IO
+
+df = IO.read.function("landing/SF_SH_D0_R0")
+results = IO.read.function("landing", options={'csv': {'encoding': 'unicode_escape'}})
+```
+        """
+        optimizer = MemoryOptimizer.get(kwargs.pop('optimize_memory', False))
+        options = options or dict()
+        filepaths = Formatter.expand(filepath)
+
+        if filepaths is None:
+
+            formatter = Formatter.get(format) if format is not None else Formatter.detect(filepath)
+            result = formatter.read(filepath, **kwargs, **options.get(formatter.name, dict()))
+
+        elif not filepaths:
+
+            raise FileNotFoundError(f"There are no files in {filepath}")
+
+        else:
+
+            groups = dict()
+
+            for path in filepaths:
+
+                formatter = Formatter.get(format) if format is not None else Formatter.detect(path)
+                groups.setdefault(formatter, list()).append(path)
+
+            result = dict()
+
+            for formatter, paths in groups.items():
+
+                arguments = {**kwargs, **options.get(formatter.name, dict())}
+                result[formatter.name] = formatter.read(paths[0], **arguments) if len(paths) == 1 else formatter.read_many(paths, **arguments)
+
+            if len(result) == 1:
+
+                result = next(iter(result.values()))
+
+        if optimizer is None:
+
+            return result
+
+        if isinstance(result, dict):
+
+            return {key: optimizer.optimize(value) if isinstance(value, pd.DataFrame) else value for key, value in result.items()}
+
+        return optimizer.optimize(result) if isinstance(result, pd.DataFrame) else result
+
+    @Helpers.check_airflow_task_args
+    @staticmethod
+    def read_csv(filepath:str, data_interval_start=None, **kwargs)->pd.DataFrame:
         """
 Read a comma-separated values (csv) file into DataFrame.
 
@@ -27,6 +124,16 @@ If you want to pass in a path object, pandas accepts any os.PathLike.
 
 By file-like object, we refer to objects with a read() method, such as a file handle (e.g. via builtin open function) or StringIO.
 
+It could be also a directory, all its '.csv' files are read, or a glob pattern, i.e. 'exports/2023-*.csv'. Several files are read concurrently and concatenated at once. A path without extension that does not exist is completed with '.csv'.
+
+- **max_workers:** int, optional
+
+Number of workers used to read several files, by default the executor default. With 1, files are read one after the other.
+
+- **executor:** {'thread', 'process'}, default 'thread'
+
+Pool used to read several files, use 'process' when parsing is CPU bound. All keyword arguments must be picklable with 'process'.
+
 - **sep:** (str, default ',')
 
 Delimiter to use. If sep is None, the C engine cannot automatically detect the separator, but the Python parsing engine can, meaning the latter will be used and automatically detect the separator by Python's builtin sniffer tool, csv.Sniffer. In addition, separators longer than 1 character and different from '\s+' will be interpreted as regular expressions and will also force the use of the Python parsing engine. Note that regex delimiters are prone to ignoring quoted data. Regex example: '\r\t'.
@@ -65,6 +172,28 @@ Data type for data or columns. E.g. {'a': np.float64, 'b': np.int32, 'c': 'Int64
 
 Parser engine to use. The C and pyarrow engines are faster, while the python engine is currently more feature-complete. Multithreading is currently only supported by the pyarrow engine.
 
+If it is not provided, the fastest engine that supports the given options is used: 'pyarrow' when it is installed, 'c' otherwise, and 'python' for regex separators.
+
+- **incremental:** bool or str, default False
+
+Read only the files that are new since the last run and the appended tail of growing files. Byte offset, rows, modification time and size of each file are kept in a JSON state file, by default one by *filepath* in '~/.cache/airflow_df/incremental'. If a string is provided, it is used as the state file path. Only complete lines are read, and a file rewritten from scratch is read again.
+
+- **data_interval_start:** datetime, optional
+
+Airflow context argument, it is passed by Airflow to the task. In incremental mode, each run starts from the state left by the latest previous interval, so re-running an interval reads the same rows again.
+
+- **optimize_memory:** bool or dict, default False
+
+Shrink the DataFrame after reading it: float64 columns become float32 when no value changes more than a relative tolerance (1e-6 by default), integer columns take the smallest type that holds their values, and string columns with less distinct values than half of the rows, i.e. 'Department' or 'Country', become categoricals. The memory before and after and the bytes saved are kept in *df.attrs['memory']*. A dict sets the options, i.e. {'tolerance': 1e-4, 'categories': 0.1}, see [MemoryOptimizer](#memoryoptimizer).
+
+- **where:** str, optional
+
+Keep only the rows for which this query expression is True, i.e. "Salary > 50000". The file is parsed in chunks of *chunksize* rows (262144 by default) and each chunk is filtered before the next one is parsed, so the rows filtered out never accumulate in memory. Row labels are the positions of the rows in the file.
+
+- **dtype_cache:** bool or str, default False
+
+Keep the dtypes inferred on the first read of a file family (same header and delimiter) in a JSON file, by default '~/.cache/airflow_df/csv_dtypes.json', and pass them as *dtype* on later reads to skip type inference. If a string is provided, it is used as the JSON file path. Dtypes given in *dtype* take precedence over the cached ones.
+
 - **converters:** dict, optional
 
 Dict of functions for converting values in certain columns. Keys can either be integers or column labels.
@@ -263,31 +392,376 @@ The dtype_backends are still experimential.
 
 A comma-separated values (csv) file is returned as two-dimensional data structure with labeled axes.
         """
-        return CSVFormatter.read(filepath=filepath, **kwargs)
+        if data_interval_start is not None:
+
+            kwargs['data_interval_start'] = data_interval_start
+
+        optimizer = MemoryOptimizer.get(kwargs.pop('optimize_memory', False))
+        df = CSVFormatter.read(filepath=filepath, **kwargs)
+
+        if optimizer is not None and isinstance(df, pd.DataFrame):
+
+            df = optimizer.optimize(df)
+
+        return df
     
     @Helpers.check_airflow_task_args
     @staticmethod
     def read_tpl(filepath:str, **kwargs)->pd.DataFrame:
         """
-        Documentation here
+Read an OLGA trend (.tpl) file into DataFrame.
+
+The file is walked once: header, geometry profile, catalog and time series. The time series block is converted at once into a float64 matrix.
+
+**Parameters**
+
+- **filepath:**  path string.
+
+It could be a tpl file, a directory or a glob pattern, i.e. 'cases/SF_*.tpl'. Several files are parsed across a process pool and each case is identified by its file name without extension, i.e. 'SF_SH_D0_R0'.
+
+- **max_workers:** int, optional
+
+Number of processes used to read several files, by default the number of CPUs. Use 1 to read them in the task process, i.e. when the executor does not allow child processes.
+
+- **concat:** bool, default True
+
+If several files are read, concatenate them in one DataFrame with a 'CASE' index level, otherwise a dict of DataFrames by case is returned.
+
+- **iterator:** bool, default False
+
+Return TPLReader object for iteration or getting chunks with get_chunk().
+
+- **chunksize:** int, optional
+
+Return TPLReader object for iteration, each chunk is a DataFrame with *chunksize* time steps. Only the header and the current chunk are kept in memory, use it for time series bigger than memory.
+
+- **window:** tuple, optional
+
+(start, end) time interval in seconds to read, i.e. (3600, 7200). The file is memory-mapped and a sparse index of row offsets is used to jump to the first time step of the window, so the previous rows are never parsed. Use None for an open side, i.e. (3600, None).
+
+- **usecols:** str, dict, callable or list of them, optional
+
+Return a subset of the catalog variables, the time column is always kept. Each item selects the variables whose column name ('PT_POS-1378M'), variable ('PT'), element type ('POSITION:', 'LEAK:', 'CHOKE:') or element label ('V-IN') is equal to a string; whose catalog fields are equal to all items of a dict, i.e. {'variable': 'PVALVE', 'label': 'V-IN'}; or for which a callable evaluated against the catalog entry returns True. Columns keep the catalog order and only the selected fields of the time series are converted.
+
+- **cache:** bool or str, default False
+
+Load the parsed file from a Parquet cache. After the first parse, time series, catalog and info are stored in a folder keyed by the file content hash, the path, modification time and size of the file are used to know when the hash must be computed again. If a string is provided, it is used as cache folder, by default '~/.cache/airflow_df/tpl'. It requires *pyarrow* and it is ignored when *chunksize*, *iterator* or *window* are provided.
+
+- **cache_size:** int, default 4 GiB
+
+Maximum cache size in bytes, the least recently used files are removed first.
+
+- **optimize_memory:** bool or dict, default False
+
+Shrink the DataFrame after reading it: float64 columns become float32 when no value changes more than a relative tolerance (1e-6 by default). The memory before and after and the bytes saved are kept in *df.attrs['memory']*. A dict sets the options, i.e. {'tolerance': 1e-4}, see [MemoryOptimizer](#memoryoptimizer).
+
+- **units:** str or dict, optional
+
+Convert the variables to a unit system after reading them: 'SI', 'field' or a dict of target units by unit or by dimension, i.e. {'PA': 'BAR', 'temperature': 'K'}. A scale and an offset are computed once by column from the catalog units and the values matrix is converted in one vectorized operation, the catalog units are updated, see [UnitConverter](#unitconverter).
+
+- **where:** str, optional
+
+Keep only the time steps for which this query expression is True, i.e. "TIME >= 3600". The file is parsed in chunks of *chunksize* time steps (65536 by default) and each chunk is filtered before the next one is parsed. For time intervals, *window* is faster since the previous rows are never parsed.
+
+**Returns**
+
+**DataFrame or TPLReader**
+
+One column for time ('TIME') and one column for each catalog variable, named as '<VARIABLE>_<LABEL>', i.e. 'PT_POS-1378M'.
+
+Simulation information and catalog are kept in *df.attrs['info']* and *df.attrs['catalog']*.
         """
-        pass
+        optimizer = MemoryOptimizer.get(kwargs.pop('optimize_memory', False))
+        converter = UnitConverter.get(kwargs.pop('units', None))
+        df = OlgaFormatter.read(filepath=filepath, **kwargs)
+
+        if converter is not None and isinstance(df, pd.DataFrame):
+
+            df = converter.convert(df)
+
+        if optimizer is not None and isinstance(df, pd.DataFrame):
+
+            df = optimizer.optimize(df)
+
+        return df
 
     @Helpers.check_airflow_task_args
     @staticmethod
-    def read_pkl(filepath:str, **kwargs)->pd.DataFrame:
+    def read_pkl(filepath:str, columns:list=None, mmap:bool=False, **kwargs)->pd.DataFrame:
         """
-        Documentation here
+Read a pickled DataFrame, i.e. an intermediate DataFrame checkpointed by [to_pkl](#to_pkl).
+
+Plain pickles and columnar pickles are supported, the format is detected from the first bytes of the file. In a columnar pickle, each column is pickled with protocol 5 and its buffers are stored as separate aligned segments, so a subset of columns is loaded without unpickling the whole DataFrame.
+
+**Parameters**
+
+- **filepath:**  path string.
+
+- **columns:** list, optional
+
+Columns to load. Only the segments of these columns are read from a columnar pickle, a plain pickle is fully loaded before selecting them.
+
+- **mmap:** bool, default False
+
+For columnar pickles, the columns are read-only views of the memory-mapped file instead of copies, pages are loaded when they are used.
+
+- **compression:** str or dict, default 'infer'
+
+For plain pickles, on-the-fly decompression of on-disk data, see *pd.read_pickle*.
+
+**Returns**
+
+**DataFrame**
+
+```python
+from airflow_df.io import IO
+
+IO.to_pkl.function(df, "checkpoint.pkl", columnar=True)
+df = IO.read_pkl.function("checkpoint.pkl", columns=['TIME', 'PT_POS-1378M'], mmap=True)
+```
         """
-        pass
+        return PickleFormatter.read(filepath, columns=columns, mmap=mmap, **kwargs)
 
     @Helpers.check_airflow_task_args
     @staticmethod
-    def read_sql()->pd.DataFrame:
+    def to_pkl(df:pd.DataFrame, filepath:str, columnar:bool=False, **kwargs)->str:
         """
-        Documentation here
+Pickle a DataFrame, i.e. to checkpoint it between DAG runs.
+
+**Parameters**
+
+- **df:** DataFrame
+
+- **filepath:**  path string.
+
+- **columnar:** bool, default False
+
+Write a columnar pickle: each column, and the index, is pickled with protocol 5 and its buffers (out-of-band *PickleBuffer*) are written as 64-byte aligned segments, followed by a manifest with the column labels, segment offsets and *df.attrs*. [read_pkl](#read_pkl) can load a subset of its columns, or memory-map it.
+
+- **compression:** str or dict, default 'infer'
+
+For plain pickles, on-the-fly compression of the output data, see *df.to_pickle*.
+
+**Returns**
+
+**str**
+
+The file path.
+        """
+        return PickleFormatter.write(df, filepath, columnar=columnar, **kwargs)
+
+    @Helpers.check_airflow_task_args
+    @staticmethod
+    def read_sql(sql, conn_id:str=None, url:str=None, params:dict=None, chunksize:int=None, iterator:bool=False, index_col=None, **kwargs)->pd.DataFrame:
+        """
+Read a SQL query or a database table into DataFrame.
+
+Engines are created with SQLAlchemy once by process and their connection pools are reused by the next tasks, keyed by the Airflow connection id (or the URL). Results are streamed through a server-side cursor where the driver supports it and fetched in chunks, each chunk is converted into column arrays before fetching the next one.
+
+**Parameters**
+
+- **sql:** str or SQLAlchemy selectable
+
+Query, i.e. "SELECT * FROM trends WHERE TIME >= :start", or a table name.
+
+- **conn_id:** str, optional
+
+Airflow connection id, the SQLAlchemy URL is taken from its hook.
+
+- **url:** str, optional
+
+SQLAlchemy URL, used when *conn_id* is not provided, i.e. 'sqlite:///trends.db'.
+
+- **params:** dict, optional
+
+Bound parameters of the query, i.e. {'start': 3600}.
+
+- **chunksize:** int, optional
+
+Rows fetched at a time, by default 10000.
+
+- **iterator:** bool, default False
+
+Return a generator of DataFrames with *chunksize* rows, the connection is kept until it is exhausted.
+
+- **index_col:** str or list, optional
+
+Columns to set as index.
+
+- **pool_size, max_overflow, pool_recycle, ...:** optional
+
+Engine options, only used when the engine of a connection is created in the process.
+
+**Returns**
+
+**DataFrame or generator**
+
+```python
+from airflow_df.io import IO
+
+df = IO.read_sql.function("SELECT * FROM trends WHERE TIME >= :start", conn_id='historian', params={'start': 3600})
+```
+        """
+        return SQLFormatter.read(
+            sql, conn_id=conn_id, url=url, params=params, chunksize=chunksize, iterator=iterator, index_col=index_col, **kwargs
+        )
+
+    @Helpers.check_airflow_task_args
+    @staticmethod
+    def to_sql(df:pd.DataFrame, table:str, conn_id:str=None, url:str=None, schema:str=None, if_exists:str='append', method:str='auto', batch_size:int=None, partitions:int=1, upsert:list=None, index:bool=False, **kwargs)->int:
+        """
+Write a DataFrame into a database table in bulk.
+
+The rows are sent by batches through the fastest path of each dialect: a CSV buffer loaded with COPY on PostgreSQL, or one INSERT statement executed by the driver over a batch of rows (executemany), or multi-row VALUES statements. The engine of the connection is shared with [read_sql](#read_sql).
+
+**Parameters**
+
+- **df:** DataFrame
+
+- **table:** str
+
+Table name, it is created from the DataFrame dtypes if it does not exist.
+
+- **conn_id:** str, optional
+
+Airflow connection id, the SQLAlchemy URL is taken from its hook.
+
+- **url:** str, optional
+
+SQLAlchemy URL, used when *conn_id* is not provided, i.e. 'sqlite:///trends.db'.
+
+- **schema:** str, optional
+
+- **if_exists:** {'append', 'replace', 'fail'}, default 'append'
+
+'replace' drops the table and creates it again from the DataFrame dtypes.
+
+- **method:** {'auto', 'executemany', 'values', 'copy'}, default 'auto'
+
+'auto' uses COPY on PostgreSQL with psycopg2 and executemany otherwise. 'values' sends multi-row VALUES statements, split to stay below the bound parameters allowed by the database.
+
+- **batch_size:** int, optional
+
+Rows sent at a time, by default 10000.
+
+- **partitions:** int, default 1
+
+Row partitions written in parallel threads, each one with its own pooled connection and transaction.
+
+- **upsert:** str or list, optional
+
+Key columns. Rows whose keys are already in the table are updated, the others are inserted, all in one transaction (INSERT ... ON CONFLICT on SQLite and PostgreSQL, ON DUPLICATE KEY UPDATE on MySQL). A new table gets a primary key on these columns.
+
+- **index:** bool, default False
+
+Write the index as columns.
+
+**Returns**
+
+**int**
+
+Rows written.
+
+```python
+from airflow_df.io import IO
+
+IO.to_sql.function(df, 'trends', conn_id='historian', upsert=['CASE', 'TIME'])
+```
+        """
+        return SQLFormatter.write(
+            df, table, conn_id=conn_id, url=url, schema=schema, if_exists=if_exists, method=method, batch_size=batch_size,
+            partitions=partitions, upsert=upsert, index=index, **kwargs
+        )
+
+    @Helpers.check_airflow_task_args
+    @staticmethod
+    def read_parquet(path:str, columns:list=None, filters=None)->pd.DataFrame:
+        """
+Read a Parquet file or a partitioned Parquet dataset, i.e. written by [to_parquet](#to_parquet).
+
+Only the partitions and row groups that can match *filters* are read: partitions are pruned by their folder names, i.e. 'CASE=SF_SH_D0_R0', and row groups by the min/max statistics of their columns.
+
+**Parameters**
+
+- **path:**  dataset folder or Parquet file path.
+
+- **columns:** list, optional
+
+Columns to read, partition columns included.
+
+- **filters:** list or pyarrow expression, optional
+
+Rows to keep, as (column, op, value) tuples that must all be True, i.e. [('CASE', '=', 'SF_SH_D0_R0'), ('TIME', '>=', 3600)], or a list of such lists, any of which must be True. Operators are '=', '==', '!=', '<', '>', '<=', '>=', 'in' and 'not in'.
+
+**Returns**
+
+**DataFrame**
+
+Index levels and *df.attrs* of the written DataFrame are set back, index levels only when all of them are read.
+
+```python
+from airflow_df.io import IO
+
+df = IO.read_parquet.function("trends", columns=['TIME', 'PT_POS-1378M'], filters=[('DATE', '>=', '2022-09-02')])
+```
+        """
+        return ParquetFormatter.read(path, columns=columns, filters=filters)
+
+    @Helpers.check_airflow_task_args
+    @staticmethod
+    def to_parquet(df:pd.DataFrame, path:str, partition_cols:list=None, date:str=None, date_format:str='%Y-%m-%d', sort_by=None, row_group_size:int=None, compression:str='snappy', mode:str='append')->str:
+        """
+Write a DataFrame into a partitioned Parquet dataset, so later DAG runs read only the partitions and row groups they need with [read_parquet](#read_parquet) instead of parsing text files again.
+
+**Parameters**
+
+- **df:** DataFrame
+
+- **path:**  dataset folder.
+
+- **partition_cols:** str or list, optional
+
+Columns or index levels to partition by, one subfolder by value, i.e. ['CASE', 'BRANCH'] for 'CASE=SF_SH_D0_R0/BRANCH=FLOWPATH_1'.
+
+- **date:** str, optional
+
+Datetime column or index level, its dates are stored in a 'DATE' column that is the first partition.
+
+- **date_format:** str, default '%Y-%m-%d'
+
+Format of the 'DATE' partition, i.e. '%Y-%m' for monthly partitions.
+
+- **sort_by:** str or list, optional
+
+Sort the rows before writing them, so the row group statistics of these columns do not overlap and filters on them skip more row groups. Time series that are already ordered by time, i.e. tpl trends, do not need it.
+
+- **row_group_size:** int, optional
+
+Rows by row group, by default 131072. Smaller row groups are skipped with more precision, larger ones are compressed better.
+
+- **compression:** str, default 'snappy'
+
+- **mode:** {'append', 'overwrite_partitions', 'overwrite'}, default 'append'
+
+'append' adds new files to the dataset, 'overwrite_partitions' replaces the partitions that are written, i.e. to rerun a DAG for a date, and 'overwrite' replaces the whole dataset.
+
+**Returns**
+
+**str**
+
+The dataset folder.
+
+```python
+from airflow_df.io import IO
+
+df = IO.read_tpl.function("cases/SF_*.tpl")
+IO.to_parquet.function(df, "trends", partition_cols=['CASE'], mode='overwrite_partitions')
+```
         """
-        pass
+        return ParquetFormatter.write(
+            df, path, partition_cols=partition_cols, date=date, date_format=date_format, sort_by=sort_by,
+            row_group_size=row_group_size, compression=compression, mode=mode
+        )
 
     @Helpers.check_airflow_task_args
     @staticmethod
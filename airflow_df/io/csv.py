@@ -1,4 +1,39 @@
+import io
+import os
+import json
+import glob
+import hashlib
+import functools
 import pandas as pd
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# read_csv options that the pyarrow engine does not support
+PYARROW_UNSUPPORTED = {
+    'skipfooter',
+    'float_precision',
+    'chunksize',
+    'comment',
+    'nrows',
+    'thousands',
+    'memory_map',
+    'dialect',
+    'delim_whitespace',
+    'quoting',
+    'lineterminator',
+    'converters',
+    'iterator',
+    'dayfirst',
+    'skipinitialspace',
+    'low_memory',
+    'verbose',
+    'date_parser'
+}
 
 
 class CSVFormatter:
@@ -6,6 +41,9 @@ class CSVFormatter:
     Documentation here
     """
 
+    # Rows parsed at a time by filtered reads
+    chunksize = 1 << 18
+
     @staticmethod
     def read(filepath, **kwargs)->pd.DataFrame:
         r"""
@@ -25,5 +63,560 @@ class CSVFormatter:
 
         - *delimiter:* (str, default None)
         Alias for sep.
-        """        
-        return pd.read_csv(filepath, **kwargs)
\ No newline at end of file
+
+        - *max_workers:* (int, optional)
+        Number of workers used to read several files, by default the executor default.
+
+        - *executor:* ({'thread', 'process'}, default 'thread')
+        Pool used to read several files.
+
+        - *engine:* ({'c', 'python', 'pyarrow'}, optional)
+        By default the fastest engine that supports the given options is used, see [get_engine](#get_engine).
+
+        - *dtype_cache:* (bool or str, default False)
+        Keep the dtypes inferred on the first read of a file family in a JSON file and pass them as *dtype* on later reads,
+        see [DtypeCache](#dtypecache). If it is a string, it is used as the JSON file path.
+
+        - *incremental:* (bool or str, default False)
+        Read only new files and the appended tail of growing files since the last run, see
+        [read_incremental](#read_incremental). If it is a string, it is used as the state file path.
+        """
+        incremental = kwargs.pop('incremental', False)
+        data_interval_start = kwargs.pop('data_interval_start', None)
+
+        if incremental:
+
+            state = incremental if isinstance(incremental, str) else None
+
+            return CSVFormatter.read_incremental(filepath, state=state, data_interval_start=data_interval_start, **kwargs)
+
+        filepaths = CSVFormatter.expand(filepath)
+
+        if filepaths is None:
+
+            return CSVFormatter.read_file(filepath, **kwargs)
+
+        return CSVFormatter.read_many(filepaths, **kwargs)
+
+    @staticmethod
+    def expand(filepath, extension:str='.csv')->list:
+        r"""
+        Lists the files to read from a path.
+
+        - A directory is expanded to its files with *extension*.
+        - A glob pattern is expanded to the matched files.
+        - A path without extension that does not exist is completed with *extension*.
+
+        **Returns**
+
+        - *filepaths:* (list or None) sorted file paths, None if *filepath* is a single file, a URL or a file-like object.
+        """
+        if not isinstance(filepath, (str, os.PathLike)):
+
+            return None
+
+        filepath = os.fspath(filepath)
+
+        if os.path.isdir(filepath):
+
+            return sorted(path for path in glob.glob(os.path.join(filepath, f"*{extension}")) if os.path.isfile(path))
+
+        if glob.has_magic(filepath) and not os.path.exists(filepath):
+
+            return sorted(path for path in glob.glob(filepath) if os.path.isfile(path))
+
+        if not os.path.exists(filepath) and not os.path.splitext(filepath)[1] and os.path.isfile(filepath + extension):
+
+            return [filepath + extension]
+
+        return None
+
+    @staticmethod
+    def read_many(filepaths:list, max_workers:int=None, executor:str='thread', **kwargs)->pd.DataFrame:
+        r"""
+        Read several csv files concurrently and concatenate them at once.
+
+        **Parameters**
+
+        - *filepaths:* (list) file paths.
+        - *max_workers:* (int, optional) number of workers, with 1 the files are read one after the other.
+        - *executor:* ({'thread', 'process'}, default 'thread') thread pool for I/O bound reads, process pool for CPU
+        bound parsing. Keyword arguments must be picklable with 'process'.
+
+        **Returns**
+
+        - *df:* (pd.DataFrame)
+        """
+        if not filepaths:
+
+            raise FileNotFoundError("There are no csv files to read")
+
+        if kwargs.get('chunksize') or kwargs.get('iterator'):
+
+            if len(filepaths) > 1:
+
+                raise ValueError("chunksize and iterator are not supported reading several files")
+
+            return CSVFormatter.read_file(filepaths[0], **kwargs)
+
+        read = functools.partial(CSVFormatter.read_file, **kwargs)
+
+        if max_workers == 1 or len(filepaths) == 1:
+
+            dfs = list(map(read, filepaths))
+
+        else:
+
+            pools = {'thread': ThreadPoolExecutor, 'process': ProcessPoolExecutor}
+
+            if executor not in pools:
+
+                raise ValueError(f"executor must be one of {list(pools)}, got {executor!r}")
+
+            with pools[executor](max_workers=max_workers) as pool:
+
+                dfs = list(pool.map(read, filepaths))
+
+        if len(dfs) == 1:
+
+            return dfs[0]
+
+        # One concat call allocates the result once
+        return pd.concat(dfs, ignore_index=True)
+
+    @staticmethod
+    def read_file(filepath, dtype_cache=False, where:str=None, **kwargs):
+        r"""
+        Read one csv file with the fastest engine and the cached dtypes of its family.
+
+        **Parameters**
+
+        - *filepath:* path or file-like object.
+        - *dtype_cache:* (bool or str, default False) use a [DtypeCache](#dtypecache), only for local files.
+        - *where:* (str, optional) keep only the rows for which this query expression is True, see [read_where](#read_where).
+        - Any other keyword argument is passed to pd.read_csv.
+
+        **Returns**
+
+        - *df:* (pd.DataFrame or TextFileReader)
+        """
+        if where is not None:
+
+            return CSVFormatter.read_where(filepath, where, dtype_cache=dtype_cache, **kwargs)
+
+        cache = key = None
+        auto = 'engine' not in kwargs
+
+        if auto:
+
+            kwargs['engine'] = CSVFormatter.get_engine(**kwargs)
+
+        if dtype_cache and isinstance(filepath, (str, os.PathLike)) and os.path.isfile(filepath):
+
+            cache = DtypeCache(dtype_cache if isinstance(dtype_cache, str) else None)
+            key = cache.key(filepath, **kwargs)
+            dtypes = cache.get(key)
+
+            if dtypes is not None:
+
+                # User dtypes take precedence over the cached ones
+                user = kwargs.get('dtype')
+                kwargs['dtype'] = {**dtypes, **user} if isinstance(user, dict) else user or dtypes
+
+                try:
+
+                    return CSVFormatter.__read_csv(filepath, auto, **kwargs)
+
+                except (ValueError, TypeError):
+
+                    # The family schema changed, i.e. an integer column with missing values
+                    kwargs['dtype'] = user
+
+        df = CSVFormatter.__read_csv(filepath, auto, **kwargs)
+
+        if cache is not None and isinstance(df, pd.DataFrame):
+
+            cache.set(key, df)
+
+        return df
+
+    @staticmethod
+    def read_where(filepath, where:str, chunksize:int=None, **kwargs)->pd.DataFrame:
+        r"""
+        Read a csv file in chunks keeping only the rows for which a query expression is True, so the rows filtered out
+        never accumulate in memory. Row labels are the positions of the rows in the file.
+
+        **Parameters**
+
+        - *filepath:* path or file-like object.
+        - *where:* (str) query expression, see *pd.DataFrame.query*.
+        - *chunksize:* (int, optional) rows parsed at a time, by default *CSVFormatter.chunksize*.
+        - Any other keyword argument is passed to [read_file](#read_file).
+
+        **Returns**
+
+        - *df:* (pd.DataFrame)
+        """
+        kwargs.pop('iterator', None)
+
+        with CSVFormatter.read_file(filepath, chunksize=chunksize or CSVFormatter.chunksize, **kwargs) as reader:
+
+            dfs = [chunk.query(where) for chunk in reader]
+
+        if not dfs:
+
+            return pd.DataFrame()
+
+        return pd.concat(dfs) if len(dfs) > 1 else dfs[0]
+
+    @staticmethod
+    def read_incremental(filepath, state:str=None, data_interval_start=None, **kwargs)->pd.DataFrame:
+        r"""
+        Read only what is new since the last run: new files completely and the appended tail of growing files. Byte
+        offset, rows, modification time and size of each file are kept by run in a [Watermarks](#watermarks) state file.
+
+        Each run starts from the state of the latest previous *data_interval_start*, so re-running an interval reads the
+        same rows again. Only complete lines are read, a line being written is left for the next run. A file that shrinks
+        or whose content before the offset changes is read again from the beginning.
+
+        **Parameters**
+
+        - *filepath:* (str) file, directory or glob pattern.
+        - *state:* (str, optional) state file path, by default one file by *filepath* in '~/.cache/airflow_df/incremental'.
+        - *data_interval_start:* (datetime or str, optional) Airflow interval of the run, by default the current time.
+        - Any other keyword argument is passed to pd.read_csv.
+
+        **Returns**
+
+        - *df:* (pd.DataFrame) new rows of all files.
+        """
+        if kwargs.get('chunksize') or kwargs.get('iterator'):
+
+            raise ValueError("chunksize and iterator are not supported in incremental mode")
+
+        filepaths = CSVFormatter.expand(filepath) or [os.fspath(filepath)]
+        watermarks = Watermarks(state or Watermarks.default_path(filepath))
+        interval = Watermarks.interval(data_interval_start)
+        marks = dict(watermarks.get(interval))
+        dfs = list()
+
+        for path in filepaths:
+
+            key = os.path.abspath(path)
+            df, marks[key] = CSVFormatter.read_tail(path, marks.get(key), **kwargs)
+
+            if df is not None:
+
+                dfs.append(df)
+
+        watermarks.set(interval, marks)
+
+        if not dfs:
+
+            return pd.DataFrame()
+
+        return pd.concat(dfs, ignore_index=True) if len(dfs) > 1 else dfs[0]
+
+    @staticmethod
+    def read_tail(filepath:str, mark:dict=None, **kwargs):
+        r"""
+        Read the complete lines of a csv file after the byte offset of *mark*.
+
+        **Parameters**
+
+        - *filepath:* (str) file path.
+        - *mark:* (dict, optional) watermark of the last read, if it is None the file is read from the beginning.
+
+        **Returns**
+
+        - *(df, mark):* (tuple) new rows (None if there are not) and the new watermark.
+        """
+        stat = os.stat(filepath)
+
+        with open(filepath, 'rb') as file:
+
+            if mark is not None and (stat.st_size < mark['offset'] or Watermarks.tail(file, mark['offset']) != mark['tail']):
+
+                # Rewritten file
+                mark = None
+
+            offset = 0 if mark is None else mark['offset']
+            file.seek(offset)
+            data = file.read(stat.st_size - offset)
+
+        end = data.rfind(b'\n') + 1
+        data = data[:end]
+        rows = 0 if mark is None else mark['rows']
+        df = None
+
+        if data.strip():
+
+            if offset:
+
+                # The header is only at the beginning of the file, all its names are given so that usecols and
+                # index_col select the same columns as on the first read
+                names = CSVFormatter.read_header(filepath, **{key: value for key, value in kwargs.items() if key != 'index_col'})
+                kwargs = {key: value for key, value in kwargs.items() if key not in ('header', 'names', 'skiprows')}
+                kwargs.update(header=None, names=names)
+                # pyarrow would select usecols by its own generated names
+                kwargs.setdefault('engine', 'c')
+
+            df = CSVFormatter.read_file(io.BytesIO(data), **kwargs)
+            rows += len(df)
+
+        offset += end
+
+        with open(filepath, 'rb') as file:
+
+            tail = Watermarks.tail(file, offset)
+
+        mark = {'offset': offset, 'rows': rows, 'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'tail': tail}
+
+        return df, mark
+
+    @staticmethod
+    def read_header(filepath, **kwargs)->list:
+        r"""
+        Read only the column names of a csv file.
+
+        **Returns**
+
+        - *columns:* (list)
+        """
+        options = {
+            key: value for key, value in kwargs.items()
+            if key in ('sep', 'delimiter', 'header', 'names', 'skiprows', 'encoding', 'compression', 'index_col')
+            and not callable(value)
+        }
+
+        return [str(column) for column in pd.read_csv(filepath, nrows=0, **options).columns]
+
+    @staticmethod
+    def get_engine(**kwargs)->str:
+        r"""
+        Choose the fastest engine for the given read_csv options, 'pyarrow' when it is installed and supports all of them,
+        'c' otherwise, or 'python' for regex separators.
+
+        **Returns**
+
+        - *engine:* (str)
+        """
+        sep = kwargs.get('sep', kwargs.get('delimiter', ','))
+
+        if sep is None or (len(sep) > 1 and sep != r'\s+'):
+
+            return 'python'
+
+        if pyarrow is None or sep == r'\s+' or PYARROW_UNSUPPORTED & set(kwargs):
+
+            return 'c'
+
+        if callable(kwargs.get('on_bad_lines')) or not isinstance(kwargs.get('skiprows', 0), int):
+
+            return 'c'
+
+        usecols = kwargs.get('usecols')
+
+        # pyarrow selects usecols by the names in the file, not by the given names
+        if usecols is not None and (callable(usecols) or kwargs.get('header', 'infer') is None or 'names' in kwargs):
+
+            return 'c'
+
+        return 'pyarrow'
+
+    @staticmethod
+    def __read_csv(filepath, auto:bool, **kwargs):
+
+        if not auto or kwargs['engine'] != 'pyarrow':
+
+            return pd.read_csv(filepath, **kwargs)
+
+        try:
+
+            return pd.read_csv(filepath, **kwargs)
+
+        except (ValueError, KeyError, pyarrow.ArrowException):
+
+            # Options that pyarrow can not handle, fall back to the C engine
+            if hasattr(filepath, 'seek'):
+
+                filepath.seek(0)
+
+            kwargs['engine'] = 'c'
+
+            return pd.read_csv(filepath, **kwargs)
+
+
+class DtypeCache:
+    r"""
+    On-disk cache of the dtypes inferred for a csv file family, so later reads skip type inference and the mixed-type
+    passes of *low_memory*.
+
+    A family is identified by its header (column names) and delimiter. Dtypes are kept in a JSON file, by default
+    '~/.cache/airflow_df/csv_dtypes.json'. Datetime columns are not cached, use *parse_dates* for them.
+    """
+
+    def __init__(self, path:str=None):
+
+        if path is None:
+
+            path = os.path.join(os.path.expanduser('~'), '.cache', 'airflow_df', 'csv_dtypes.json')
+
+        self.path = path
+
+    def key(self, filepath, **kwargs)->str:
+        r"""
+        Identifies the family of a csv file by reading only its header.
+
+        **Returns**
+
+        - *key:* (str)
+        """
+        columns = CSVFormatter.read_header(filepath, **kwargs)
+        family = json.dumps([columns, kwargs.get('sep', kwargs.get('delimiter', ','))])
+
+        return hashlib.sha1(family.encode()).hexdigest()
+
+    def get(self, key:str)->dict:
+        r"""
+        **Returns**
+
+        - *dtypes:* (dict or None) dtype name by column, None if the family is unknown.
+        """
+        return self.load().get(key)
+
+    def set(self, key:str, df:pd.DataFrame):
+        r"""
+        Stores the dtypes of a DataFrame for a family.
+        """
+        dtypes = {
+            str(column): str(dtype) for column, dtype in df.dtypes.items()
+            if not pd.api.types.is_datetime64_any_dtype(dtype) and not pd.api.types.is_timedelta64_dtype(dtype)
+        }
+        cache = self.load()
+
+        if cache.get(key) == dtypes:
+
+            return
+
+        cache[key] = dtypes
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+
+        with open(tmp, 'w') as file:
+
+            json.dump(cache, file)
+
+        os.replace(tmp, self.path)
+
+    def load(self)->dict:
+        r"""
+        **Returns**
+
+        - *cache:* (dict) dtypes by family.
+        """
+        try:
+
+            with open(self.path, 'r') as file:
+
+                return json.load(file)
+
+        except (FileNotFoundError, ValueError):
+
+            return dict()
+
+
+class Watermarks:
+    r"""
+    JSON state store of the incremental csv reads. For each run, identified by its *data_interval_start*, it keeps the
+    watermark of each file: byte offset, rows, modification time, size and a hash of the bytes before the offset. Only
+    the last *keep* runs are kept.
+    """
+
+    keep = 48
+    tail_size = 64
+
+    def __init__(self, path:str):
+
+        self.path = path
+
+    @staticmethod
+    def default_path(filepath)->str:
+        r"""
+        State file path by source path.
+        """
+        key = hashlib.sha1(os.path.abspath(os.fspath(filepath)).encode()).hexdigest()
+
+        return os.path.join(os.path.expanduser('~'), '.cache', 'airflow_df', 'incremental', f"{key}.json")
+
+    @staticmethod
+    def interval(data_interval_start=None)->str:
+        r"""
+        Normalizes a run interval to an UTC ISO string, by default the current time.
+        """
+        if data_interval_start is None:
+
+            data_interval_start = datetime.now(timezone.utc)
+
+        timestamp = pd.Timestamp(data_interval_start)
+
+        if timestamp.tzinfo is None:
+
+            timestamp = timestamp.tz_localize('UTC')
+
+        return timestamp.tz_convert('UTC').isoformat()
+
+    @staticmethod
+    def tail(file, offset:int)->str:
+        r"""
+        Hash of the bytes before *offset*, used to detect rewritten files.
+        """
+        start = max(offset - Watermarks.tail_size, 0)
+        file.seek(start)
+
+        return hashlib.sha1(file.read(offset - start)).hexdigest()
+
+    def load(self)->dict:
+        r"""
+        **Returns**
+
+        - *runs:* (dict) watermarks by file, by run interval.
+        """
+        try:
+
+            with open(self.path, 'r') as file:
+
+                return json.load(file)
+
+        except (FileNotFoundError, ValueError):
+
+            return dict()
+
+    def get(self, interval:str)->dict:
+        r"""
+        Watermarks of the latest run before *interval*.
+
+        **Returns**
+
+        - *marks:* (dict) watermark by file path.
+        """
+        runs = self.load()
+        previous = [key for key in runs if key < interval]
+
+        return runs[max(previous)] if previous else dict()
+
+    def set(self, interval:str, marks:dict):
+        r"""
+        Stores the watermarks of a run.
+        """
+        runs = self.load()
+        runs[interval] = marks
+        runs = {key: runs[key] for key in sorted(runs)[-self.keep:]}
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+
+        with open(tmp, 'w') as file:
+
+            json.dump(runs, file)
+
+        os.replace(tmp, self.path)
@@ -0,0 +1,397 @@
+import os
+import re
+import csv
+import glob
+import pandas as pd
+from .csv import CSVFormatter
+from .olga import OlgaFormatter, Genkey
+from .olga.units import UnitConverter
+from .pkl import PickleFormatter, MAGIC as PICKLE_MAGIC
+from .parquet import ParquetFormatter
+
+# Bytes read from the beginning of a file to detect its format
+HEAD_SIZE = 1 << 14
+# 'OLGA 2017.2.0.107' header line followed by 'TIME PLOT'
+TPL_HEADER = re.compile(rb"\A\s*'OLGA [^'\r\n]*'[ \t]*\r?\n\s*TIME PLOT")
+# '!****' banner or the first keywords of an input deck
+GENKEY_HEADER = re.compile(rb"\A\s*(?:!\*{3}|(?:OPTIONS|CASE|FILES|INTEGRATION)\s)")
+# Hive partition folder, i.e. 'CASE=SF_SH_D0_R0'
+PARTITION = re.compile(r"^[^=]+=.*$")
+
+
+class Formatter:
+    r"""
+    Base class of the formatters of [IO.read](#read).
+
+    A formatter is registered by subclassing it with a *name*. Formats are detected from the first bytes of a file
+    (*sniff*), so files with any extension, or none, are routed without parsing them; the file extension is only used for
+    the files whose content is not recognized by any formatter. Formatters are tried by *priority*, binary magic numbers
+    first and CSV last.
+
+    Subclasses must define *name*, *sniff* and *read*, and may define *read_many* to read several files at once.
+
+    ```python
+    from airflow_df.io.formats import Formatter
+
+    class JSONLines(Formatter):
+
+        name = 'jsonl'
+        extensions = ('.jsonl',)
+
+        @classmethod
+        def sniff(cls, head:bytes)->bool:
+
+            return head.lstrip().startswith(b'{')
+
+        @classmethod
+        def read(cls, filepath, **kwargs):
+
+            return pd.read_json(filepath, lines=True, **kwargs)
+    ```
+    """
+
+    name = None
+    extensions = tuple()
+    priority = 50
+    formatters = dict()
+
+    def __init_subclass__(cls, **kwargs):
+
+        super().__init_subclass__(**kwargs)
+
+        if cls.name:
+
+            Formatter.formatters[cls.name] = cls
+
+    @classmethod
+    def sniff(cls, head:bytes)->bool:
+        r"""
+        True if the first bytes of a file are of this format.
+        """
+        return False
+
+    @classmethod
+    def read(cls, filepath, **kwargs):
+        r"""
+        Read a file.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def read_many(cls, filepaths:list, **kwargs):
+        r"""
+        Read several files of this format, by default a dict of results by file path.
+        """
+        return {filepath: cls.read(filepath, **kwargs) for filepath in filepaths}
+
+    @classmethod
+    def get(cls, name:str):
+        r"""
+        Registered formatter by name, i.e. 'csv' or 'tpl'.
+        """
+        if name not in cls.formatters:
+
+            raise ValueError(f"Unknown format {name!r}, available formats are {list(cls.formatters)}")
+
+        return cls.formatters[name]
+
+    @classmethod
+    def head(cls, filepath)->bytes:
+        r"""
+        First bytes of a file.
+        """
+        with open(filepath, 'rb') as file:
+
+            return file.read(HEAD_SIZE)
+
+    @classmethod
+    def detect(cls, filepath):
+        r"""
+        Formatter of a file, or of a Parquet dataset folder.
+
+        **Returns**
+
+        - **formatter:** (Formatter subclass)
+        """
+        if os.path.isdir(filepath):
+
+            if ParquetFormat.is_dataset(filepath):
+
+                return ParquetFormat
+
+            raise ValueError(f"{filepath} is not a Parquet dataset, list its files to read them")
+
+        head = cls.head(filepath)
+
+        for formatter in sorted(cls.formatters.values(), key=lambda formatter: formatter.priority):
+
+            if formatter.sniff(head):
+
+                return formatter
+
+        extension = os.path.splitext(filepath)[1].lower()
+
+        for formatter in cls.formatters.values():
+
+            if extension and extension in formatter.extensions:
+
+                return formatter
+
+        raise ValueError(f"The format of {filepath} is unknown, available formats are {list(cls.formatters)}")
+
+    @classmethod
+    def expand(cls, filepath)->list:
+        r"""
+        Files to read from a path.
+
+        - A directory is expanded to its files, unless it is a Parquet dataset.
+        - A glob pattern is expanded to the matched files.
+        - A path without extension that does not exist is completed with the extension of a registered format, i.e.
+        'Employee Sample Data' is 'Employee Sample Data.csv'.
+
+        **Returns**
+
+        - **filepaths:** (list or None) sorted file paths, None if *filepath* is a single file or a Parquet dataset.
+        """
+        filepath = os.fspath(filepath)
+
+        if os.path.isdir(filepath):
+
+            if ParquetFormat.is_dataset(filepath):
+
+                return None
+
+            return sorted(path for path in glob.glob(os.path.join(filepath, '*')) if os.path.isfile(path))
+
+        if glob.has_magic(filepath) and not os.path.exists(filepath):
+
+            return sorted(path for path in glob.glob(filepath) if os.path.isfile(path))
+
+        if not os.path.exists(filepath) and not os.path.splitext(filepath)[1]:
+
+            for formatter in sorted(cls.formatters.values(), key=lambda formatter: formatter.priority):
+
+                for extension in formatter.extensions:
+
+                    if os.path.isfile(filepath + extension):
+
+                        return [filepath + extension]
+
+        return None
+
+
+class ParquetFormat(Formatter):
+    r"""
+    Parquet files and partitioned datasets, see [read_parquet](#read_parquet).
+    """
+
+    name = 'parquet'
+    extensions = ('.parquet', '.pq')
+    priority = 10
+
+    @classmethod
+    def sniff(cls, head:bytes)->bool:
+
+        return head[:4] == b'PAR1'
+
+    @classmethod
+    def read(cls, filepath, **kwargs):
+
+        return ParquetFormatter.read(filepath, **kwargs)
+
+    @classmethod
+    def read_many(cls, filepaths:list, **kwargs):
+
+        return ParquetFormatter.read(filepaths, **kwargs)
+
+    @staticmethod
+    def is_dataset(path:str)->bool:
+        r"""
+        True if a folder has hive partition folders or Parquet files, and nothing else.
+        """
+        entries = [entry for entry in os.scandir(path) if not entry.name.startswith(('.', '_'))]
+
+        if not entries:
+
+            return False
+
+        for entry in entries:
+
+            if entry.is_dir():
+
+                if not PARTITION.match(entry.name):
+
+                    return False
+
+            elif Formatter.head(entry.path)[:4] != b'PAR1':
+
+                return False
+
+        return True
+
+
+class FeatherFormat(Formatter):
+    r"""
+    Feather (Arrow IPC) files.
+    """
+
+    name = 'feather'
+    extensions = ('.feather', '.arrow')
+    priority = 10
+
+    @classmethod
+    def sniff(cls, head:bytes)->bool:
+
+        return head[:6] == b'ARROW1' or head[:4] == b'FEA1'
+
+    @classmethod
+    def read(cls, filepath, **kwargs):
+
+        return pd.read_feather(filepath, **kwargs)
+
+
+class PickleFormat(Formatter):
+    r"""
+    Plain and columnar pickles, see [read_pkl](#read_pkl).
+    """
+
+    name = 'pkl'
+    extensions = ('.pkl', '.pickle')
+    priority = 10
+
+    @classmethod
+    def sniff(cls, head:bytes)->bool:
+
+        # PROTO opcode of protocols 2 to 5
+        return head[:len(PICKLE_MAGIC)] == PICKLE_MAGIC or (len(head) > 1 and head[0] == 0x80 and 2 <= head[1] <= 5)
+
+    @classmethod
+    def read(cls, filepath, **kwargs):
+
+        return PickleFormatter.read(filepath, **kwargs)
+
+
+class TPLFormat(Formatter):
+    r"""
+    OLGA trend files, recognized by their 'OLGA x.y' header line followed by 'TIME PLOT', see [read_tpl](#read_tpl).
+    """
+
+    name = 'tpl'
+    extensions = ('.tpl',)
+    priority = 20
+
+    @classmethod
+    def sniff(cls, head:bytes)->bool:
+
+        return TPL_HEADER.match(head) is not None
+
+    @classmethod
+    def read(cls, filepath, **kwargs):
+
+        converter = UnitConverter.get(kwargs.pop('units', None))
+        df = OlgaFormatter.read(filepath, **kwargs)
+
+        if converter is not None and isinstance(df, pd.DataFrame):
+
+            df = converter.convert(df)
+
+        return df
+
+    @classmethod
+    def read_many(cls, filepaths:list, **kwargs):
+
+        return cls.read(list(filepaths), **kwargs)
+
+
+class GenkeyFormat(Formatter):
+    r"""
+    OLGA input decks, recognized by their '!****' banner or their first keywords, see [Genkey](#genkey).
+    """
+
+    name = 'genkey'
+    extensions = ('.genkey', '.key', '.inp')
+    priority = 30
+
+    @classmethod
+    def sniff(cls, head:bytes)->bool:
+
+        return GENKEY_HEADER.match(head) is not None
+
+    @classmethod
+    def read(cls, filepath, units=None, **kwargs):
+
+        genkey = Genkey().read(filepath)
+        converter = UnitConverter.get(units)
+
+        return converter.convert_genkey(genkey) if converter is not None else genkey
+
+
+class CSVFormat(Formatter):
+    r"""
+    Delimited text files, the delimiter is detected from the first lines with *csv.Sniffer*, see [read_csv](#read_csv).
+    """
+
+    name = 'csv'
+    extensions = ('.csv', '.txt', '.tsv')
+    priority = 90
+    delimiters = ',;\t|'
+
+    @classmethod
+    def sniff(cls, head:bytes)->bool:
+
+        return cls.dialect(head) is not None
+
+    @classmethod
+    def dialect(cls, head:bytes):
+        r"""
+        Dialect of the complete lines of a text head, None if it is binary or not delimited.
+        """
+        if not head or b'\0' in head:
+
+            return None
+
+        lines = head.decode('utf-8', errors='replace').splitlines()
+
+        if len(head) == HEAD_SIZE and len(lines) > 1:
+
+            # The last line may be cut
+            lines = lines[:-1]
+
+        if len(lines) < 2:
+
+            return None
+
+        try:
+
+            return csv.Sniffer().sniff('\n'.join(lines), delimiters=cls.delimiters)
+
+        except csv.Error:
+
+            return None
+
+    @classmethod
+    def read(cls, filepath, **kwargs):
+
+        return CSVFormatter.read(filepath, **cls.options(filepath, kwargs))
+
+    @classmethod
+    def read_many(cls, filepaths:list, **kwargs):
+
+        return CSVFormatter.read_many(filepaths, **cls.options(filepaths[0], kwargs))
+
+    @classmethod
+    def options(cls, filepath, kwargs:dict)->dict:
+        r"""
+        Read options with the sniffed delimiter, unless one is given.
+        """
+        if 'sep' in kwargs or 'delimiter' in kwargs:
+
+            return kwargs
+
+        dialect = cls.dialect(cls.head(filepath))
+
+        if dialect is None:
+
+            return kwargs
+
+        return {'sep': dialect.delimiter, **kwargs}
@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+
+
+class MemoryOptimizer:
+    r"""
+    Shrinks the columns of a DataFrame:
+
+    - float64 columns become float32 when no value changes more than *tolerance* (relative).
+    - Integer columns take the smallest signed type that holds their values, so subtractions do not wrap around.
+    - String columns with few distinct values become categoricals.
+
+    The memory before and after and the bytes saved are kept in *df.attrs['memory']*.
+
+    ```python
+    from airflow_df.io.memory import MemoryOptimizer
+
+    df = MemoryOptimizer(tolerance=1e-6).optimize(df)
+    df.attrs['memory']
+    ```
+    """
+
+    def __init__(self, tolerance:float=1e-6, categories:float=0.5):
+
+        self.tolerance = tolerance
+        self.categories = categories
+
+    @classmethod
+    def get(cls, spec):
+        r"""
+        Get an optimizer from the *optimize_memory* reader argument.
+
+        **Parameters**
+
+        - **spec:** (bool, dict or MemoryOptimizer) True for the default options, a dict of options, i.e.
+        {'tolerance': 1e-4}, or False.
+
+        **Returns**
+
+        - **optimizer:** (MemoryOptimizer or None)
+        """
+        if not spec:
+
+            return None
+
+        if isinstance(spec, MemoryOptimizer):
+
+            return spec
+
+        return cls(**spec) if isinstance(spec, dict) else cls()
+
+    def optimize(self, df:pd.DataFrame)->pd.DataFrame:
+        r"""
+        Shrink the columns of a DataFrame.
+
+        **Returns**
+
+        - **df:** (pd.DataFrame) a new DataFrame, the memory report is in *df.attrs['memory']*.
+        """
+        before = int(df.memory_usage(deep=True).sum())
+        result = df.copy(deep=False)
+
+        for position in range(df.shape[1]):
+
+            values = df.iloc[:, position]
+            shrunk = self.shrink(values)
+
+            if shrunk is not values:
+
+                result.isetitem(position, shrunk)
+
+        after = int(result.memory_usage(deep=True).sum())
+        result.attrs = {**df.attrs, 'memory': {'before': before, 'after': after, 'saved': before - after}}
+
+        return result
+
+    def shrink(self, values:pd.Series)->pd.Series:
+        r"""
+        Smaller version of a column, or the same column if it can not be shrunk.
+        """
+        dtype = values.dtype
+
+        if dtype == np.float64:
+
+            floats = values.to_numpy()
+
+            with np.errstate(over='ignore', invalid='ignore'):
+
+                shrunk = floats.astype(np.float32)
+                error = np.abs(shrunk.astype(np.float64) - floats)
+                fits = np.all((error <= self.tolerance * np.abs(floats)) | (np.isnan(floats) & np.isnan(shrunk)))
+
+            if fits:
+
+                return pd.Series(shrunk, index=values.index, name=values.name)
+
+        elif isinstance(dtype, np.dtype) and dtype.kind in 'iu' and len(values):
+
+            shrunk = pd.to_numeric(values, downcast='integer')
+
+            if shrunk.dtype.itemsize < dtype.itemsize:
+
+                return shrunk
+
+        elif (dtype == object or pd.api.types.is_string_dtype(dtype)) and len(values):
+
+            if values.nunique(dropna=True) <= self.categories * len(values) and self.is_strings(values):
+
+                return values.astype('category')
+
+        return values
+
+    @staticmethod
+    def is_strings(values:pd.Series)->bool:
+        r"""
+        True if all the values of a column are strings or missing values.
+        """
+        if pd.api.types.is_string_dtype(values.dtype) and values.dtype != object:
+
+            return True
+
+        return pd.api.types.infer_dtype(values, skipna=True) == 'string'
@@ -1,3 +1,4 @@
 from .genkey import Genkey
-from .tpl import TPL
+from .tpl import TPL, TPLReader, TPLMap
+from .units import UnitConverter
 from .olga import OlgaFormatter
\ No newline at end of file
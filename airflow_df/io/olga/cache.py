@@ -0,0 +1,331 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import contextlib
+import pandas as pd
+from .tpl import TPL
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class TPLCache:
+    r"""
+    Parquet cache for parsed tpl files.
+
+    The time series is stored as a Parquet file and info, catalog and profile as JSON, in a folder named by the file
+    content hash. The path, modification time and size of each file are kept in an index, so the content hash is only
+    computed again when the file changes. The least recently used entries are removed when the cache is bigger than
+    *max_size* bytes. The index is updated under a file lock, so processes that share the cache, i.e. the process pool of
+    *read_cases*, do not lose each other's entries.
+
+    Parquet files are written with pandas, so *pyarrow* must be installed.
+
+    ```python
+    from airflow_df.io.olga.cache import TPLCache
+
+    cache = TPLCache("/tmp/airflow_df/tpl", max_size=2**30)
+    df = cache.read("data/olga/SF_SH_D0_R0.tpl")
+    ```
+    """
+
+    index_file = 'index.json'
+    lock_file = 'index.lock'
+    data_file = 'data.parquet'
+    meta_file = 'meta.json'
+
+    def __init__(self, path:str=None, max_size:int=2**32):
+
+        if path is None:
+
+            path = os.path.join(os.path.expanduser('~'), '.cache', 'airflow_df', 'tpl')
+
+        self.path = path
+        self.max_size = max_size
+        os.makedirs(self.path, exist_ok=True)
+
+    def read(self, filepath:str, tpl:TPL=None, usecols=None)->pd.DataFrame:
+        r"""
+        Read a tpl file from the cache, the file is parsed and stored on a miss.
+
+        **Parameters**
+
+        - **filepath:** (str) tpl file path.
+        - **tpl:** (TPL, optional) parser whose info, profile and catalog are set.
+        - **usecols:** (optional) catalog variables to keep, the whole file is cached anyway.
+
+        **Returns**
+
+        - **df:** (pd.DataFrame)
+        """
+        tpl = tpl or TPL()
+        fingerprint = self.fingerprint(filepath)
+        key = fingerprint['hash']
+        df = self.get(key, tpl=tpl)
+        stored = df is None
+
+        if stored:
+
+            df = tpl.read(filepath)
+            self.put(key, tpl, df)
+
+        with self.lock():
+
+            # Loaded again under the lock, other processes may have changed it while parsing
+            index = self.get_index()
+
+            if stored:
+
+                index['entries'].pop(key, None)
+
+            index['files'][fingerprint['path']] = fingerprint
+            index['entries'].setdefault(key, {'size': self.__entry_size(key)})['used'] = time.time()
+            self.evict(index)
+
+        if usecols is not None:
+
+            df = df.iloc[:, tpl.columns.project(usecols)]
+            df.attrs['catalog'] = tpl.columns.serialize()
+
+        return df
+
+    def fingerprint(self, filepath:str, index:dict=None)->dict:
+        r"""
+        Identifies the content of a file by its path, modification time, size and content hash. The hash is taken from the
+        index while path, modification time and size do not change.
+
+        **Parameters**
+
+        - **filepath:** (str) file path.
+        - **index:** (dict, optional) cache index.
+
+        **Returns**
+
+        - **fingerprint:** (dict) with keys *path*, *mtime*, *size* and *hash*.
+        """
+        stat = os.stat(filepath)
+        fingerprint = {
+            'path': os.path.abspath(filepath),
+            'mtime': stat.st_mtime_ns,
+            'size': stat.st_size
+        }
+        known = (index or self.get_index())['files'].get(fingerprint['path'], dict())
+
+        if known.get('mtime') == fingerprint['mtime'] and known.get('size') == fingerprint['size']:
+
+            fingerprint['hash'] = known['hash']
+
+        else:
+
+            fingerprint['hash'] = self.hash(filepath)
+
+        return fingerprint
+
+    @staticmethod
+    def hash(filepath:str, blocksize:int=1 << 20)->str:
+        r"""
+        SHA-1 of the file content, read in blocks.
+        """
+        sha = hashlib.sha1()
+
+        with open(filepath, 'rb') as file:
+
+            for block in iter(lambda: file.read(blocksize), b''):
+
+                sha.update(block)
+
+        return sha.hexdigest()
+
+    def get(self, key:str, tpl:TPL=None)->pd.DataFrame:
+        r"""
+        Load a cache entry.
+
+        **Parameters**
+
+        - **key:** (str) content hash.
+        - **tpl:** (TPL, optional) parser whose info, profile and catalog are set.
+
+        **Returns**
+
+        - **df:** (pd.DataFrame or None) None if the entry does not exist.
+        """
+        folder = os.path.join(self.path, key)
+
+        try:
+
+            with open(os.path.join(folder, self.meta_file), 'r') as file:
+
+                meta = json.load(file)
+
+            df = pd.read_parquet(os.path.join(folder, self.data_file))
+
+        except (FileNotFoundError, ValueError, OSError):
+
+            # A partial or corrupt entry is removed, so it is stored again
+            shutil.rmtree(folder, ignore_errors=True)
+
+            return None
+
+        if tpl is not None:
+
+            for attr, value in meta['info'].items():
+
+                setattr(tpl.info, attr, value)
+
+            tpl.columns.catalog = meta['catalog']
+            tpl.columns.columns = list(meta['catalog'])
+            tpl.columns.time_unit = meta['time_unit']
+            tpl.profile.x, tpl.profile.y = meta['profile']
+
+        df.attrs['info'] = meta['info']
+        df.attrs['catalog'] = meta['catalog']
+
+        return df
+
+    def put(self, key:str, tpl:TPL, df:pd.DataFrame):
+        r"""
+        Store a parsed tpl file, the entry is written in a temporary folder and then renamed, so readers never see a
+        partial entry.
+
+        **Parameters**
+
+        - **key:** (str) content hash.
+        - **tpl:** (TPL) parser with info, profile and catalog set.
+        - **df:** (pd.DataFrame) parsed time series.
+        """
+        folder = os.path.join(self.path, key)
+        tmp = f"{folder}.{os.getpid()}.tmp"
+        os.makedirs(tmp, exist_ok=True)
+        meta = {
+            'info': tpl.info.serialize(),
+            'catalog': tpl.columns.serialize(),
+            'time_unit': tpl.columns.time_unit,
+            'profile': [tpl.profile.x.tolist(), tpl.profile.y.tolist()]
+        }
+
+        with open(os.path.join(tmp, self.meta_file), 'w') as file:
+
+            json.dump(meta, file)
+
+        df.to_parquet(os.path.join(tmp, self.data_file), index=False)
+
+        try:
+
+            os.replace(tmp, folder)
+
+        except OSError:
+
+            if self.get(key) is None:
+
+                # The existing folder was not a valid entry, it has been removed
+                os.replace(tmp, folder)
+
+            else:
+
+                # Already stored by another process
+                shutil.rmtree(tmp, ignore_errors=True)
+
+    def evict(self, index:dict):
+        r"""
+        Removes the least recently used entries until the cache size is lower than *max_size* and saves the index. Entry
+        folders missing from the index are counted too, as the least recently used ones.
+
+        **Parameters**
+
+        - **index:** (dict) cache index.
+        """
+        entries = index['entries']
+
+        for entry in os.scandir(self.path):
+
+            if entry.is_dir() and not entry.name.endswith('.tmp') and entry.name not in entries:
+
+                entries[entry.name] = {'size': self.__entry_size(entry.name), 'used': 0}
+
+        total = sum(entry['size'] for entry in entries.values())
+
+        for key in sorted(entries, key=lambda key: entries[key]['used']):
+
+            if total <= self.max_size:
+
+                break
+
+            total -= entries.pop(key)['size']
+            shutil.rmtree(os.path.join(self.path, key), ignore_errors=True)
+            index['files'] = {path: fingerprint for path, fingerprint in index['files'].items() if fingerprint['hash'] != key}
+
+        self.set_index(index)
+
+    @contextlib.contextmanager
+    def lock(self):
+        r"""
+        Exclusive lock of the cache index across processes, it is not taken where *fcntl* is not available.
+        """
+        if fcntl is None:
+
+            yield
+            return
+
+        with open(os.path.join(self.path, self.lock_file), 'w') as file:
+
+            fcntl.flock(file, fcntl.LOCK_EX)
+
+            try:
+
+                yield
+
+            finally:
+
+                fcntl.flock(file, fcntl.LOCK_UN)
+
+    def get_index(self)->dict:
+        r"""
+        Loads the cache index.
+
+        **Returns**
+
+        - **index:** (dict) with keys *files* (fingerprint by path) and *entries* (size and last use by key).
+        """
+        try:
+
+            with open(os.path.join(self.path, self.index_file), 'r') as file:
+
+                return json.load(file)
+
+        except (FileNotFoundError, ValueError):
+
+            return {'files': dict(), 'entries': dict()}
+
+    def set_index(self, index:dict):
+        r"""
+        Saves the cache index.
+
+        **Parameters**
+
+        - **index:** (dict) cache index.
+        """
+        filepath = os.path.join(self.path, self.index_file)
+        tmp = f"{filepath}.{os.getpid()}.tmp"
+
+        with open(tmp, 'w') as file:
+
+            json.dump(index, file)
+
+        os.replace(tmp, filepath)
+
+    def clear(self):
+        r"""
+        Removes all entries.
+        """
+        shutil.rmtree(self.path, ignore_errors=True)
+        os.makedirs(self.path, exist_ok=True)
+
+    def __entry_size(self, key:str)->int:
+
+        folder = os.path.join(self.path, key)
+
+        return sum(os.path.getsize(os.path.join(folder, name)) for name in os.listdir(folder))
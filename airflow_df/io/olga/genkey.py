@@ -1,8 +1,280 @@
+import re
+
+# KEY=VALUE items of a keyword line, a value is a quoted string, a tuple with an optional unit or plain text
+PARAMETER = re.compile(r'\s*([\w@\-]+)\s*=\s*("[^"]*"|\([^)]*\)[^,]*|[^,]*?)\s*(?:,|$)')
+# Items of a tuple
+ITEM = re.compile(r'\s*("[^"]*"|[^,]*?)\s*(?:,|$)')
+NUMBER = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?$')
+COMPONENT = 'NETWORKCOMPONENT'
+END_COMPONENT = 'ENDNETWORKCOMPONENT'
+END_CASE = 'ENDCASE'
+
+
 class Genkey(dict):
     r"""
-    Documentation here
+    OLGA input deck (.genkey) parser.
+
+    The deck is read once into records, one by keyword line, and indexed:
+
+    - *genkey[keyword]* is the list of records of a keyword, i.e. all 'PIPE' sections.
+    - *genkey.index[keyword][label]* is the record of a keyword with a LABEL (or TAG for network components), i.e. the
+    'CENTPUMPCURVE' labeled 'C-2'.
+
+    Each record is a dict with *keyword*, *label*, *component* (TAG of the network component that contains it) and
+    *parameters*. Parameter values are numbers, strings or lists, a value with unit is a dict with *value* and *unit*,
+    i.e. 'THICKNESS=(1, 1.5875, 1) cm' is {'value': [1, 1.5875, 1], 'unit': 'cm'}.
+
+    ```python
+    from airflow_df.io.olga import Genkey
+
+    genkey = Genkey().read("data/olga/SF_SH_D0_R0.genkey")
+    pipes = genkey['PIPE']
+    curve = genkey.find('CENTPUMPCURVE', 'C-2')
+    curve['parameters']['HEAD']
+    ```
     """
 
     def __init__(self, **kwargs):
-        
-        pass
\ No newline at end of file
+
+        super().__init__(**kwargs)
+        self.records = list()
+        self.index = dict()
+
+    def read(self, filepath:str)->'Genkey':
+        r"""
+        Parse a genkey file.
+
+        **Parameters**
+
+        - **filepath:** (str) genkey file path.
+
+        **Returns**
+
+        - **genkey:** (Genkey) itself, with its records and index set.
+        """
+        with open(filepath, 'r', encoding='utf-8', errors='replace') as file:
+
+            return self.parse(file.read())
+
+    def parse(self, text:str)->'Genkey':
+        r"""
+        Parse the content of a genkey file.
+
+        **Parameters**
+
+        - **text:** (str) genkey content.
+
+        **Returns**
+
+        - **genkey:** (Genkey) itself, with its records and index set.
+        """
+        component = None
+
+        for number, line in self.lines(text):
+
+            keyword, _, rest = line.partition(' ')
+
+            if keyword == END_CASE:
+
+                break
+
+            if keyword == END_COMPONENT:
+
+                component = None
+                continue
+
+            parameters = self.parse_parameters(rest)
+
+            if keyword == COMPONENT:
+
+                component = parameters.get('TAG')
+
+            self.add({
+                'keyword': keyword,
+                'label': parameters.get('LABEL', parameters.get('TAG')),
+                'component': component,
+                'line': number,
+                'parameters': parameters
+            })
+
+        return self
+
+    def add(self, record:dict):
+        r"""
+        Append a record and index it by keyword and label.
+        """
+        self.records.append(record)
+        self.setdefault(record['keyword'], list()).append(record)
+
+        if record['label'] is not None:
+
+            self.index.setdefault(record['keyword'], dict())[record['label']] = record
+
+    def find(self, keyword:str, label:str=None, component:str=None):
+        r"""
+        Look up records in the index.
+
+        **Parameters**
+
+        - **keyword:** (str) i.e. 'PIPE' or 'CENTPUMPCURVE'.
+        - **label:** (str, optional) record LABEL, i.e. 'C-2'.
+        - **component:** (str, optional) TAG of the network component, i.e. 'FLOWPATH_1'.
+
+        **Returns**
+
+        - **record:** (dict or list) the record with *label* (None if it does not exist), otherwise the records of the
+        keyword in *component*, or all of them.
+        """
+        if label is not None:
+
+            return self.index.get(keyword, dict()).get(label)
+
+        records = self.get(keyword, list())
+
+        if component is not None:
+
+            records = [record for record in records if record['component'] == component]
+
+        return records
+
+    def serialize(self)->list:
+        r"""
+        Serializes the records in file order.
+
+        **Returns**
+
+        - **records:** (list) list of dicts
+        """
+        return [dict(record) for record in self.records]
+
+    @staticmethod
+    def lines(text:str):
+        r"""
+        Logical lines of a genkey content, without comments and with the continued lines ('\') joined.
+
+        **Returns**
+
+        - **lines:** (generator) (number, line) tuples, *number* is the first physical line (1-based).
+        """
+        parts = list()
+        start = None
+
+        for number, line in enumerate(text.splitlines(), start=1):
+
+            line = Genkey.strip_comment(line).strip()
+
+            if not line and not parts:
+
+                continue
+
+            if start is None:
+
+                start = number
+
+            if line.endswith('\\'):
+
+                parts.append(line[:-1].strip())
+                continue
+
+            parts.append(line)
+            line = ' '.join(part for part in parts if part)
+            parts = list()
+
+            if line:
+
+                yield start, line
+
+            start = None
+
+        if parts:
+
+            yield start, ' '.join(part for part in parts if part)
+
+    @staticmethod
+    def strip_comment(line:str)->str:
+        r"""
+        Removes a '!' comment, '!' inside quoted strings is kept.
+        """
+        position = line.find('!')
+
+        while position >= 0:
+
+            if line.count('"', 0, position) % 2 == 0:
+
+                return line[:position]
+
+            position = line.find('!', position + 1)
+
+        return line
+
+    @staticmethod
+    def parse_parameters(text:str)->dict:
+        r"""
+        Parses the KEY=VALUE items of a keyword line.
+        """
+        parameters = dict()
+
+        for match in PARAMETER.finditer(text):
+
+            key, value = match.groups()
+
+            if key:
+
+                parameters[key.upper()] = Genkey.parse_value(value)
+
+        return parameters
+
+    @staticmethod
+    def parse_value(text:str):
+        r"""
+        Parses a parameter value: a quoted string, a number, a tuple '(1, 1.5875, 1)' or any of them followed by a unit,
+        i.e. '0.02 s' is {'value': 0.02, 'unit': 's'}.
+        """
+        text = text.strip()
+
+        if text.startswith('"') and text.endswith('"'):
+
+            return text[1:-1]
+
+        if text.startswith('('):
+
+            end = text.find(')')
+            value = [Genkey.parse_scalar(item) for item in ITEM.findall(text[1:end])[:-1]]
+            unit = text[end + 1:].strip()
+
+        else:
+
+            value, _, unit = text.partition(' ')
+            unit = unit.strip()
+
+            if not NUMBER.match(value):
+
+                # Plain text, i.e. 'ADIABATIC' or 'FLOWPATH_1 INLET'
+                return text
+
+            value = Genkey.parse_scalar(value)
+
+        if unit:
+
+            return {'value': value, 'unit': unit}
+
+        return value
+
+    @staticmethod
+    def parse_scalar(text:str):
+        r"""
+        Parses a number or a (quoted) string.
+        """
+        text = text.strip()
+
+        if text.startswith('"') and text.endswith('"'):
+
+            return text[1:-1]
+
+        if NUMBER.match(text):
+
+            number = float(text)
+
+            return int(number) if number.is_integer() and not any(char in text for char in '.eE') else number
+
+        return text
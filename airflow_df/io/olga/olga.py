@@ -1,13 +1,218 @@
+import os
+import glob
+import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from .tpl import TPL
+from .cache import TPLCache
 
 
 class OlgaFormatter:
     r"""
-    Documentation here
+    Reads OLGA output files into Pandas DataFrames.
     """
 
+    # Time steps parsed at a time by filtered reads
+    chunksize = 1 << 16
+
     @staticmethod
     def read(filepath, **kwargs)->pd.DataFrame:
         r"""
-        Documentation here
+        Read an OLGA trend (.tpl) file into DataFrame.
+
+        **Parameters**
+
+        - *filepath:* (str) tpl file path, a directory or a glob pattern reads several cases, see
+        [read_cases](#read_cases).
+
+        - *chunksize:* (int, optional) number of time steps by chunk.
+
+        - *iterator:* (bool, default False) return a TPLReader object to get chunks with get_chunk().
+
+        - *window:* (tuple, optional) (start, end) time interval in seconds to read through a memory map.
+
+        - *usecols:* (str, dict, callable or list of them, optional) catalog variables to keep.
+
+        - *cache:* (bool or str, default False) load the parsed file from a Parquet cache, if it is a string it is used as
+        the cache folder. It is ignored for chunked and window reads.
+
+        - *cache_size:* (int, default 4 GiB) maximum cache size in bytes.
+
+        - *where:* (str, optional) keep only the time steps for which this query expression is True, the file is parsed in
+        chunks of *chunksize* time steps so the rows filtered out never accumulate in memory.
+
+        **Returns**
+
+        - *df:* (pd.DataFrame or TPLReader) one column for time ('TIME') and one for each catalog variable.
+        """
+        if OlgaFormatter.is_many(filepath):
+
+            return OlgaFormatter.read_cases(filepath, **kwargs)
+
+        where = kwargs.pop('where', None)
+
+        if where is not None:
+
+            return OlgaFormatter.read_where(filepath, where, **kwargs)
+
+        cache = kwargs.pop('cache', False)
+        cache_size = kwargs.pop('cache_size', 2**32)
+        tpl = TPL()
+
+        if cache and not kwargs.get('chunksize') and not kwargs.get('iterator') and kwargs.get('window') is None:
+
+            path = cache if isinstance(cache, str) else None
+
+            return TPLCache(path, max_size=cache_size).read(filepath, tpl=tpl, usecols=kwargs.get('usecols'))
+
+        return tpl.read(filepath, **kwargs)
+
+    @staticmethod
+    def read_where(filepath:str, where:str, chunksize:int=None, **kwargs)->pd.DataFrame:
+        r"""
+        Read a tpl file keeping only the time steps for which a query expression is True, i.e. "TIME >= 3600". Window and
+        cached reads are filtered once loaded, other reads are filtered chunk by chunk.
+
+        **Returns**
+
+        - *df:* (pd.DataFrame)
+        """
+        if kwargs.get('iterator'):
+
+            raise ValueError("iterator is not supported with where")
+
+        if kwargs.get('window') is not None or kwargs.get('cache'):
+
+            return OlgaFormatter.read(filepath, **kwargs).query(where)
+
+        tpl = TPL()
+
+        with tpl.read(filepath, chunksize=chunksize or OlgaFormatter.chunksize, usecols=kwargs.get('usecols')) as reader:
+
+            dfs = [chunk.query(where) for chunk in reader]
+
+        df = pd.concat(dfs) if dfs else tpl.to_dataframe(np.empty((0, len(tpl.columns) + 1)))
+        df.attrs['info'] = tpl.info.serialize()
+        df.attrs['catalog'] = tpl.columns.serialize()
+
+        return df
+
+    @staticmethod
+    def is_many(filepath)->bool:
+        r"""
+        True if *filepath* is a list of files, a directory or a glob pattern.
+        """
+        if isinstance(filepath, (list, tuple)):
+
+            return True
+
+        return os.path.isdir(filepath) or glob.has_magic(str(filepath))
+
+    @staticmethod
+    def expand(filepath:str, extension:str='.tpl')->list:
+        r"""
+        Lists the files of a directory with *extension* or the files matched by a glob pattern, sorted by name. A list of
+        files is kept as it is.
         """
+        if isinstance(filepath, (list, tuple)):
+
+            return list(filepath)
+
+        if os.path.isdir(filepath):
+
+            filepath = os.path.join(filepath, f"*{extension}")
+
+        return sorted(path for path in glob.glob(filepath) if os.path.isfile(path))
+
+    @staticmethod
+    def read_cases(filepath:str, max_workers:int=None, concat:bool=True, **kwargs):
+        r"""
+        Read several tpl case files, i.e. a sensitivity study, across a process pool. Each case is identified by its file
+        name without extension, i.e. 'SF_SH_D0_R0', see [case_names](#case_names).
+
+        **Parameters**
+
+        - *filepath:* (str or list) directory, glob pattern, i.e. 'data/olga/SF_*.tpl', or list of files.
+
+        - *max_workers:* (int, optional) number of processes, by default the number of CPUs. With 1 the files are read
+        in the current process.
+
+        - *concat:* (bool, default True) concatenate the cases in one DataFrame with a 'CASE' index level, otherwise a
+        dict of DataFrames by case is returned.
+
+        - Any other keyword argument is passed to [read](#read) for each file.
+
+        **Returns**
+
+        - *df:* (pd.DataFrame or dict) info and catalog of each case are kept in *df.attrs['info']* and
+        *df.attrs['catalog']* by case.
+        """
+        if kwargs.get('chunksize') or kwargs.get('iterator'):
+
+            raise ValueError("chunksize and iterator are not supported reading several files")
+
+        filepaths = OlgaFormatter.expand(filepath)
+
+        if not filepaths:
+
+            raise FileNotFoundError(f"There are no tpl files in {filepath}")
+
+        cases = OlgaFormatter.case_names(filepaths)
+
+        if max_workers == 1 or len(filepaths) == 1:
+
+            dfs = [OlgaFormatter.read(path, **kwargs) for path in filepaths]
+
+        else:
+
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+
+                futures = [executor.submit(OlgaFormatter.read, path, **kwargs) for path in filepaths]
+                dfs = [future.result() for future in futures]
+
+        dfs = dict(zip(cases, dfs))
+
+        if not concat:
+
+            return dfs
+
+        attrs = {
+            'info': {case: df.attrs.get('info') for case, df in dfs.items()},
+            'catalog': {case: df.attrs.get('catalog') for case, df in dfs.items()}
+        }
+        df = pd.concat(dfs, names=['CASE', None])
+        df.attrs = attrs
+
+        return df
+
+    @staticmethod
+    def case_names(filepaths:list)->list:
+        r"""
+        Case name of each tpl file, its file name without extension. When file names are repeated across folders, i.e.
+        'study/D0/case.tpl' and 'study/D1/case.tpl', cases are named by their path relative to the common folder
+        without extension, i.e. 'D0/case' and 'D1/case'.
+
+        **Parameters**
+
+        - *filepaths:* (list) tpl file paths.
+
+        **Returns**
+
+        - *cases:* (list) case names, in the order of *filepaths*.
+        """
+        cases = [os.path.splitext(os.path.basename(path))[0] for path in filepaths]
+
+        if len(set(cases)) == len(cases):
+
+            return cases
+
+        paths = [os.path.abspath(path) for path in filepaths]
+        common = os.path.commonpath([os.path.dirname(path) for path in paths])
+        cases = [os.path.splitext(os.path.relpath(path, common))[0].replace(os.sep, '/') for path in paths]
+        repeated = sorted({case for case in cases if cases.count(case) > 1})
+
+        if repeated:
+
+            raise ValueError(f"Cases {repeated} are given by more than one tpl file")
+
+        return cases
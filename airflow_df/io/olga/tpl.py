@@ -1,14 +1,108 @@
+import re
+import mmap
+import warnings
+from itertools import islice
+import numpy as np
 import pandas as pd
 
+CATALOG = 'CATALOG'
+TIME_SERIES = 'TIME SERIES'
+
+
+def unquote(value:str)->str:
+    r"""
+    Removes the surrounding quotes and blanks of a tpl value, i.e. "'(M)  '" -> '(M)'
+    """
+    return value.strip().strip("'").strip()
+
+
+def parse_floats(text)->np.ndarray:
+    r"""
+    Converts blank separated numbers into a float64 array.
+
+    Older numpy versions stop at the first invalid token and only warn, returning the values read so far, so the warning
+    is raised as ValueError and a malformed file is never read truncated.
+    """
+    with warnings.catch_warnings():
+
+        warnings.simplefilter('error', DeprecationWarning)
+
+        try:
+
+            return np.fromstring(text, dtype=np.float64, sep=' ')
+
+        except DeprecationWarning as error:
+
+            raise ValueError(f"Invalid numeric data, {error}") from None
+
+
+def header_lines(file:str)->list:
+    r"""
+    Splits the non numeric section of a raw tpl file, from the first line up to the *TIME SERIES* line (included),
+    into lines.
+
+    Only the header is scanned, the time series section is never split.
+    """
+    start = file.find(TIME_SERIES)
+
+    if start < 0:
+
+        return file.splitlines()
+
+    end = file.find('\n', start)
+
+    if end < 0:
+
+        end = len(file)
+
+    return file[:end].splitlines()
+
+
+def data_section(file:str)->str:
+    r"""
+    Returns the numeric section of a raw tpl file, i.e. everything after the *TIME SERIES* line.
+    """
+    start = file.find(TIME_SERIES)
+
+    if start < 0:
+
+        return ''
+
+    end = file.find('\n', start)
+
+    if end < 0:
+
+        return ''
+
+    return file[end + 1:]
+
+
 class TPL:
     r"""
-    Documentation Here
+    OLGA trend (.tpl) file parser.
+
+    A tpl file is made up by four sections, walked once from top to bottom:
+
+    - **Header:** simulation information, see [Info](#info).
+    - **Geometry:** pipeline profile, see [Profile](#profile).
+    - **Catalog:** description of each trended variable, see [Columns](#columns).
+    - **Time series:** numeric block with one row per time step, see [Content](#content).
+
+    ```python
+    from airflow_df.io.olga import TPL
+
+    tpl = TPL()
+    df = tpl.read("data/olga/SF_SH_D0_R0.tpl")
+    ```
     """
 
     def __init__(self):
 
         self.raw_file = None
         self.info = Info()
+        self.profile = Profile()
+        self.columns = Columns()
+        self.content = Content()
 
     def set_info(self, file:str):
         r"""
@@ -33,34 +127,443 @@ class TPL:
         """
         self.info.set_info(file)
 
-    def set_profile(self):
+    def set_profile(self, file:str=None):
         r"""
-        Documentation here
+        Set the geometry profile (length and elevation) of the branch.
+
+        **Parameters**
+
+        - **file:** (str) raw tpl file as string, if it is not provided, the last file read is used.
         """
-        pass
+        self.profile.set_profile(self.__get_file(file))
 
-    def set_columns(self):
+    def set_columns(self, file:str=None):
         r"""
-        Documentation here
+        Set the catalog of trended variables.
+
+        **Parameters**
+
+        - **file:** (str) raw tpl file as string, if it is not provided, the last file read is used.
         """
-        pass
+        self.columns.set_columns(self.__get_file(file))
 
-    def set_content(self):
+    def set_content(self, file:str=None, usecols=None):
         r"""
-        Documentation here
+        Set the time series matrix, the catalog must be set before.
+
+        **Parameters**
+
+        - **file:** (str) raw tpl file as string, if it is not provided, the last file read is used.
+        - **usecols:** (optional) catalog variables to keep, see [Columns.project](#columns).
         """
-        pass
+        file = self.__get_file(file)
+
+        if not self.columns.catalog:
+
+            self.columns.set_columns(file)
+
+        usecols = self.columns.project(usecols)
+        self.content.set_content(data_section(file), ncols=self.columns.width, usecols=usecols)
 
     def read_raw_file(self, filepath:str):
         r"""
-        Documentation here
+        Read the whole tpl file as string and keep it in *raw_file* attribute.
+
+        **Parameters**
+
+        - **filepath:** (str) tpl file path.
+
+        **Returns**
+
+        - **raw_file:** (str)
         """
         with open(filepath, 'r') as file:
-            
+
             self.raw_file = file.read()
 
         return self.raw_file
-    
+
+    def read_header(self, file)->str:
+        r"""
+        Read an open tpl file line by line up to the *TIME SERIES* line and set info, profile and catalog. The file is
+        left positioned at the first time series row.
+
+        **Parameters**
+
+        - **file:** (file object) tpl file opened in text mode.
+
+        **Returns**
+
+        - **header:** (str)
+        """
+        header = list()
+
+        for line in iter(file.readline, ''):
+
+            header.append(line)
+
+            if line.startswith(TIME_SERIES):
+
+                break
+
+        header = ''.join(header)
+        self.info.set_info(header)
+        self.profile.set_profile(header)
+        self.columns.set_columns(header)
+
+        return header
+
+    def read(self, filepath:str, chunksize:int=None, iterator:bool=False, window:tuple=None, usecols=None):
+        r"""
+        Parse a tpl file into a DataFrame.
+
+        The header is read line by line up to the *TIME SERIES* line, then the remaining numeric block is converted at once
+        into a float64 matrix, so the raw file is never kept in memory.
+
+        **Parameters**
+
+        - **filepath:** (str) tpl file path.
+        - **chunksize:** (int, optional) number of time steps by chunk, if it is provided a
+        [TPLReader](#tplreader) is returned instead.
+        - **iterator:** (bool, default False) return a [TPLReader](#tplreader) to get chunks with *get_chunk()*.
+        - **window:** (tuple, optional) (start, end) time interval to read, the file is memory-mapped with a
+        [TPLMap](#tplmap) and the previous rows are not parsed. Use None for an open side.
+        - **usecols:** (str, dict, callable or list of them, optional) catalog variables to keep, see
+        [Columns.project](#columns). Only the selected fields of the time series are converted.
+
+        **Returns**
+
+        - **df:** (pd.DataFrame or TPLReader) one column for time ('TIME') and one for each catalog variable.
+        """
+        if chunksize is not None or iterator:
+
+            return TPLReader(filepath, chunksize=chunksize, tpl=self, usecols=usecols)
+
+        if window is not None:
+
+            with TPLMap(filepath, tpl=self, usecols=usecols) as tpl:
+
+                return tpl.window(*window)
+
+        with open(filepath, 'r') as file:
+
+            self.read_header(file)
+            usecols = self.columns.project(usecols)
+            self.content.set_content(file, ncols=self.columns.width, usecols=usecols)
+
+        return self.to_dataframe()
+
+    def to_dataframe(self, values:np.ndarray=None, start:int=0)->pd.DataFrame:
+        r"""
+        Builds a DataFrame from the time series matrix.
+
+        Info and catalog are kept in *df.attrs['info']* and *df.attrs['catalog']*.
+
+        **Parameters**
+
+        - **values:** (np.ndarray, optional) time series rows, by default the whole content.
+        - **start:** (int, default 0) index of the first row.
+
+        **Returns**
+
+        - **df:** (pd.DataFrame)
+        """
+        if values is None:
+
+            values = self.content.values
+
+        df = pd.DataFrame(
+            values,
+            columns=['TIME'] + self.columns.names,
+            index=pd.RangeIndex(start, start + len(values))
+        )
+        df.attrs['info'] = self.info.serialize()
+        df.attrs['catalog'] = self.columns.serialize()
+
+        return df
+
+    def __get_file(self, file:str=None)->str:
+
+        if file is None:
+
+            file = self.raw_file
+
+        if file is None:
+
+            raise ValueError("There is no tpl file to parse, use read_raw_file first")
+
+        return file
+
+
+class TPLReader:
+    r"""
+    Iterates over the time series section of a tpl file in chunks of time steps, only one chunk is in memory at a time.
+
+    ```python
+    from airflow_df.io.olga import TPL
+
+    for df in TPL().read("data/olga/SF_SH_D0_R0.tpl", chunksize=10000):
+
+        pass
+    ```
+    """
+
+    def __init__(self, filepath:str, chunksize:int=None, tpl:TPL=None, usecols=None):
+
+        if chunksize is not None and chunksize < 1:
+
+            raise ValueError(f"chunksize must be a positive integer, got {chunksize}")
+
+        self.tpl = tpl or TPL()
+        self.chunksize = chunksize
+        self._file = open(filepath, 'r')
+        self.tpl.read_header(self._file)
+        self._ncols = self.tpl.columns.width
+        self._usecols = self.tpl.columns.project(usecols)
+        self._leftover = np.empty(0, dtype=np.float64)
+        self._row = 0
+
+    def get_chunk(self, size:int=None)->pd.DataFrame:
+        r"""
+        Read the next chunk of time steps.
+
+        **Parameters**
+
+        - **size:** (int, optional) number of time steps, by default *chunksize*, if both are None the rest of the file is
+        read.
+
+        **Returns**
+
+        - **df:** (pd.DataFrame)
+        """
+        if size is None:
+
+            size = self.chunksize
+
+        if self._file.closed:
+
+            raise StopIteration
+
+        if size is None:
+
+            lines = self._file.read()
+
+        else:
+
+            lines = ''.join(islice(self._file, size))
+
+        values = parse_floats(lines)
+
+        if self._leftover.size:
+
+            values = np.concatenate((self._leftover, values))
+
+        if not lines:
+
+            self.close()
+
+            if values.size:
+
+                raise ValueError(f"Invalid time series, {values.size} trailing values can not fill a row")
+
+            raise StopIteration
+
+        # Rows wrapped in several lines are completed in the next chunk
+        rows = values.size // self._ncols
+        self._leftover = values[rows * self._ncols:]
+        values = values[:rows * self._ncols].reshape(rows, self._ncols)
+
+        if self._usecols is not None:
+
+            values = values[:, self._usecols]
+
+        df = self.tpl.to_dataframe(values, start=self._row)
+        self._row += rows
+
+        return df
+
+    def close(self):
+        r"""
+        Closes the underlying file.
+        """
+        self._file.close()
+
+    def __iter__(self):
+
+        return self
+
+    def __next__(self)->pd.DataFrame:
+
+        return self.get_chunk()
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, *args):
+
+        self.close()
+
+
+class TPLMap:
+    r"""
+    Memory-mapped access to the time series section of a tpl file.
+
+    The *TIME SERIES* offset is found once and a sparse index with the byte offset and time of every *step* rows is built,
+    so any time window can be read without parsing the previous rows. Each time step must be written in one line, as OLGA
+    does.
+
+    ```python
+    from airflow_df.io.olga import TPLMap
+
+    with TPLMap("data/olga/SF_SH_D0_R0.tpl") as tpl:
+
+        df = tpl.window(3600, 7200)
+    ```
+    """
+
+    blocksize = 1 << 26
+
+    def __init__(self, filepath:str, step:int=1024, tpl:TPL=None, usecols=None):
+
+        if step < 1:
+
+            raise ValueError(f"step must be a positive integer, got {step}")
+
+        self.tpl = tpl or TPL()
+        self.step = step
+        self._file = open(filepath, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        start = self._map.find(TIME_SERIES.encode())
+
+        if start < 0:
+
+            self.close()
+            raise ValueError(f"{filepath} has no {TIME_SERIES} section")
+
+        start = self._map.find(b'\n', start) + 1 or len(self._map)
+        header = self._map[:start].decode()
+        self.tpl.info.set_info(header)
+        self.tpl.profile.set_profile(header)
+        self.tpl.columns.set_columns(header)
+        self._ncols = self.tpl.columns.width
+        self._usecols = self.tpl.columns.project(usecols)
+        self.start = start
+        self.set_index()
+
+    def set_index(self):
+        r"""
+        Builds the sparse index, *offsets* keeps the byte offset of rows 0, step, 2 * step, ... and *times* their time.
+        The newlines are found in blocks, so only one block of the file is scanned at a time. The time series ends at
+        *end*, the trailing blank lines are not rows.
+        """
+        end = len(self._map)
+
+        while end > self.start and self._map[end - 1:end].isspace():
+
+            end -= 1
+
+        buffer = np.frombuffer(self._map, dtype=np.uint8)
+        offsets = [np.array([self.start], dtype=np.int64)]
+        lines = 0
+
+        for begin in range(self.start, end, self.blocksize):
+
+            newlines = np.flatnonzero(buffer[begin:min(begin + self.blocksize, end)] == ord('\n')) + begin + 1
+            # Row i starts after newline i - 1, only every step rows are kept
+            first = (-(lines + 1)) % self.step
+            offsets.append(newlines[first::self.step].astype(np.int64))
+            lines += len(newlines)
+
+        del buffer
+        self.end = end
+        # Every newline before the end starts a row, as the end follows a value
+        self.offsets = np.concatenate(offsets) if end > self.start else np.empty(0, dtype=np.int64)
+        self.nrows = lines + 1 if end > self.start else 0
+        self.times = np.array([float(self._map[offset:offset + 64].split(maxsplit=1)[0]) for offset in self.offsets])
+
+    def rows(self, start:int=0, stop:int=None)->pd.DataFrame:
+        r"""
+        Read the time steps from *start* to *stop* (not included) by position.
+
+        **Parameters**
+
+        - **start:** (int, default 0) first row.
+        - **stop:** (int, optional) last row (not included), by default up to the end of the file.
+
+        **Returns**
+
+        - **df:** (pd.DataFrame)
+        """
+        if stop is None or stop > self.nrows:
+
+            stop = self.nrows
+
+        start = max(start, 0)
+
+        if start >= stop:
+
+            return self.tpl.to_dataframe(np.empty((0, len(self.tpl.columns) + 1)), start=start)
+
+        first = start // self.step
+        last = -(-stop // self.step)
+        begin = self.offsets[first]
+        end = self.offsets[last] if last < len(self.offsets) else self.end
+        values = parse_floats(self._map[begin:end]).reshape(-1, self._ncols)
+        values = values[start - first * self.step:stop - first * self.step]
+
+        if self._usecols is not None:
+
+            values = values[:, self._usecols]
+
+        return self.tpl.to_dataframe(values, start=start)
+
+    def window(self, start:float=None, end:float=None)->pd.DataFrame:
+        r"""
+        Read the time steps with *start* <= time <= *end*.
+
+        **Parameters**
+
+        - **start:** (float, optional) initial time, by default the beginning of the simulation.
+        - **end:** (float, optional) final time, by default the end of the simulation.
+
+        **Returns**
+
+        - **df:** (pd.DataFrame)
+        """
+        first = 0 if start is None else max(np.searchsorted(self.times, start, side='right') - 1, 0)
+        last = len(self.offsets) if end is None else np.searchsorted(self.times, end, side='right')
+        df = self.rows(first * self.step, last * self.step)
+        mask = np.ones(len(df), dtype=bool)
+
+        if start is not None:
+
+            mask &= df['TIME'].to_numpy() >= start
+
+        if end is not None:
+
+            mask &= df['TIME'].to_numpy() <= end
+
+        return df[mask]
+
+    def close(self):
+        r"""
+        Releases the memory map and closes the file.
+        """
+        if not self._map.closed:
+
+            self._map.close()
+
+        self._file.close()
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, *args):
+
+        self.close()
+
 
 class Info:
     r"""
@@ -70,7 +573,7 @@ class Info:
     >>> INPUT FILE
     >>> 'SF_SH_D0_R0.genkey'
     >>> PVT FILE
-    >>> '../../../00 Nuevos fluidos/Diesel_1.tab' 
+    >>> '../../../00 Nuevos fluidos/Diesel_1.tab'
     >>> DATE
     >>> '23-06-06 15:12:27'
     >>> PROJECT
@@ -88,6 +591,17 @@ class Info:
     As class attributes
     """
 
+    keywords = {
+        'INPUT FILE': 'input_file',
+        'PVT FILE': 'pvt_file',
+        'DATE': 'date',
+        'PROJECT': 'project',
+        'TITLE': 'title',
+        'AUTHOR': 'author',
+        'NETWORK': 'network',
+        'BRANCH': 'branch'
+    }
+
     def __init__(self):
 
         self.version = None
@@ -122,7 +636,41 @@ class Info:
         - **geometry:** (str) Unit for pipeline length
         - **branch:** (str) Branch name
         """
-        pass
+        lines = header_lines(file)
+
+        if not lines:
+
+            return
+
+        self.version = unquote(lines[0])
+        i = 1
+
+        while i < len(lines):
+
+            line = lines[i].strip()
+
+            if line.startswith(CATALOG):
+
+                break
+
+            if line in self.keywords and i + 1 < len(lines):
+
+                attr = self.keywords[line]
+
+                # Only the first branch is kept for networks
+                if getattr(self, attr) is None:
+
+                    value = unquote(lines[i + 1])
+                    setattr(self, attr, int(value) if attr == 'network' else value)
+
+                i += 2
+                continue
+
+            if line.startswith('GEOMETRY'):
+
+                self.geometry = unquote(line[len('GEOMETRY'):])
+
+            i += 1
 
     def serialize(self):
         r"""
@@ -145,11 +693,17 @@ class Info:
             'geometry': self.geometry,
             'branch': self.branch
         }
-    
+
 
 class Profile:
     r"""
-    Documentation here
+    Stores the geometry profile of the branch, pipeline length (x) and elevation (y) of each section boundary
+    for example
+    >>> BRANCH
+    >>> 'PIPELINE'
+    >>> 52
+    >>> 0.0000000000000000e+000 1.5000000000000000e+000 ...
+    >>> 0.0000000000000000e+000 0.0000000000000000e+000 ...
     """
 
     def __init__(self):
@@ -159,70 +713,242 @@ class Profile:
 
     def set_profile(self, file:str):
         r"""
-        Documentation here
+        Set length and elevation of the first branch in the tpl file.
+
+        **Parameters**
+
+        - **file:** (str) raw tpl file as string.
         """
-        pass
+        lines = header_lines(file)
+        block = list()
+
+        for i, line in enumerate(lines):
+
+            if line.strip() == 'BRANCH':
+
+                # Skip branch name and number of sections
+                for line in lines[i + 3:]:
+
+                    if not line.strip() or line.lstrip()[0].isalpha():
+
+                        break
+
+                    block.append(line)
+
+                break
+
+        values = parse_floats(' '.join(block))
+
+        if values.size % 2:
+
+            raise ValueError(f"Invalid geometry profile, {values.size} values can not be split into x and y")
+
+        self.x, self.y = values.reshape(2, -1)
 
     @property
-    def x(self, values:list):
+    def x(self):
         r"""
-        Documentation here
+        Pipeline length of each section boundary
         """
 
-        self._x = values
+        return self._x
 
     @x.setter
-    def x(self):
+    def x(self, values:list):
+
+        self._x = np.asarray(values, dtype=np.float64)
 
-        return self._x
-    
     @property
-    def y(self, values:list):
+    def y(self):
         r"""
-        Documentation here
+        Elevation of each section boundary
         """
 
-        self._y = values
+        return self._y
 
-    @x.setter
-    def y(self):
+    @y.setter
+    def y(self, values:list):
+
+        self._y = np.asarray(values, dtype=np.float64)
 
-        return self._y
-    
     def serialize(self):
         r"""
-        Documentation here
+        Serializes the profile
+
+        **Returns**
+
+        - **profile:** (tuple) (x, y)
         """
 
         return (self.x, self.y)
-    
+
 
 class Columns:
     r"""
-    Documentation here
+    Stores the catalog of trended variables inside a tpl file, in the same order of the time series columns
+    for example
+    >>> CATALOG
+    >>> 18
+    >>> KAPPA 'POSITION:' 'POS-1378M' '(1/Pa)' 'Compressibility of fluid'
+    >>> PT 'POSITION:' 'POS-1378M' '(PA)' 'Pressure'
+
+    Each variable is stored as a dict with keys *name*, *variable*, *element*, *label*, *unit* and *description*.
+
+    *catalog* is the whole catalog of the file, used to parse the time series, and *columns* the variables selected by
+    [project](#project).
     """
 
     def __init__(self):
 
+        self.catalog = list()
         self.columns = list()
+        self.time_unit = None
+
+    def __len__(self):
+
+        return len(self.columns)
+
+    @property
+    def names(self)->list:
+        r"""
+        Column names of the time series, i.e. 'PT_POS-1378M'
+        """
+
+        return [column['name'] for column in self.columns]
+
+    @property
+    def width(self)->int:
+        r"""
+        Fields by time step in the file, time included.
+        """
+
+        return len(self.catalog) + 1
 
     def set_columns(self, file:str):
         r"""
-        Documentation here
+        Set the catalog of the tpl file.
+
+        **Parameters**
+
+        - **file:** (str) raw tpl file as string.
         """
+        lines = header_lines(file)
+        self.catalog = list()
 
-        pass
+        for i, line in enumerate(lines):
+
+            if line.strip() == CATALOG:
+
+                n = int(lines[i + 1])
+                self.catalog = [self.parse(line) for line in lines[i + 2:i + 2 + n]]
+
+            elif line.startswith(TIME_SERIES):
+
+                self.time_unit = unquote(line[len(TIME_SERIES):])
+
+        self.columns = list(self.catalog)
+
+    @staticmethod
+    def parse(line:str)->dict:
+        r"""
+        Parse a catalog line.
+
+        **Parameters**
+
+        - **line:** (str) i.e. "PT 'POSITION:' 'POS-1378M' '(PA)' 'Pressure'"
+
+        **Returns**
+
+        - **column:** (dict)
+        """
+        variable, _, rest = line.strip().partition(' ')
+        fields = re.findall(r"'([^']*)'", rest)
+
+        # Global variables have no label
+        if len(fields) == 3:
+
+            fields.insert(1, '')
+
+        element, label, unit, description = (fields + [''] * 4)[:4]
+        label = label.strip()
+
+        return {
+            'name': f"{variable}_{label}" if label else variable,
+            'variable': variable,
+            'element': element.strip(),
+            'label': label,
+            'unit': unit.strip(),
+            'description': description.strip()
+        }
+
+    def project(self, usecols)->list:
+        r"""
+        Selects the catalog variables of *usecols*, in catalog order. The selection is always taken from the whole
+        catalog, so a parser can be projected again, and None selects all of them.
+
+        **Parameters**
+
+        - **usecols:** (str, dict, callable or list of them) each item selects the variables whose name
+        ('PT_POS-1378M'), variable ('PT'), element ('LEAK:') or label ('V-IN') is equal to a string, whose fields are equal
+        to all items of a dict, i.e. {'variable': 'PVALVE', 'label': 'V-IN'}, or for which a callable returns True.
+
+        **Returns**
+
+        - **indexes:** (list or None) time series matrix columns to keep, time column (0) included, None for all of them.
+        """
+        if usecols is None:
+
+            self.columns = list(self.catalog)
+
+            return None
+
+        if isinstance(usecols, (str, dict)) or callable(usecols):
+
+            usecols = [usecols]
+
+        def match(column:dict, item)->bool:
+
+            if callable(item):
+
+                return item(column)
+
+            if isinstance(item, dict):
+
+                return all(column.get(key) == value for key, value in item.items())
+
+            return item in (column['name'], column['variable'], column['element'], column['label'])
+
+        keep = set()
+
+        for item in usecols:
+
+            found = {i for i, column in enumerate(self.catalog) if match(column, item)}
+
+            if not found:
+
+                raise ValueError(f"usecols item {item!r} does not match any catalog variable")
+
+            keep |= found
+
+        keep = sorted(keep)
+        self.columns = [self.catalog[i] for i in keep]
+
+        return [0] + [i + 1 for i in keep]
 
     def serialize(self):
         r"""
-        Documentation here
+        Serializes the catalog
+
+        **Returns**
+
+        - **columns:** (list) list of dicts
         """
-        pass
+        return [column.copy() for column in self.columns]
 
 
 class Content:
     r"""
-    Documentation here
+    Stores the time series section of a tpl file as a float64 matrix, the first column is the time.
     """
 
     def __init__(self):
@@ -230,17 +956,48 @@ class Content:
         Documentation here
         """
 
-        pass
+        self.values = np.empty((0, 0), dtype=np.float64)
 
-    def set_content(self, file:str):
+    def set_content(self, file:str, ncols:int, usecols:list=None):
         r"""
-        Documentation here
+        Converts the whole numeric block at once into a (rows, ncols) float64 matrix.
+
+        **Parameters**
+
+        - **file:** (str or file object) time series section of a tpl file.
+        - **ncols:** (int) number of columns, time included.
+        - **usecols:** (list, optional) matrix columns to keep, the rest of the fields are not converted. Each time step
+        must be written in one line.
         """
-        pass
+        if usecols is not None:
+
+            if isinstance(file, str):
+
+                file = file.splitlines()
+
+            self.values = np.loadtxt(file, dtype=np.float64, usecols=usecols, ndmin=2)
+
+            return
+
+        if not isinstance(file, str):
+
+            file = file.read()
+
+        values = parse_floats(file)
+
+        if values.size % ncols:
+
+            raise ValueError(f"Invalid time series, {values.size} values can not be split into {ncols} columns")
+
+        self.values = values.reshape(-1, ncols)
 
     def serialize(self):
         r"""
-        Documentation here
+        Serializes the time series
+
+        **Returns**
+
+        - **values:** (np.ndarray)
         """
 
-        pass
+        return self.values
@@ -0,0 +1,363 @@
+import copy
+import numpy as np
+import pandas as pd
+
+# unit: (dimension, scale, offset), the SI value is value * scale + offset
+UNITS = {
+    # length
+    'M': ('length', 1.0, 0.0),
+    'MM': ('length', 1e-3, 0.0),
+    'CM': ('length', 1e-2, 0.0),
+    'KM': ('length', 1e3, 0.0),
+    'IN': ('length', 0.0254, 0.0),
+    'FT': ('length', 0.3048, 0.0),
+    # time
+    'S': ('time', 1.0, 0.0),
+    'MIN': ('time', 60.0, 0.0),
+    'H': ('time', 3600.0, 0.0),
+    'D': ('time', 86400.0, 0.0),
+    # pressure
+    'PA': ('pressure', 1.0, 0.0),
+    'KPA': ('pressure', 1e3, 0.0),
+    'MPA': ('pressure', 1e6, 0.0),
+    'BAR': ('pressure', 1e5, 0.0),
+    'BARA': ('pressure', 1e5, 0.0),
+    'BARG': ('pressure', 1e5, 101325.0),
+    'ATM': ('pressure', 101325.0, 0.0),
+    'PSI': ('pressure', 6894.757293168361, 0.0),
+    'PSIA': ('pressure', 6894.757293168361, 0.0),
+    'PSIG': ('pressure', 6894.757293168361, 101325.0),
+    # temperature
+    'K': ('temperature', 1.0, 0.0),
+    'C': ('temperature', 1.0, 273.15),
+    'F': ('temperature', 5 / 9, 273.15 - 32 * 5 / 9),
+    'R': ('temperature', 5 / 9, 0.0),
+    # mass
+    'KG': ('mass', 1.0, 0.0),
+    'G': ('mass', 1e-3, 0.0),
+    'T': ('mass', 1e3, 0.0),
+    'LB': ('mass', 0.45359237, 0.0),
+    # mass flow
+    'KG/S': ('mass flow', 1.0, 0.0),
+    'KG/H': ('mass flow', 1 / 3600, 0.0),
+    'T/H': ('mass flow', 1e3 / 3600, 0.0),
+    'T/D': ('mass flow', 1e3 / 86400, 0.0),
+    'LB/S': ('mass flow', 0.45359237, 0.0),
+    'LB/H': ('mass flow', 0.45359237 / 3600, 0.0),
+    # volume
+    'M3': ('volume', 1.0, 0.0),
+    'L': ('volume', 1e-3, 0.0),
+    'FT3': ('volume', 0.028316846592, 0.0),
+    'BBL': ('volume', 0.158987294928, 0.0),
+    # volume flow
+    'M3/S': ('volume flow', 1.0, 0.0),
+    'M3/H': ('volume flow', 1 / 3600, 0.0),
+    'M3/D': ('volume flow', 1 / 86400, 0.0),
+    'L/S': ('volume flow', 1e-3, 0.0),
+    'FT3/S': ('volume flow', 0.028316846592, 0.0),
+    'BBL/D': ('volume flow', 0.158987294928 / 86400, 0.0),
+    # density
+    'KG/M3': ('density', 1.0, 0.0),
+    'G/CM3': ('density', 1e3, 0.0),
+    'LB/FT3': ('density', 16.018463373960138, 0.0),
+    # velocity
+    'M/S': ('velocity', 1.0, 0.0),
+    'FT/S': ('velocity', 0.3048, 0.0),
+    # rotational speed
+    'RPM': ('rotational speed', 2 * np.pi / 60, 0.0),
+    'RAD/S': ('rotational speed', 1.0, 0.0),
+    # compressibility
+    '1/PA': ('compressibility', 1.0, 0.0),
+    '1/BAR': ('compressibility', 1e-5, 0.0),
+    '1/PSI': ('compressibility', 1 / 6894.757293168361, 0.0),
+    # energy and power
+    'J': ('energy', 1.0, 0.0),
+    'KJ': ('energy', 1e3, 0.0),
+    'BTU': ('energy', 1055.05585262, 0.0),
+    'W': ('power', 1.0, 0.0),
+    'KW': ('power', 1e3, 0.0),
+    'HP': ('power', 745.6998715822702, 0.0),
+    # temperature differences, without offset
+    'J/KG-C': ('specific heat', 1.0, 0.0),
+    'J/KG-K': ('specific heat', 1.0, 0.0),
+    'BTU/LB-F': ('specific heat', 4186.8, 0.0),
+    'W/M-C': ('thermal conductivity', 1.0, 0.0),
+    'W/M-K': ('thermal conductivity', 1.0, 0.0),
+    'BTU/H-FT-F': ('thermal conductivity', 1.730734666371391, 0.0),
+    'W/M2-C': ('heat transfer coefficient', 1.0, 0.0),
+    'W/M2-K': ('heat transfer coefficient', 1.0, 0.0),
+    'BTU/H-FT2-F': ('heat transfer coefficient', 5.678263340863113, 0.0),
+}
+
+# Target unit by dimension, dimensions out of a system are not converted
+SYSTEMS = {
+    'SI': {
+        'length': 'M',
+        'time': 'S',
+        'pressure': 'PA',
+        'temperature': 'K',
+        'mass': 'KG',
+        'mass flow': 'KG/S',
+        'volume': 'M3',
+        'volume flow': 'M3/S',
+        'density': 'KG/M3',
+        'velocity': 'M/S',
+        'rotational speed': 'RAD/S',
+        'compressibility': '1/PA',
+        'energy': 'J',
+        'power': 'W',
+        'specific heat': 'J/KG-K',
+        'thermal conductivity': 'W/M-K',
+        'heat transfer coefficient': 'W/M2-K'
+    },
+    'field': {
+        'length': 'FT',
+        'time': 'S',
+        'pressure': 'PSIA',
+        'temperature': 'F',
+        'mass': 'LB',
+        'mass flow': 'LB/S',
+        'volume': 'BBL',
+        'volume flow': 'BBL/D',
+        'density': 'LB/FT3',
+        'velocity': 'FT/S',
+        'rotational speed': 'RPM',
+        'compressibility': '1/PSI',
+        'energy': 'BTU',
+        'power': 'HP',
+        'specific heat': 'BTU/LB-F',
+        'thermal conductivity': 'BTU/H-FT-F',
+        'heat transfer coefficient': 'BTU/H-FT2-F'
+    }
+}
+
+
+class UnitConverter:
+    r"""
+    Converts OLGA quantities to a unit system: time series whose catalog has units ('(PA)', '(KG/S)', '(C)', '(M3/S)')
+    and genkey values with units ('m3/h', 'rpm', 'J/kg-C', 'cm').
+
+    A scale and an offset are computed once by column, and the whole values matrix is converted in one vectorized
+    operation. Units are case insensitive and parentheses are ignored. Unknown units and dimensionless values are left as
+    they are.
+
+    **Parameters**
+
+    - **system:** (str or dict, default 'SI') 'SI', 'field', or a dict of target units by source unit or by dimension,
+    i.e. {'PA': 'BAR', 'temperature': 'C'}.
+    - **base:** (str, default 'SI') unit system completed by a dict *system*, None to convert only the given units.
+
+    ```python
+    from airflow_df.io.olga.units import UnitConverter
+
+    df = UnitConverter({'pressure': 'BAR', 'temperature': 'C'}, base=None).convert(df)
+    ```
+    """
+
+    units = UNITS
+    systems = SYSTEMS
+
+    def __init__(self, system='SI', base:str='SI'):
+
+        if isinstance(system, str):
+
+            if system not in self.systems:
+
+                raise ValueError(f"Unknown unit system {system!r}, available systems are {list(self.systems)}")
+
+            targets, system = dict(self.systems[system]), dict()
+
+        else:
+
+            targets = dict(self.systems[base]) if base is not None else dict()
+
+        dimensions = {dimension for dimension, _, _ in self.units.values()}
+        self.by_unit = dict()
+
+        for key, target in system.items():
+
+            target = self.normalize(target)
+
+            if target not in self.units:
+
+                raise ValueError(f"Unknown unit {target!r}")
+
+            if key in dimensions:
+
+                targets[key] = target
+
+            else:
+
+                self.by_unit[self.normalize(key)] = target
+
+        self.targets = targets
+
+    @classmethod
+    def get(cls, spec):
+        r"""
+        Get a converter from the *units* reader argument.
+
+        **Parameters**
+
+        - **spec:** (str, dict or UnitConverter) a unit system, i.e. 'SI' or 'field', a dict of target units, or None.
+
+        **Returns**
+
+        - **converter:** (UnitConverter or None)
+        """
+        if spec is None:
+
+            return None
+
+        if isinstance(spec, UnitConverter):
+
+            return spec
+
+        return cls(spec)
+
+    @staticmethod
+    def normalize(unit:str)->str:
+        r"""
+        Normalized unit symbol, i.e. '(KG/S)' is 'KG/S' and 'J/kg-C' is 'J/KG-C'.
+        """
+        return str(unit).strip().strip('()').strip().upper()
+
+    def target(self, unit:str)->str:
+        r"""
+        Target unit of a unit, None if it is not converted.
+        """
+        unit = self.normalize(unit)
+
+        if unit not in self.units:
+
+            return None
+
+        target = self.by_unit.get(unit, self.targets.get(self.units[unit][0]))
+
+        if target is None or self.units[target][0] != self.units[unit][0]:
+
+            return None
+
+        return target
+
+    def factors(self, units:list):
+        r"""
+        Scale and offset of each unit to its target unit.
+
+        **Parameters**
+
+        - **units:** (list) source units.
+
+        **Returns**
+
+        - **(scale, offset, targets):** (tuple) scale and offset arrays, and the target units (None for units that are not
+        converted).
+        """
+        scale = np.ones(len(units))
+        offset = np.zeros(len(units))
+        targets = list()
+
+        for position, unit in enumerate(units):
+
+            target = self.target(unit) if unit is not None else None
+            targets.append(target)
+
+            if target is not None:
+
+                _, source_scale, source_offset = self.units[self.normalize(unit)]
+                _, target_scale, target_offset = self.units[target]
+                scale[position] = source_scale / target_scale
+                offset[position] = (source_offset - target_offset) / target_scale
+
+        return scale, offset, targets
+
+    def convert(self, df:pd.DataFrame, units:dict=None)->pd.DataFrame:
+        r"""
+        Convert the columns of a DataFrame.
+
+        **Parameters**
+
+        - **df:** (pd.DataFrame) i.e. a tpl time series, units are taken from *df.attrs['catalog']*.
+        - **units:** (dict, optional) unit by column, it takes precedence over the catalog.
+
+        **Returns**
+
+        - **df:** (pd.DataFrame) converted columns, units of the catalog are updated.
+        """
+        catalog = df.attrs.get('catalog')
+        known = dict()
+
+        if isinstance(catalog, list):
+
+            known = {column['name']: column['unit'] for column in catalog}
+
+        known.update(units or dict())
+        columns = [
+            position for position, column in enumerate(df.columns)
+            if column in known and pd.api.types.is_float_dtype(df.iloc[:, position].dtype)
+        ]
+        scale, offset, targets = self.factors([known[df.columns[position]] for position in columns])
+        converted = [position for position, target in zip(columns, targets) if target is not None]
+        result = df.copy(deep=False)
+
+        if converted:
+
+            keep = np.array([target is not None for target in targets])
+            values = df.iloc[:, converted].to_numpy()
+            # One pass over the matrix
+            values = values * scale[keep].astype(values.dtype) + offset[keep].astype(values.dtype)
+
+            for index, position in enumerate(converted):
+
+                result.isetitem(position, values[:, index])
+
+        names = {df.columns[position]: target for position, target in zip(columns, targets) if target is not None}
+        result.attrs = copy.deepcopy(df.attrs)
+
+        if isinstance(catalog, list):
+
+            for column in result.attrs['catalog']:
+
+                if column['name'] in names:
+
+                    column['unit'] = f"({names[column['name']]})"
+
+        result.attrs['units'] = {**df.attrs.get('units', dict()), **names}
+
+        return result
+
+    def convert_genkey(self, genkey):
+        r"""
+        Convert the values with units of all genkey records at once, records are updated in place.
+
+        **Parameters**
+
+        - **genkey:** (Genkey)
+
+        **Returns**
+
+        - **genkey:** (Genkey)
+        """
+        quantities = [
+            value for record in genkey.records for value in record['parameters'].values()
+            if isinstance(value, dict) and self.target(value['unit']) is not None
+        ]
+
+        if not quantities:
+
+            return genkey
+
+        sizes = [len(quantity['value']) if isinstance(quantity['value'], list) else 1 for quantity in quantities]
+        values = np.array([item for quantity in quantities for item in np.atleast_1d(quantity['value'])], dtype=np.float64)
+        scale, offset, targets = self.factors([quantity['unit'] for quantity in quantities])
+        values = values * np.repeat(scale, sizes) + np.repeat(offset, sizes)
+        start = 0
+
+        for quantity, size, target in zip(quantities, sizes, targets):
+
+            block = values[start:start + size].tolist()
+            quantity['value'] = block if isinstance(quantity['value'], list) else block[0]
+            quantity['unit'] = target
+            start += size
+
+        return genkey
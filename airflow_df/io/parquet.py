@@ -0,0 +1,190 @@
+import os
+import json
+import uuid
+import shutil
+import pandas as pd
+
+try:
+    import pyarrow
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pyarrow = None
+
+# Schema metadata keys
+ATTRS = b'airflow_df.attrs'
+INDEX = b'airflow_df.index'
+# existing_data_behavior of each write mode
+MODES = {
+    'append': 'overwrite_or_ignore',
+    'overwrite_partitions': 'delete_matching',
+    'overwrite': 'overwrite_or_ignore'
+}
+
+
+class ParquetFormatter:
+    r"""
+    Writes and reads partitioned Parquet datasets.
+
+    A dataset is a folder with one subfolder by partition value, hive style, i.e. 'DATE=2022-09-02/CASE=SF_SH_D0_R0'.
+    Row groups are written with min/max statistics of each column, so a reader skips the partitions that do not match a
+    filter by their folder names and the row groups that do not match it by their statistics, without decoding them.
+
+    Index levels, other than a default RangeIndex, are stored as columns and set back on read when all of them are read.
+    *df.attrs* is kept in the schema metadata. It requires *pyarrow*.
+
+    ```python
+    from airflow_df.io.parquet import ParquetFormatter
+
+    ParquetFormatter.write(df, "trends", partition_cols=['CASE'], date='DATE')
+    df = ParquetFormatter.read("trends", filters=[('CASE', '=', 'SF_SH_D0_R0'), ('TIME', '>=', 3600)])
+    ```
+    """
+
+    # Rows by row group
+    row_group_size = 1 << 17
+
+    @staticmethod
+    def write(df:pd.DataFrame, path:str, partition_cols:list=None, date:str=None, date_format:str='%Y-%m-%d', sort_by=None, row_group_size:int=None, compression:str='snappy', mode:str='append')->str:
+        r"""
+        Write a DataFrame into a partitioned dataset.
+
+        **Parameters**
+
+        - **df:** (pd.DataFrame)
+        - **path:** (str) dataset folder.
+        - **partition_cols:** (list, optional) columns or index levels to partition by, i.e. ['CASE', 'BRANCH'].
+        - **date:** (str, optional) datetime column or index level, its dates are the first partition ('DATE').
+        - **date_format:** (str, default '%Y-%m-%d') format of the 'DATE' partition, i.e. '%Y-%m' for monthly partitions.
+        - **sort_by:** (str or list, optional) sort the rows before writing them, so the row group statistics of these
+        columns do not overlap and filters on them skip more row groups.
+        - **row_group_size:** (int, optional) rows by row group, by default 131072.
+        - **compression:** (str, default 'snappy')
+        - **mode:** (str, default 'append') 'append' adds files to the dataset, 'overwrite_partitions' replaces the
+        partitions that are written and 'overwrite' replaces the whole dataset.
+
+        **Returns**
+
+        - **path:** (str)
+        """
+        ParquetFormatter.check()
+
+        if mode not in MODES:
+
+            raise ValueError(f"mode must be one of {list(MODES)}, got {mode!r}")
+
+        partition_cols = [partition_cols] if isinstance(partition_cols, str) else list(partition_cols or list())
+        index = dict()
+
+        if not (isinstance(df.index, pd.RangeIndex) and df.index.name is None):
+
+            names = list(df.index.names)
+            df = df.reset_index()
+            index = {'columns': df.columns[:len(names)].tolist(), 'names': names}
+
+        if date is not None:
+
+            df = df.assign(DATE=pd.to_datetime(df[date]).dt.strftime(date_format))
+            partition_cols = ['DATE'] + [column for column in partition_cols if column != 'DATE']
+
+        missing = [column for column in partition_cols if column not in df.columns]
+
+        if missing:
+
+            raise KeyError(f"{missing} are not columns nor index levels")
+
+        if sort_by is not None:
+
+            df = df.sort_values(sort_by, kind='stable')
+
+        table = pyarrow.Table.from_pandas(df, preserve_index=False)
+        metadata = {
+            **(table.schema.metadata or dict()),
+            ATTRS: json.dumps(df.attrs, default=str).encode(),
+            INDEX: json.dumps(index).encode()
+        }
+        table = table.replace_schema_metadata(metadata)
+
+        if mode == 'overwrite' and os.path.isdir(path):
+
+            shutil.rmtree(path)
+
+        row_group_size = row_group_size or ParquetFormatter.row_group_size
+        file_format = ds.ParquetFileFormat()
+        ds.write_dataset(
+            table,
+            path,
+            format=file_format,
+            file_options=file_format.make_write_options(compression=compression, write_statistics=True),
+            partitioning=partition_cols or None,
+            partitioning_flavor='hive' if partition_cols else None,
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior=MODES[mode],
+            max_rows_per_group=row_group_size,
+            min_rows_per_group=min(row_group_size, len(df)) or 1,
+            max_rows_per_file=0
+        )
+
+        return path
+
+    @staticmethod
+    def read(path:str, columns:list=None, filters=None)->pd.DataFrame:
+        r"""
+        Read a partitioned dataset.
+
+        **Parameters**
+
+        - **path:** (str) dataset folder or Parquet file.
+        - **columns:** (list, optional) columns to read, partition columns included.
+        - **filters:** (list or pyarrow expression, optional) rows to keep, as (column, op, value) tuples that must all be
+        True, i.e. [('CASE', '=', 'SF_SH_D0_R0'), ('TIME', '>=', 3600)], or a list of such lists, any of which must be
+        True. Partitions are pruned by their folder names and row groups by their statistics.
+
+        **Returns**
+
+        - **df:** (pd.DataFrame)
+        """
+        ParquetFormatter.check()
+        dataset = ds.dataset(path, format='parquet', partitioning='hive')
+
+        if filters is not None and not isinstance(filters, ds.Expression):
+
+            filters = pq.filters_to_expression(filters)
+
+        table = dataset.to_table(columns=columns, filter=filters)
+        metadata = ParquetFormatter.metadata(dataset)
+        df = table.to_pandas()
+        index = json.loads(metadata.get(INDEX, b'{}'))
+
+        if index and all(column in df.columns for column in index['columns']):
+
+            df = df.set_index(index['columns'])
+            df.index.names = index['names']
+
+        df.attrs = json.loads(metadata.get(ATTRS, b'{}'))
+
+        return df
+
+    @staticmethod
+    def metadata(dataset)->dict:
+        r"""
+        Schema metadata of the first file of a dataset, the dataset schema does not keep it when it is partitioned.
+        """
+        if dataset.schema.metadata and ATTRS in dataset.schema.metadata:
+
+            return dataset.schema.metadata
+
+        for filepath in dataset.files:
+
+            return pq.read_schema(filepath, filesystem=dataset.filesystem).metadata or dict()
+
+        return dict()
+
+    @staticmethod
+    def check():
+        r"""
+        Raises ImportError if pyarrow is not installed.
+        """
+        if pyarrow is None:
+
+            raise ImportError("Parquet datasets require pyarrow, install it with 'pip install airflow-df[parquet]'")
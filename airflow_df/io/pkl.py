@@ -0,0 +1,242 @@
+import io
+import mmap
+import pickle
+import struct
+import pandas as pd
+
+# First and last bytes of a columnar pickle file
+MAGIC = b'ADFPKL5\n'
+# Footer: manifest offset and the magic
+FOOTER = struct.Struct('<Q8s')
+# Alignment of the segments, so memory-mapped buffers can be used as arrays
+ALIGNMENT = 64
+
+
+class PickleFormatter:
+    r"""
+    Reads and writes DataFrames as plain pickles or as columnar pickles.
+
+    A columnar pickle is a single file where each column, and the index, is pickled on its own with protocol 5: the
+    column buffers (out-of-band *PickleBuffer*, i.e. the float64 values of a column) are written as aligned segments and
+    only the small in-band part is unpickled on read. A manifest at the end of the file keeps the column labels, the
+    segment offsets and *df.attrs*.
+
+    ```
+    MAGIC | segments ... | manifest (pickle) | manifest offset (uint64) | MAGIC
+    ```
+
+    Reading a subset of columns only touches its segments, and with *mmap* the arrays are views of the memory-mapped
+    file, so pages are loaded on demand.
+
+    ```python
+    from airflow_df.io.pkl import PickleFormatter
+
+    PickleFormatter.write(df, "checkpoint.pkl", columnar=True)
+    df = PickleFormatter.read("checkpoint.pkl", columns=['PT_POS-1378M'], mmap=True)
+    ```
+    """
+
+    @staticmethod
+    def read(filepath:str, columns:list=None, mmap:bool=False, **kwargs)->pd.DataFrame:
+        r"""
+        Read a pickled DataFrame, the format is detected from the first bytes of the file.
+
+        **Parameters**
+
+        - **filepath:** (str) pickle file path.
+        - **columns:** (list, optional) columns to load. Only the segments of these columns are read from a columnar
+        pickle; a plain pickle is fully loaded before selecting them.
+        - **mmap:** (bool, default False) for columnar pickles, columns are read-only views of the memory-mapped file
+        instead of copies.
+        - ***kwargs:** passed to *pd.read_pickle* for plain pickles, i.e. *compression*.
+
+        **Returns**
+
+        - **df:** (pd.DataFrame)
+        """
+        if PickleFormatter.is_columnar(filepath):
+
+            return PickleFormatter.read_columnar(filepath, columns=columns, mmap=mmap)
+
+        df = pd.read_pickle(filepath, **kwargs)
+
+        if columns is not None:
+
+            df = df[list(columns)]
+
+        return df
+
+    @staticmethod
+    def write(df:pd.DataFrame, filepath:str, columnar:bool=False, **kwargs)->str:
+        r"""
+        Pickle a DataFrame.
+
+        **Parameters**
+
+        - **df:** (pd.DataFrame)
+        - **filepath:** (str) pickle file path.
+        - **columnar:** (bool, default False) write a columnar pickle, see [PickleFormatter](#pickleformatter).
+        - ***kwargs:** passed to *df.to_pickle* for plain pickles, i.e. *compression*.
+
+        **Returns**
+
+        - **filepath:** (str)
+        """
+        if not columnar:
+
+            df.to_pickle(filepath, **kwargs)
+
+            return filepath
+
+        with open(filepath, 'wb') as file:
+
+            file.write(MAGIC)
+            manifest = {
+                'version': 1,
+                'labels': df.columns,
+                'index': PickleFormatter.write_segment(file, df.index),
+                'columns': [PickleFormatter.write_segment(file, df.iloc[:, position].array) for position in range(df.shape[1])],
+                'attrs': df.attrs
+            }
+            offset = file.tell()
+            file.write(pickle.dumps(manifest, protocol=5))
+            file.write(FOOTER.pack(offset, MAGIC))
+
+        return filepath
+
+    @staticmethod
+    def is_columnar(filepath:str)->bool:
+        r"""
+        True if the file is a columnar pickle.
+        """
+        with open(filepath, 'rb') as file:
+
+            return file.read(len(MAGIC)) == MAGIC
+
+    @staticmethod
+    def read_manifest(file)->dict:
+        r"""
+        Manifest of an open columnar pickle.
+        """
+        file.seek(-FOOTER.size, io.SEEK_END)
+        offset, magic = FOOTER.unpack(file.read(FOOTER.size))
+
+        if magic != MAGIC:
+
+            raise ValueError(f"{file.name} is not a complete columnar pickle")
+
+        size = file.seek(0, io.SEEK_END) - FOOTER.size - offset
+        file.seek(offset)
+
+        return pickle.loads(file.read(size))
+
+    @staticmethod
+    def read_columnar(filepath:str, columns:list=None, mmap:bool=False)->pd.DataFrame:
+        r"""
+        Read a columnar pickle, see [read](#read).
+        """
+        with open(filepath, 'rb') as file:
+
+            manifest = PickleFormatter.read_manifest(file)
+            labels = manifest['labels']
+
+            if columns is None:
+
+                positions = list(range(len(labels)))
+
+            else:
+
+                missing = [column for column in columns if column not in labels]
+
+                if missing:
+
+                    raise KeyError(f"{missing} not in {filepath}")
+
+                # All the positions of repeated labels
+                positions = list(labels.get_indexer_for(columns))
+
+            if mmap:
+
+                source = memoryview(PickleFormatter.map(file))
+
+            else:
+
+                source = file
+
+            index = PickleFormatter.read_segment(source, manifest['index'])
+            data = {
+                i: PickleFormatter.read_segment(source, manifest['columns'][position]) for i, position in enumerate(positions)
+            }
+
+        # Arrays are used as they are, not consolidated in 2D blocks
+        df = pd.DataFrame(data, index=index, copy=False)
+        df.columns = labels[positions]
+        df.attrs = manifest['attrs']
+
+        return df
+
+    @staticmethod
+    def map(file)->mmap.mmap:
+        r"""
+        Read-only memory map of an open file.
+        """
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @staticmethod
+    def write_segment(file, value)->dict:
+        r"""
+        Pickle a value with its buffers out-of-band.
+
+        **Returns**
+
+        - **segment:** (dict) offset and size of the in-band pickle (*data*) and of each buffer (*buffers*).
+        """
+        buffers = list()
+        data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        segment = {'data': PickleFormatter.write_aligned(file, data), 'buffers': list()}
+
+        for buffer in buffers:
+
+            with buffer.raw() as raw:
+
+                segment['buffers'].append(PickleFormatter.write_aligned(file, raw))
+
+        return segment
+
+    @staticmethod
+    def write_aligned(file, data)->tuple:
+        r"""
+        Write bytes at the next aligned offset.
+
+        **Returns**
+
+        - **(offset, size):** (tuple)
+        """
+        offset = file.tell()
+        padding = -offset % ALIGNMENT
+        file.write(b'\0' * padding)
+        file.write(data)
+
+        return offset + padding, len(data)
+
+    @staticmethod
+    def read_segment(source, segment:dict):
+        r"""
+        Unpickle a segment from an open file, or from a memoryview of the memory-mapped file.
+        """
+        def read(offset, size):
+
+            if isinstance(source, memoryview):
+
+                return source[offset:offset + size]
+
+            source.seek(offset)
+            # Writable buffers, so arrays are not read-only
+            buffer = bytearray(size)
+            source.readinto(buffer)
+
+            return buffer
+
+        buffers = [read(*buffer) for buffer in segment['buffers']]
+
+        return pickle.loads(read(*segment['data']), buffers=buffers)
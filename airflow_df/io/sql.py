@@ -0,0 +1,488 @@
+import io
+import os
+import threading
+import numpy as np
+import pandas as pd
+import sqlalchemy as sa
+from concurrent.futures import ThreadPoolExecutor
+
+# Bound parameters allowed by statement, multi-row VALUES inserts are split to stay below it
+MAX_PARAMETERS = {
+    'sqlite': 999,
+    'mssql': 2100
+}
+
+
+class SQLFormatter:
+    r"""
+    Reads SQL queries into DataFrames through SQLAlchemy.
+
+    Engines, and their connection pools, are kept by process and reused by all the tasks that run on it, keyed by the
+    Airflow connection id (or the SQLAlchemy URL). An engine inherited by a forked process is discarded, since pooled
+    connections can not be shared across processes.
+
+    Results are streamed with a server-side cursor where the driver supports it, and fetched by chunks with *fetchmany*.
+    Each chunk is transposed into column arrays, so the rows of a chunk are released before fetching the next one.
+
+    DataFrames are written in bulk, see [write](#write).
+
+    ```python
+    from airflow_df.io.sql import SQLFormatter
+
+    df = SQLFormatter.read("SELECT * FROM trends WHERE TIME >= :start", conn_id='historian', params={'start': 3600})
+    SQLFormatter.write(df, 'trends_copy', conn_id='historian')
+    ```
+    """
+
+    # Rows fetched at a time
+    chunksize = 10000
+    # Rows inserted at a time
+    batch_size = 10000
+    methods = ('auto', 'executemany', 'values', 'copy')
+    engines = dict()
+    lock = threading.Lock()
+
+    @staticmethod
+    def read(sql, conn_id:str=None, url:str=None, params:dict=None, chunksize:int=None, iterator:bool=False, index_col=None, **kwargs):
+        r"""
+        Read a SQL query or a table.
+
+        **Parameters**
+
+        - **sql:** (str or SQLAlchemy selectable) query, i.e. "SELECT * FROM trends WHERE TIME >= :start", or a table name.
+        - **conn_id:** (str, optional) Airflow connection id.
+        - **url:** (str, optional) SQLAlchemy URL, used when *conn_id* is not given, i.e. 'sqlite:///trends.db'.
+        - **params:** (dict, optional) bound parameters of the query.
+        - **chunksize:** (int, optional) rows fetched at a time, by default 10000.
+        - **iterator:** (bool, default False) return a generator of DataFrames with *chunksize* rows.
+        - **index_col:** (str or list, optional) columns to set as index.
+        - ***kwargs:** engine options, only used when the engine is created, i.e. *pool_size*.
+
+        **Returns**
+
+        - **df:** (pd.DataFrame or generator)
+        """
+        engine = SQLFormatter.get_engine(conn_id=conn_id, url=url, **kwargs)
+        chunks = SQLFormatter.fetch(engine, SQLFormatter.statement(sql), params, chunksize or SQLFormatter.chunksize, index_col)
+
+        if iterator:
+
+            return chunks
+
+        frames = list(chunks)
+
+        if len(frames) == 1:
+
+            return frames[0]
+
+        return pd.concat(frames, ignore_index=index_col is None)
+
+    @staticmethod
+    def fetch(engine, statement, params:dict, chunksize:int, index_col=None):
+        r"""
+        Generator of DataFrames with *chunksize* rows, the first one is yielded even if the result is empty.
+        """
+        with engine.connect() as connection:
+
+            result = connection.execution_options(stream_results=True, max_row_buffer=chunksize).execute(statement, params or dict())
+            columns = list(result.keys())
+            empty = True
+
+            while True:
+
+                rows = result.fetchmany(chunksize)
+
+                if not rows and not empty:
+
+                    break
+
+                empty = False
+                yield SQLFormatter.to_frame(rows, columns, index_col)
+
+                if len(rows) < chunksize:
+
+                    break
+
+    @staticmethod
+    def to_frame(rows:list, columns:list, index_col=None)->pd.DataFrame:
+        r"""
+        DataFrame of fetched rows, built from one array by column.
+        """
+        arrays = zip(*rows) if rows else [()] * len(columns)
+        df = pd.DataFrame({position: pd.Series(values, dtype=None if values else object) for position, values in enumerate(arrays)})
+        df.columns = columns
+
+        if index_col is not None:
+
+            df = df.set_index(index_col)
+
+        return df
+
+    @staticmethod
+    def write(df:pd.DataFrame, table:str, conn_id:str=None, url:str=None, schema:str=None, if_exists:str='append', method:str='auto', batch_size:int=None, partitions:int=1, upsert:list=None, index:bool=False, **kwargs)->int:
+        r"""
+        Write a DataFrame into a table in bulk.
+
+        **Parameters**
+
+        - **df:** (pd.DataFrame)
+        - **table:** (str) table name, it is created from the DataFrame dtypes if it does not exist.
+        - **conn_id:** (str, optional) Airflow connection id.
+        - **url:** (str, optional) SQLAlchemy URL, used when *conn_id* is not given.
+        - **schema:** (str, optional) table schema.
+        - **if_exists:** (str, default 'append') 'append', 'replace' (drop and create the table) or 'fail'.
+        - **method:** (str, default 'auto') 'executemany' (one statement, the driver loops over a batch of rows),
+        'values' (multi-row VALUES statements), 'copy' (CSV buffer loaded with COPY, PostgreSQL only) or 'auto' (COPY on
+        PostgreSQL with psycopg2, otherwise executemany).
+        - **batch_size:** (int, optional) rows sent at a time, by default 10000.
+        - **partitions:** (int, default 1) row partitions written in parallel threads, each one with its own connection
+        and transaction.
+        - **upsert:** (list, optional) key columns, rows whose keys are already in the table are updated instead of
+        inserted, in one transaction. A new table gets a primary key on them.
+        - **index:** (bool, default False) write the index as columns.
+        - ***kwargs:** engine options, only used when the engine is created.
+
+        **Returns**
+
+        - **rows:** (int) rows written.
+        """
+        if method not in SQLFormatter.methods:
+
+            raise ValueError(f"method must be one of {list(SQLFormatter.methods)}, got {method!r}")
+
+        if if_exists not in ('append', 'replace', 'fail'):
+
+            raise ValueError(f"if_exists must be 'append', 'replace' or 'fail', got {if_exists!r}")
+
+        if index:
+
+            df = df.reset_index()
+
+        upsert = [upsert] if isinstance(upsert, str) else upsert
+        engine = SQLFormatter.get_engine(conn_id=conn_id, url=url, **kwargs)
+        dialect = engine.dialect
+
+        if method == 'auto':
+
+            method = 'copy' if dialect.name == 'postgresql' and dialect.driver == 'psycopg2' and not upsert else 'executemany'
+
+        if method == 'copy' and (dialect.name != 'postgresql' or upsert):
+
+            raise ValueError("COPY is only available on PostgreSQL and it can not upsert")
+
+        if upsert and partitions > 1:
+
+            raise ValueError("An upsert is written in one transaction, partitions must be 1")
+
+        with engine.begin() as connection:
+
+            sql_table = SQLFormatter.create_table(connection, df, table, schema, if_exists, upsert)
+
+        batch_size = batch_size or SQLFormatter.batch_size
+        bounds = np.linspace(0, len(df), max(min(partitions, len(df)), 1) + 1).astype(int)
+        parts = [df.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+        def write(part):
+
+            with engine.begin() as connection:
+
+                return SQLFormatter.insert(connection, part, sql_table, method, batch_size, upsert)
+
+        if len(parts) == 1:
+
+            return write(parts[0])
+
+        with ThreadPoolExecutor(max_workers=len(parts)) as executor:
+
+            return sum(executor.map(write, parts))
+
+    @staticmethod
+    def create_table(connection, df:pd.DataFrame, table:str, schema:str=None, if_exists:str='append', keys:list=None)->sa.Table:
+        r"""
+        Table of a DataFrame, it is created from its dtypes when it does not exist.
+        """
+        metadata = sa.MetaData()
+        exists = sa.inspect(connection).has_table(table, schema=schema)
+
+        if exists and if_exists == 'fail':
+
+            raise ValueError(f"Table {table!r} already exists")
+
+        if exists and if_exists == 'append':
+
+            return sa.Table(table, metadata, *[sa.Column(str(column)) for column in df.columns], schema=schema)
+
+        columns = [
+            sa.Column(str(column), SQLFormatter.sql_type(df[column].dtype), primary_key=bool(keys) and column in keys)
+            for column in df.columns
+        ]
+        sql_table = sa.Table(table, metadata, *columns, schema=schema)
+
+        if exists:
+
+            sql_table.drop(connection)
+
+        sql_table.create(connection)
+
+        return sql_table
+
+    @staticmethod
+    def sql_type(dtype):
+        r"""
+        SQLAlchemy type of a column dtype.
+        """
+        if pd.api.types.is_bool_dtype(dtype):
+
+            return sa.Boolean()
+
+        if pd.api.types.is_integer_dtype(dtype):
+
+            return sa.BigInteger()
+
+        if pd.api.types.is_float_dtype(dtype):
+
+            return sa.Float(precision=53)
+
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+
+            return sa.DateTime(timezone=getattr(dtype, 'tz', None) is not None)
+
+        return sa.Text()
+
+    @staticmethod
+    def insert(connection, df:pd.DataFrame, table:sa.Table, method:str, batch_size:int, upsert:list=None)->int:
+        r"""
+        Insert the rows of a DataFrame by batches, in the transaction of *connection*.
+        """
+        if not len(df):
+
+            return 0
+
+        if method == 'copy':
+
+            return SQLFormatter.copy(connection, df, table)
+
+        dialect = connection.dialect
+        preparer = dialect.identifier_preparer
+        columns = ', '.join(preparer.quote(column.name) for column in table.columns)
+        conflict = SQLFormatter.conflict(dialect, table, upsert) if upsert else ''
+        head = f"INSERT INTO {preparer.format_table(table)} ({columns}) VALUES "
+        row = f"({', '.join(SQLFormatter.placeholders(dialect, len(table.columns)))})"
+        values = SQLFormatter.to_columns(df)
+
+        if method == 'values':
+
+            limit = MAX_PARAMETERS.get(dialect.name, 32767) // len(table.columns)
+            batch_size = max(min(batch_size, limit), 1)
+
+        for start in range(0, len(df), batch_size):
+
+            rows = list(zip(*[column[start:start + batch_size] for column in values]))
+
+            if method == 'values':
+
+                parameters = [value for item in rows for value in item]
+                statement = head + ', '.join(
+                    f"({', '.join(SQLFormatter.placeholders(dialect, len(table.columns), offset=position * len(table.columns)))})"
+                    for position in range(len(rows))
+                )
+                connection.exec_driver_sql(statement + conflict, SQLFormatter.bind(dialect, parameters))
+
+            else:
+
+                connection.exec_driver_sql(head + row + conflict, [SQLFormatter.bind(dialect, item) for item in rows])
+
+        return len(df)
+
+    @staticmethod
+    def copy(connection, df:pd.DataFrame, table:sa.Table)->int:
+        r"""
+        Load a DataFrame through a CSV buffer with the PostgreSQL COPY command.
+        """
+        preparer = connection.dialect.identifier_preparer
+        columns = ', '.join(preparer.quote(column.name) for column in table.columns)
+        buffer = io.StringIO()
+        df.to_csv(buffer, index=False, header=False)
+        buffer.seek(0)
+
+        with connection.connection.cursor() as cursor:
+
+            cursor.copy_expert(f"COPY {preparer.format_table(table)} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+        return len(df)
+
+    @staticmethod
+    def conflict(dialect, table:sa.Table, keys:list)->str:
+        r"""
+        Clause that updates the rows whose keys already exist.
+        """
+        preparer = dialect.identifier_preparer
+        updates = [preparer.quote(column.name) for column in table.columns if column.name not in keys]
+
+        if dialect.name in ('mysql', 'mariadb'):
+
+            return ' ON DUPLICATE KEY UPDATE ' + ', '.join(f"{column} = VALUES({column})" for column in updates)
+
+        if dialect.name not in ('sqlite', 'postgresql'):
+
+            raise ValueError(f"upsert is not available on {dialect.name}")
+
+        target = ', '.join(preparer.quote(key) for key in keys)
+
+        if not updates:
+
+            return f" ON CONFLICT ({target}) DO NOTHING"
+
+        return f" ON CONFLICT ({target}) DO UPDATE SET " + ', '.join(f"{column} = excluded.{column}" for column in updates)
+
+    @staticmethod
+    def placeholders(dialect, size:int, offset:int=0)->list:
+        r"""
+        Bound parameter markers in the paramstyle of the driver.
+        """
+        style = dialect.paramstyle
+
+        if style == 'qmark':
+
+            return ['?'] * size
+
+        if style == 'format':
+
+            return ['%s'] * size
+
+        if style == 'numeric':
+
+            return [f":{position + 1}" for position in range(offset, offset + size)]
+
+        if style == 'named':
+
+            return [f":p{position}" for position in range(offset, offset + size)]
+
+        return [f"%(p{position})s" for position in range(offset, offset + size)]
+
+    @staticmethod
+    def bind(dialect, values):
+        r"""
+        Parameters of a statement, a dict for named paramstyles.
+        """
+        if dialect.paramstyle in ('named', 'pyformat'):
+
+            return {f"p{position}": value for position, value in enumerate(values)}
+
+        return tuple(values)
+
+    @staticmethod
+    def to_columns(df:pd.DataFrame)->list:
+        r"""
+        Values of each column as Python objects, missing values are None.
+        """
+        columns = list()
+
+        for position in range(df.shape[1]):
+
+            values = df.iloc[:, position]
+            missing = values.isna().to_numpy()
+
+            if pd.api.types.is_datetime64_any_dtype(values.dtype):
+
+                objects = values.array.to_pydatetime()
+
+            else:
+
+                objects = values.astype(object).to_numpy()
+
+            if missing.any():
+
+                objects = objects.copy()
+                objects[missing] = None
+
+            columns.append(objects.tolist())
+
+        return columns
+
+    @staticmethod
+    def statement(sql):
+        r"""
+        Executable statement of a query, a selectable or a table name.
+        """
+        if not isinstance(sql, str):
+
+            return sql
+
+        if len(sql.split()) == 1:
+
+            return sa.select(sa.text('*')).select_from(sa.table(sql))
+
+        return sa.text(sql)
+
+    @classmethod
+    def get_engine(cls, conn_id:str=None, url:str=None, **kwargs)->sa.engine.Engine:
+        r"""
+        Engine of the current process for an Airflow connection id or a SQLAlchemy URL, it is created on first use.
+        """
+        if conn_id is None and url is None:
+
+            raise ValueError("conn_id or url is required")
+
+        key = conn_id if conn_id is not None else str(url)
+        pid = os.getpid()
+
+        with cls.lock:
+
+            engine, owner = cls.engines.get(key, (None, None))
+
+            if engine is not None and owner != pid:
+
+                # Inherited from the parent process, its pooled connections belong to the parent
+                engine.dispose(close=False)
+                engine = None
+
+            if engine is None:
+
+                engine = sa.create_engine(cls.get_url(conn_id) if conn_id is not None else url, pool_pre_ping=True, **kwargs)
+                cls.engines[key] = (engine, pid)
+
+        return engine
+
+    @staticmethod
+    def get_url(conn_id:str)->str:
+        r"""
+        SQLAlchemy URL of an Airflow connection.
+        """
+        from airflow.hooks.base import BaseHook
+
+        connection = BaseHook.get_connection(conn_id)
+
+        try:
+
+            hook = connection.get_hook()
+
+        except Exception:
+
+            hook = None
+
+        if hook is not None and hasattr(hook, 'get_uri'):
+
+            return hook.get_uri()
+
+        uri = connection.get_uri()
+
+        # Airflow keeps the 'postgres' scheme, SQLAlchemy only knows 'postgresql'
+        return 'postgresql' + uri[len('postgres'):] if uri.startswith('postgres://') else uri
+
+    @classmethod
+    def dispose(cls, key:str=None):
+        r"""
+        Close the pooled connections of an engine, by default of all of them.
+        """
+        with cls.lock:
+
+            keys = list(cls.engines) if key is None else [key]
+
+            for key in keys:
+
+                engine, _ = cls.engines.pop(key, (None, None))
+
+                if engine is not None:
+
+                    engine.dispose()
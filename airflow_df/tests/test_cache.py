@@ -0,0 +1,123 @@
+import os
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from ..io.olga.tpl import TPL
+from ..io.olga.cache import TPLCache
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class TestTPLCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.filepath = os.path.join("data", "olga", "SF_SH_D0_R0.tpl")
+        self.path = tempfile.mkdtemp()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+
+        shutil.rmtree(self.path, ignore_errors=True)
+        return super().tearDown()
+
+    def test_read(self):
+
+        expected = TPL().read(self.filepath)
+        cache = TPLCache(self.path)
+
+        with self.subTest(f"Miss"):
+
+            df = cache.read(self.filepath)
+            self.assertTrue(df.equals(expected))
+            self.assertEqual(sorted(os.listdir(self.path)), sorted([TPLCache.hash(self.filepath), 'index.json', 'index.lock']))
+
+        with self.subTest(f"Hit"):
+
+            tpl = TPL()
+            df = cache.read(self.filepath, tpl=tpl)
+            self.assertTrue(df.equals(expected))
+            self.assertEqual(df.attrs, expected.attrs)
+            self.assertEqual(tpl.info.serialize(), expected.attrs['info'])
+            self.assertEqual(tpl.profile.x.shape, (53,))
+
+        with self.subTest(f"Fingerprint"):
+
+            index = cache.get_index()
+            fingerprint = index['files'][os.path.abspath(self.filepath)]
+            self.assertEqual(fingerprint['hash'], TPLCache.hash(self.filepath))
+            self.assertEqual(fingerprint['size'], os.path.getsize(self.filepath))
+
+    def test_evict(self):
+
+        other = os.path.join(self.path, "other.tpl")
+
+        with open(self.filepath, 'r') as src, open(other, 'w') as dst:
+
+            dst.write(src.read().replace("'Supe'", "'Other'"))
+
+        cache = TPLCache(os.path.join(self.path, "cache"))
+        cache.read(self.filepath)
+        size = cache.get_index()['entries'][TPLCache.hash(self.filepath)]['size']
+        # Room for one entry only
+        cache.max_size = size * 3 // 2
+        cache.read(other)
+        entries = cache.get_index()['entries']
+
+        with self.subTest(f"Only the last entry"):
+
+            self.assertEqual(list(entries), [TPLCache.hash(other)])
+
+        with self.subTest(f"Evicted files are removed"):
+
+            self.assertFalse(os.path.exists(os.path.join(cache.path, TPLCache.hash(self.filepath))))
+
+        with self.subTest(f"Entries missing from the index are evicted"):
+
+            # i.e. an index update lost before the file lock
+            cache.read(self.filepath)
+            cache.set_index({'files': dict(), 'entries': dict()})
+            cache.read(other)
+            self.assertEqual(list(cache.get_index()['entries']), [TPLCache.hash(other)])
+            self.assertFalse(os.path.exists(os.path.join(cache.path, TPLCache.hash(self.filepath))))
+
+    def test_concurrent_reads(self):
+
+        filepaths = list()
+
+        for number in range(4):
+
+            filepath = os.path.join(self.path, f"case_{number}.tpl")
+
+            with open(self.filepath, 'r') as src, open(filepath, 'w') as dst:
+
+                dst.write(src.read().replace("'Supe'", f"'Case {number}'"))
+
+            filepaths.append(filepath)
+
+        cache = TPLCache(os.path.join(self.path, "cache"))
+
+        with ProcessPoolExecutor(max_workers=4) as executor:
+
+            list(executor.map(cache.read, filepaths))
+
+        self.assertEqual(sorted(cache.get_index()['entries']), sorted(TPLCache.hash(filepath) for filepath in filepaths))
+
+    def test_corrupt_entry(self):
+
+        cache = TPLCache(self.path)
+        folder = os.path.join(self.path, TPLCache.hash(self.filepath))
+        os.makedirs(folder)
+
+        with open(os.path.join(folder, TPLCache.meta_file), 'w') as file:
+
+            file.write('{')
+
+        df = cache.read(self.filepath)
+        self.assertTrue(df.equals(TPL().read(self.filepath)))
+        self.assertIsNotNone(cache.get(TPLCache.hash(self.filepath)))
@@ -0,0 +1,79 @@
+import os
+import unittest
+from ..io.olga import Genkey
+
+
+class TestGenkey(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.filepath = os.path.join("data", "olga", "SF_SH_D0_R0.genkey")
+        self.genkey = Genkey().read(self.filepath)
+        return super().setUp()
+
+    def test_records(self):
+
+        with self.subTest(f"Is a dict"):
+
+            self.assertIsInstance(self.genkey, dict)
+            self.assertEqual(len(self.genkey['PIPE']), 26)
+            self.assertEqual(len(self.genkey['CONNECTION']), 7)
+
+        with self.subTest(f"Continuations and comments"):
+
+            options = self.genkey['OPTIONS'][0]['parameters']
+            self.assertEqual(options['FLOWMODEL'], 'OLGAHD')
+            self.assertEqual(len(self.genkey.records), 103)
+            self.assertTrue(all(not record['keyword'].startswith('!') for record in self.genkey.records))
+
+        with self.subTest(f"Values and units"):
+
+            integration = self.genkey['INTEGRATION'][0]['parameters']
+            self.assertEqual(integration['MINDT'], {'value': 0.02, 'unit': 's'})
+            self.assertEqual(integration['MAXLAGFACT'], 0)
+            case = self.genkey['CASE'][0]['parameters']
+            self.assertEqual(case['AUTHOR'], 'Jesus E Varajas')
+            self.assertEqual(case['DATE'], '02/09/2022')
+
+        with self.subTest(f"Tuples"):
+
+            wall = self.genkey.find('WALL', 'WALL-1')['parameters']
+            self.assertEqual(wall['THICKNESS'], {'value': [1, 1.5875, 1], 'unit': 'cm'})
+            self.assertEqual(wall['MATERIAL'], ['Fibra de vidrio', 'Stainless Steel', 'Concrete Coating HD'])
+            connection = self.genkey['CONNECTION'][0]['parameters']
+            self.assertEqual(connection['TERMINALS'], ['FLOWPATH_1 INLET', 'NODE_1 FLOWTERM_1'])
+
+    def test_index(self):
+
+        with self.subTest(f"By label"):
+
+            curve = self.genkey.find('CENTPUMPCURVE', 'C-2')
+            self.assertIs(curve, self.genkey.index['CENTPUMPCURVE']['C-2'])
+            self.assertEqual(curve['parameters']['SPEED']['value'], [3420] * 8)
+            self.assertEqual(curve['parameters']['HEAD']['unit'], 'm')
+            self.assertIsNone(self.genkey.find('CENTPUMPCURVE', 'C-9'))
+
+        with self.subTest(f"By network component"):
+
+            pipe = self.genkey.find('PIPE', 'PIPE-7')
+            self.assertEqual(pipe['component'], 'FLOWPATH_1')
+            self.assertEqual(pipe['parameters']['LENGTH'], {'value': 1026.48, 'unit': 'm'})
+            parameters = self.genkey.find('PARAMETERS', component='NODE_2')
+            self.assertEqual([record['label'] for record in parameters], ['TK-Out'])
+            self.assertEqual(self.genkey.find('NETWORKCOMPONENT', 'NODE_2')['parameters']['TYPE'], 'NODE')
+            self.assertIsNone(self.genkey.find('MATERIAL', 'Stainless Steel')['component'])
+
+    def test_parse(self):
+
+        genkey = Genkey().parse(
+            'PIPE LABEL="A!B", LENGTH=3 m ! comment\n'
+            'VALVE LABEL=V1, \\\n'
+            '    DIAMETER=(1,\\\n'
+            ' 2) in\n'
+            'ENDCASE\n'
+            'PIPE LABEL=ignored\n'
+        )
+        self.assertEqual(genkey.find('PIPE', 'A!B')['parameters']['LENGTH'], {'value': 3, 'unit': 'm'})
+        self.assertEqual(genkey.find('VALVE', 'V1')['parameters']['DIAMETER'], {'value': [1, 2], 'unit': 'in'})
+        self.assertEqual(genkey.find('VALVE', 'V1')['line'], 2)
+        self.assertEqual(len(genkey['PIPE']), 1)
@@ -0,0 +1,129 @@
+import shutil
+import tempfile
+import unittest
+import pandas as pd
+from airflow.models.taskinstance import set_current_context
+from ..helpers import Helpers
+from ..helpers.results import ResultBackend
+from ..transform import Transform
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class TestResultBackend(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.path = tempfile.mkdtemp()
+        self.df = pd.DataFrame({'a': [1.0, 2.0, 3.0], 'b': ['x', 'y', 'z']}, index=[10, 20, 30])
+        self.df.attrs['info'] = {'project': 'Supe'}
+        return super().setUp()
+
+    def tearDown(self) -> None:
+
+        shutil.rmtree(self.path, ignore_errors=True)
+        Helpers.set_result_backend(None)
+        return super().tearDown()
+
+    def test_backends(self):
+
+        for name in ('parquet', 'feather'):
+
+            with self.subTest(f"{name} round trip"):
+
+                backend = ResultBackend.get(f"{name}:{self.path}")
+                reference = backend.write(self.df)
+                self.assertTrue(ResultBackend.is_reference(reference))
+                self.assertEqual(reference['shape'], [3, 2])
+                df = ResultBackend.load(reference)
+                self.assertTrue(df.equals(self.df))
+                self.assertEqual(df.attrs, self.df.attrs)
+                self.assertEqual(list(ResultBackend.load(reference, columns=['b']).columns), ['b'])
+
+        with self.subTest(f"Unknown backend"):
+
+            with self.assertRaises(ValueError):
+
+                ResultBackend.get('hdf5')
+
+    def test_shared_memory(self):
+
+        backend = ResultBackend.get(f"shm:{self.path}")
+        df = self.df.assign(c=pd.Categorical(['u', 'v', 'u']), t=pd.date_range('2023-01-01', periods=3))
+        reference = backend.write(df, lease='run_1')
+
+        with self.subTest(f"Round trip"):
+
+            result = ResultBackend.load(reference)
+            self.assertTrue(result.equals(df))
+            self.assertEqual(result.attrs, df.attrs)
+            self.assertEqual(result['c'].dtype, 'category')
+
+        with self.subTest(f"Loaded DataFrames are copied on write"):
+
+            result.loc[0, 'a'] = 5.0
+            result['b'] *= 2
+            self.assertEqual(result.loc[0, 'a'], 5.0)
+            self.assertTrue(ResultBackend.load(reference).equals(df))
+
+        with self.subTest(f"Release a lease"):
+
+            backend.release('run_1')
+
+            with self.assertRaises(FileNotFoundError):
+
+                ResultBackend.load(reference)
+
+    def test_tasks(self):
+
+        Helpers.set_result_backend(f"parquet:{self.path}")
+        reset_index = Transform.reset_index(self.df).operator.python_callable
+
+        with self.subTest(f"Only a reference is returned"):
+
+            reference = reset_index(self.df)
+            self.assertTrue(ResultBackend.is_reference(reference))
+
+        with self.subTest(f"References are loaded by the consumer"):
+
+            rename = Transform.rename_columns(reference, columns={'index': 'i'}).operator.python_callable
+            df = ResultBackend.load(rename(reference, columns={'index': 'i'}))
+            self.assertEqual(list(df.columns), ['i', 'a', 'b'])
+
+        with self.subTest(f"Release the results of a run"):
+
+            reference = reset_index(self.df, run_id='manual_run')
+            Helpers.release_results({'run_id': 'manual_run'})
+
+            with self.assertRaises(FileNotFoundError):
+
+                ResultBackend.load(reference)
+
+        with self.subTest(f"Backend by task"):
+
+            self.assertIsInstance(reset_index(self.df, result_backend=False), pd.DataFrame)
+
+        with self.subTest(f"Tasks without **kwargs"):
+
+            context = {'run_id': 'scheduled_run'}
+            operator = Transform.convert_to_float(self.df, columns=['a']).operator
+
+            with set_current_context(context):
+
+                reference = operator.execute(context)
+
+            Helpers.release_results(context)
+
+            with self.assertRaises(FileNotFoundError):
+
+                ResultBackend.load(reference)
+
+            operator = Transform.convert_to_float(self.df, columns=['a'], result_backend=False).operator
+
+            with set_current_context(context):
+
+                self.assertIsInstance(operator.execute(context), pd.DataFrame)
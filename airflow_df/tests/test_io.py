@@ -1,9 +1,27 @@
+import numpy as np
 import pandas as pd
 import os
+import json
+import shutil
+import tempfile
 import unittest
+import sqlite3
+import contextlib
 from ..io import IO
+from ..io.csv import CSVFormatter, DtypeCache
+from ..io.memory import MemoryOptimizer
+from ..io.sql import SQLFormatter
+from ..io.formats import Formatter
+from ..io.olga import Genkey
 from airflow.decorators.base import _TaskDecorator as TaskDecorator
 
+try:
+    import pyarrow
+    import pyarrow.parquet as pq
+except ImportError:
+    pyarrow = None
+
+
 class TestIO(unittest.TestCase):
 
     def setUp(self) -> None:
@@ -44,6 +62,181 @@ class TestIO(unittest.TestCase):
             df = task(filepath, encoding='unicode_escape')
             self.assertIsInstance(df, pd.DataFrame)
 
+    def test_read_csv_many(self):
+
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path, ignore_errors=True)
+        df = pd.DataFrame({'a': range(10), 'b': [float(i) for i in range(10)]})
+
+        for i in range(3):
+
+            df.iloc[i::3].to_csv(os.path.join(path, f"part_{i}.csv"), index=False)
+
+        with self.subTest(f"Expand a directory and a glob"):
+
+            self.assertEqual(len(CSVFormatter.expand(path)), 3)
+            self.assertEqual(len(CSVFormatter.expand(os.path.join(path, "part_[01].csv"))), 2)
+            self.assertIsNone(CSVFormatter.expand(os.path.join(path, "part_0.csv")))
+
+        for executor in ('thread', 'process'):
+
+            with self.subTest(f"Read with a {executor} pool"):
+
+                result = CSVFormatter.read(path, executor=executor, max_workers=2)
+                self.assertEqual(len(result), 10)
+                self.assertEqual(sorted(result['a']), list(range(10)))
+
+        with self.subTest(f"Unknown executor"):
+
+            with self.assertRaises(ValueError):
+
+                CSVFormatter.read(path, executor='gpu', max_workers=2)
+
+    def test_csv_engine(self):
+
+        with self.subTest(f"Regex separator"):
+
+            self.assertEqual(CSVFormatter.get_engine(sep=';|,'), 'python')
+
+        with self.subTest(f"Options not supported by pyarrow"):
+
+            self.assertEqual(CSVFormatter.get_engine(nrows=10), 'c')
+            self.assertEqual(CSVFormatter.get_engine(sep=r'\s+'), 'c')
+
+        with self.subTest(f"Default options"):
+
+            self.assertIn(CSVFormatter.get_engine(), ('c', 'pyarrow'))
+
+        with self.subTest(f"Same result with the selected engine"):
+
+            filepath = os.path.join("data", "csv", "Employee Sample Data.csv")
+            expected = pd.read_csv(filepath, encoding='unicode_escape')
+            self.assertTrue(CSVFormatter.read(filepath, encoding='unicode_escape').equals(expected))
+
+        with self.subTest(f"Selected columns of given names"):
+
+            self.assertEqual(CSVFormatter.get_engine(header=None, names=['id', 'v', 'w'], usecols=['w']), 'c')
+            self.assertEqual(CSVFormatter.get_engine(usecols=lambda column: column != 'v'), 'c')
+            path = tempfile.mkdtemp()
+            self.addCleanup(shutil.rmtree, path, ignore_errors=True)
+            filepath = os.path.join(path, "values.csv")
+
+            with open(filepath, 'w') as file:
+
+                file.write("1,2,3\n4,5,6\n7,8,9\n")
+
+            result = CSVFormatter.read(filepath, header=None, names=['id', 'v', 'w'], usecols=['w'])
+            expected = pd.read_csv(filepath, header=None, names=['id', 'v', 'w'], usecols=['w'])
+            self.assertEqual(result.shape, (3, 1))
+            self.assertTrue(result.equals(expected))
+
+    def test_dtype_cache(self):
+
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path, ignore_errors=True)
+        cachepath = os.path.join(path, "dtypes.json")
+        filepath = os.path.join("data", "csv", "Employee Sample Data.csv")
+        cache = DtypeCache(cachepath)
+
+        with self.subTest(f"Dtypes are stored on the first read"):
+
+            df = CSVFormatter.read(filepath, encoding='unicode_escape', dtype_cache=cachepath)
+            key = cache.key(filepath, encoding='unicode_escape')
+            self.assertEqual(cache.get(key)['Age'], 'int64')
+
+        with self.subTest(f"Cached dtypes are used on later reads"):
+
+            dtypes = cache.load()
+            dtypes[key]['Age'] = 'float64'
+
+            with open(cachepath, 'w') as file:
+
+                json.dump(dtypes, file)
+
+            result = CSVFormatter.read(filepath, encoding='unicode_escape', dtype_cache=cachepath)
+            self.assertEqual(result['Age'].dtype, 'float64')
+            self.assertTrue((result['Age'] == df['Age']).all())
+
+        with self.subTest(f"User dtypes take precedence"):
+
+            result = CSVFormatter.read(filepath, encoding='unicode_escape', dtype_cache=cachepath, dtype={'Age': 'int32'})
+            self.assertEqual(result['Age'].dtype, 'int32')
+
+    def test_read_csv_incremental(self):
+
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path, ignore_errors=True)
+        filepath = os.path.join(path, "data.csv")
+        state = os.path.join(path, "state.json")
+        task = IO.read_csv(path, incremental=state).operator.python_callable
+
+        def read(data_interval_start):
+
+            return task(path, incremental=state, data_interval_start=data_interval_start, conf=dict())
+
+        with open(filepath, 'w') as file:
+
+            file.write("a,b\n1,2\n3,4\n5,")
+
+        with self.subTest(f"First run reads complete lines"):
+
+            self.assertEqual(read("2023-01-01T00:00:00").to_dict('list'), {'a': [1, 3], 'b': [2, 4]})
+
+        with open(filepath, 'a') as file:
+
+            file.write("6\n7,8\n")
+
+        with self.subTest(f"Next run reads the appended tail"):
+
+            self.assertEqual(read("2023-01-01T01:00:00").to_dict('list'), {'a': [5, 7], 'b': [6, 8]})
+
+        with self.subTest(f"Re-run of an interval reads the same rows"):
+
+            self.assertEqual(read("2023-01-01T01:00:00").to_dict('list'), {'a': [5, 7], 'b': [6, 8]})
+
+        with self.subTest(f"Nothing new"):
+
+            self.assertTrue(read("2023-01-01T02:00:00").empty)
+
+        with open(os.path.join(path, "other.csv"), 'w') as file:
+
+            file.write("a,b\n9,9\n")
+
+        with self.subTest(f"New files"):
+
+            self.assertEqual(read("2023-01-01T03:00:00").to_dict('list'), {'a': [9], 'b': [9]})
+
+        with open(filepath, 'w') as file:
+
+            file.write("a,b\n0,0\n")
+
+        with self.subTest(f"Rewritten files"):
+
+            self.assertEqual(read("2023-01-01T04:00:00").to_dict('list'), {'a': [0], 'b': [0]})
+
+        for options in ({'usecols': ['b', 'c']}, {'index_col': 'a'}, {'index_col': 0, 'usecols': ['a', 'c']}):
+
+            with self.subTest(f"Appended rows with {options}"):
+
+                folder = os.path.join(path, f"options_{len(os.listdir(path))}")
+                os.makedirs(folder)
+                filepath = os.path.join(folder, "data.csv")
+
+                with open(filepath, 'w') as file:
+
+                    file.write("a,b,c\n1,2,3\n4,5,6\n")
+
+                first = CSVFormatter.read(folder, incremental=state, data_interval_start="2023-01-01T00:00:00", **options)
+
+                with open(filepath, 'a') as file:
+
+                    file.write("7,8,9\n")
+
+                tail = CSVFormatter.read(folder, incremental=state, data_interval_start="2023-01-01T01:00:00", **options)
+                expected = pd.read_csv(filepath, **options)
+                result = pd.concat([first, tail], ignore_index='index_col' not in options)
+                self.assertTrue(result.equals(expected))
+
     def test_read_tpl(self):
 
         with self.subTest(f"Has read_tpl method?"):
@@ -60,4 +253,294 @@ class TestIO(unittest.TestCase):
             task = IO.read_tpl(filepath)
             task = task.operator.python_callable
             df = task(filepath)
-            self.assertIsInstance(df, pd.DataFrame)
\ No newline at end of file
+            self.assertIsInstance(df, pd.DataFrame)
+
+    def test_optimize_memory(self):
+
+        with self.subTest(f"csv"):
+
+            filepath = os.path.join("data", "csv", "Employee Sample Data.csv")
+            df = IO.read_csv.function(filepath, encoding='unicode_escape')
+            result = IO.read_csv.function(filepath, encoding='unicode_escape', optimize_memory=True)
+            self.assertEqual(result['Department'].dtype, 'category')
+            self.assertEqual(result['Full Name'].dtype, object)
+            self.assertEqual(result['Age'].dtype, np.int8)
+            self.assertTrue((result['Age'] - 30).equals((df['Age'] - 30).astype(np.int8)))
+            self.assertTrue(result.astype(df.dtypes.to_dict()).equals(df))
+            memory = result.attrs['memory']
+            self.assertEqual(memory['before'], df.memory_usage(deep=True).sum())
+            self.assertEqual(memory['saved'], memory['before'] - memory['after'])
+            self.assertGreater(memory['before'] / memory['after'], 2)
+
+        with self.subTest(f"tpl"):
+
+            filepath = os.path.join("data", "olga", "SF_SH_D0_R0.tpl")
+            df = IO.read_tpl.function(filepath)
+            result = IO.read_tpl.function(filepath, optimize_memory={'tolerance': 1e-6})
+            self.assertTrue((result.dtypes == np.float32).all())
+            np.testing.assert_allclose(result.to_numpy(), df.to_numpy(), rtol=1e-6)
+            self.assertEqual(result.attrs['info'], df.attrs['info'])
+
+        with self.subTest(f"Tolerance"):
+
+            df = pd.DataFrame({'a': [0.1, 1e-3], 'b': [1.0, 2.5], 'c': [-1, 300], 'd': [1e40, 1.0]})
+            result = MemoryOptimizer(tolerance=0).optimize(df)
+            self.assertEqual(result.dtypes.tolist(), [np.float64, np.float32, np.int16, np.float64])
+
+    def test_read_pkl(self):
+
+        df = IO.read_csv.function(os.path.join("data", "csv", "Employee Sample Data.csv"), encoding='unicode_escape')
+        df['Department'] = df['Department'].astype('category')
+        df.attrs['source'] = 'Employee Sample Data.csv'
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+
+        with self.subTest(f"Plain pickle"):
+
+            filepath = IO.to_pkl.function(df, os.path.join(folder, "plain.pkl"))
+            self.assertTrue(IO.read_pkl.function(filepath).equals(df))
+            self.assertTrue(IO.read_pkl.function(filepath, columns=['Age']).equals(df[['Age']]))
+
+        with self.subTest(f"Columnar pickle"):
+
+            filepath = IO.to_pkl.function(df, os.path.join(folder, "columnar.pkl"), columnar=True)
+            result = IO.read_pkl.function(filepath)
+            self.assertTrue(result.equals(df))
+            self.assertEqual(result.dtypes.to_dict(), df.dtypes.to_dict())
+            self.assertEqual(result.attrs, df.attrs)
+
+        with self.subTest(f"Subset of columns"):
+
+            result = IO.read_pkl.function(filepath, columns=['Age', 'Department'])
+            self.assertTrue(result.equals(df[['Age', 'Department']]))
+
+            with self.assertRaises(KeyError):
+
+                IO.read_pkl.function(filepath, columns=['Salary'])
+
+        with self.subTest(f"Memory-mapped"):
+
+            result = IO.read_pkl.function(filepath, columns=['Age'], mmap=True)
+            self.assertTrue(result.equals(df[['Age']]))
+            self.assertFalse(result['Age'].to_numpy().flags.writeable)
+
+        with self.subTest(f"Repeated column labels"):
+
+            repeated = pd.DataFrame([[1, 2.5, 'a'], [3, 4.5, 'b']], columns=['x', 'y', 'x'])
+            filepath = IO.to_pkl.function(repeated, os.path.join(folder, "repeated.pkl"), columnar=True)
+            self.assertTrue(IO.read_pkl.function(filepath).equals(repeated))
+            self.assertTrue(IO.read_pkl.function(filepath, columns=['x']).equals(repeated[['x']]))
+            self.assertTrue(IO.read_pkl.function(filepath, columns=['y', 'x']).equals(repeated[['y', 'x']]))
+
+    def test_read_sql(self):
+
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        url = f"sqlite:///{os.path.join(folder, 'trends.db')}"
+        self.addCleanup(SQLFormatter.dispose, url)
+        df = IO.read_tpl.function(os.path.join("data", "olga", "SF_SH_D0_R0.tpl"))
+        df['CASE'] = 'SF_SH_D0_R0'
+
+        with contextlib.closing(sqlite3.connect(os.path.join(folder, 'trends.db'))) as connection:
+
+            df.to_sql('trends', connection, index=False)
+
+        with self.subTest(f"Chunks"):
+
+            result = IO.read_sql.function("SELECT * FROM trends", url=url, chunksize=100)
+            pd.testing.assert_frame_equal(result, df)
+
+        with self.subTest(f"Table and parameters"):
+
+            result = IO.read_sql.function('trends', url=url)
+            pd.testing.assert_frame_equal(result, df)
+            result = IO.read_sql.function('SELECT TIME, "CASE" FROM trends WHERE TIME >= :start', url=url, params={'start': 2.5}, index_col='TIME')
+            self.assertTrue((result.index >= 2.5).all())
+            self.assertEqual(result.columns.tolist(), ['CASE'])
+
+        with self.subTest(f"Iterator"):
+
+            chunks = list(IO.read_sql.function('trends', url=url, chunksize=100, iterator=True))
+            self.assertTrue(all(len(chunk) <= 100 for chunk in chunks))
+            self.assertEqual(sum(len(chunk) for chunk in chunks), len(df))
+
+        with self.subTest(f"Empty result"):
+
+            result = IO.read_sql.function("SELECT * FROM trends WHERE TIME < 0", url=url)
+            self.assertEqual(result.columns.tolist(), df.columns.tolist())
+            self.assertEqual(len(result), 0)
+
+        with self.subTest(f"Pooled engine"):
+
+            engine = SQLFormatter.get_engine(url=url)
+            self.assertIs(SQLFormatter.get_engine(url=url), engine)
+            SQLFormatter.engines[url] = (engine, -1)
+            self.assertIsNot(SQLFormatter.get_engine(url=url), engine)
+
+    def test_to_sql(self):
+
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        url = f"sqlite:///{os.path.join(folder, 'trends.db')}"
+        self.addCleanup(SQLFormatter.dispose, url)
+        df = IO.read_tpl.function(os.path.join("data", "olga", "SF_SH_D0_R0.tpl"))
+        df['CASE'] = 'SF_SH_D0_R0'
+        df.iloc[::7, 1] = np.nan
+        df['DATE'] = (pd.Timestamp('2022-09-02') + pd.to_timedelta(df['TIME'], unit='s')).dt.floor('us')
+
+        for method in ('executemany', 'values'):
+
+            with self.subTest(f"Method {method}"):
+
+                rows = IO.to_sql.function(df, method, url=url, method=method, batch_size=100)
+                self.assertEqual(rows, len(df))
+                result = IO.read_sql.function(method, url=url)
+                result['DATE'] = pd.to_datetime(result['DATE'], format='ISO8601')
+                pd.testing.assert_frame_equal(result, df)
+
+        with self.subTest(f"Partitions"):
+
+            IO.to_sql.function(df, 'partitions', url=url, batch_size=100, partitions=3)
+            result = IO.read_sql.function("SELECT * FROM partitions ORDER BY TIME", url=url)
+            np.testing.assert_array_equal(result['TIME'], df['TIME'])
+
+        with self.subTest(f"if_exists"):
+
+            with self.assertRaises(ValueError):
+
+                IO.to_sql.function(df, 'partitions', url=url, if_exists='fail')
+
+            IO.to_sql.function(df.iloc[:10], 'partitions', url=url, if_exists='replace')
+            self.assertEqual(len(IO.read_sql.function('partitions', url=url)), 10)
+
+        with self.subTest(f"Upsert"):
+
+            keys = ['CASE', 'TIME']
+            IO.to_sql.function(df.iloc[:20], 'upsert', url=url, upsert=keys)
+            changed = df.iloc[10:30].copy()
+            changed['CASE'] = 'SF_SH_D0_R0'
+            changed.iloc[:, 1] = -1.0
+            rows = IO.to_sql.function(changed, 'upsert', url=url, upsert=keys, method='values')
+            self.assertEqual(rows, 20)
+            result = IO.read_sql.function("SELECT * FROM upsert ORDER BY TIME", url=url)
+            self.assertEqual(len(result), 30)
+            np.testing.assert_array_equal(result.iloc[10:, 1], -1.0)
+            np.testing.assert_array_equal(result.iloc[:10, 1], df.iloc[:10, 1])
+
+        with self.subTest(f"COPY"):
+
+            with self.assertRaises(ValueError):
+
+                IO.to_sql.function(df, 'copy', url=url, method='copy')
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_parquet(self):
+
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        path = os.path.join(folder, "trends")
+        df = IO.read_tpl.function(os.path.join("data", "olga", "SF_SH_D0_R0.tpl"))
+        df = pd.concat({'SF_SH_D0_R0': df, 'SF_SH_D0_R1': df}, names=['CASE', None])
+        df['DATE'] = pd.Timestamp('2022-09-02 23:59:58') + pd.to_timedelta(df['TIME'], unit='s')
+
+        with self.subTest(f"Partitions"):
+
+            IO.to_parquet.function(df, path, partition_cols=['CASE'], date='DATE', row_group_size=10)
+            partitions = sorted(os.path.relpath(root, path) for root, _, files in os.walk(path) if files)
+            self.assertEqual(partitions, [
+                os.path.join('DATE=2022-09-02', 'CASE=SF_SH_D0_R0'),
+                os.path.join('DATE=2022-09-02', 'CASE=SF_SH_D0_R1'),
+                os.path.join('DATE=2022-09-03', 'CASE=SF_SH_D0_R0'),
+                os.path.join('DATE=2022-09-03', 'CASE=SF_SH_D0_R1')
+            ])
+
+        with self.subTest(f"Row group statistics"):
+
+            filepath = next(os.path.join(root, files[0]) for root, _, files in os.walk(path) if files)
+            metadata = pq.ParquetFile(filepath).metadata
+            self.assertGreater(metadata.num_row_groups, 1)
+            time = metadata.schema.names.index('TIME')
+            self.assertTrue(all(metadata.row_group(i).column(time).statistics.has_min_max for i in range(metadata.num_row_groups)))
+
+        with self.subTest(f"Round trip"):
+
+            result = IO.read_parquet.function(path)
+            self.assertEqual(result.index.names, df.index.names)
+            self.assertEqual(result.attrs['catalog'], df.attrs['catalog'])
+            result = result.drop(columns='DATE').sort_index()
+            expected = df.drop(columns='DATE').sort_index()
+            np.testing.assert_array_equal(result.to_numpy(), expected.to_numpy())
+
+        with self.subTest(f"Filters"):
+
+            result = IO.read_parquet.function(path, columns=['TIME', 'CASE'], filters=[('CASE', '=', 'SF_SH_D0_R1'), ('TIME', '>=', 2.5)])
+            self.assertEqual(len(result), (df.loc['SF_SH_D0_R1', 'TIME'] >= 2.5).sum())
+            self.assertEqual(set(result['CASE']), {'SF_SH_D0_R1'})
+            result = IO.read_parquet.function(path, filters=[[('DATE', '=', '2022-09-02')], [('TIME', '>', 4.5)]])
+            self.assertEqual(len(result), ((df['DATE'] < '2022-09-03') | (df['TIME'] > 4.5)).sum())
+
+        with self.subTest(f"Overwrite partitions"):
+
+            IO.to_parquet.function(df.loc[['SF_SH_D0_R1']].iloc[:5], path, partition_cols=['CASE'], date='DATE', mode='overwrite_partitions')
+            result = IO.read_parquet.function(path, filters=[('CASE', '=', 'SF_SH_D0_R1')])
+            self.assertEqual(len(result), 5 + (df.loc['SF_SH_D0_R1', 'DATE'] >= '2022-09-03').sum())
+            self.assertEqual(len(IO.read_parquet.function(path, filters=[('CASE', '=', 'SF_SH_D0_R0')])), len(df.loc['SF_SH_D0_R0']))
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_read(self):
+
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        csv = os.path.join("data", "csv", "Employee Sample Data.csv")
+        tpl = os.path.join("data", "olga", "SF_SH_D0_R0.tpl")
+        genkey = os.path.join("data", "olga", "SF_SH_D0_R0.genkey")
+        df = IO.read_tpl.function(tpl)
+
+        with self.subTest(f"Sniffed formats"):
+
+            shutil.copy(csv, os.path.join(folder, "employees"))
+            shutil.copy(tpl, os.path.join(folder, "case_1"))
+            shutil.copy(tpl, os.path.join(folder, "case_2.dat"))
+            shutil.copy(genkey, os.path.join(folder, "deck"))
+            IO.to_pkl.function(df, os.path.join(folder, "checkpoint"), columnar=True)
+            df.to_feather(os.path.join(folder, "trends"))
+            expected = {
+                'employees': 'csv', 'case_1': 'tpl', 'case_2.dat': 'tpl', 'deck': 'genkey', 'checkpoint': 'pkl',
+                'trends': 'feather'
+            }
+            formats = {name: Formatter.detect(os.path.join(folder, name)).name for name in expected}
+            self.assertEqual(formats, expected)
+
+        with self.subTest(f"One file"):
+
+            self.assertTrue(IO.read.function(os.path.join(folder, "case_1")).equals(df))
+            self.assertTrue(IO.read.function(os.path.join(folder, "checkpoint")).equals(df))
+            self.assertIsInstance(IO.read.function(os.path.join(folder, "deck")), Genkey)
+            employees = IO.read.function(os.path.join(folder, "employees"), encoding='unicode_escape')
+            self.assertTrue(employees.equals(IO.read_csv.function(csv, encoding='unicode_escape')))
+            self.assertIsInstance(IO.read.function(os.path.join("data", "csv", "Employee Sample Data"), encoding='unicode_escape'), pd.DataFrame)
+
+        with self.subTest(f"Mixed folder"):
+
+            results = IO.read.function(folder, options={'csv': {'encoding': 'unicode_escape'}, 'tpl': {'max_workers': 1}})
+            self.assertEqual(set(results), {'csv', 'tpl', 'genkey', 'pkl', 'feather'})
+            self.assertEqual(results['tpl'].index.get_level_values('CASE').unique().tolist(), ['case_1', 'case_2'])
+
+        with self.subTest(f"Parquet dataset"):
+
+            path = IO.to_parquet.function(df.assign(CASE='SF_SH_D0_R0'), os.path.join(folder, "dataset"), partition_cols=['CASE'])
+            self.assertEqual(Formatter.detect(path).name, 'parquet')
+            self.assertEqual(len(IO.read.function(path)), len(df))
+
+        with self.subTest(f"Forced and unknown formats"):
+
+            self.assertIsInstance(IO.read.function(os.path.join(folder, "employees"), format='csv', encoding='unicode_escape'), pd.DataFrame)
+            unknown = os.path.join(folder, "unknown")
+
+            with open(unknown, 'wb') as file:
+
+                file.write(b'\x00\x01\x02')
+
+            with self.assertRaises(ValueError):
+
+                IO.read.function(unknown)
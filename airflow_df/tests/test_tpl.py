@@ -1,6 +1,9 @@
+import pandas as pd
 import os
+import shutil
+import tempfile
 import unittest
-from ..io.olga.tpl import TPL
+from ..io.olga.tpl import TPL, TPLMap
 
 class TestTPL(unittest.TestCase):
 
@@ -160,8 +163,250 @@ TIME SERIES  ' (S)  '
 
         tpl.read_raw_file(filepath=self.filepath)
 
-        tpl.set_profile()      
+        tpl.set_profile()
+
+        with self.subTest(f"Same number of points in x and y"):
+
+            self.assertEqual(tpl.profile.x.shape, (53,))
+            self.assertEqual(tpl.profile.y.shape, (53,))
+
+        with self.subTest(f"First and last points"):
+
+            self.assertEqual(tpl.profile.x[-1], 1.4933800000000001e+003)
+            self.assertEqual(tpl.profile.y[10], -3.5)
+
+    def test_columns(self):
+
+        tpl = TPL()
+
+        tpl.read_raw_file(filepath=self.filepath)
+
+        tpl.set_columns()
+
+        with self.subTest(f"Catalog length"):
+
+            self.assertEqual(len(tpl.columns), 18)
+
+        with self.subTest(f"Catalog line"):
+
+            expected = {
+                'name': 'PVALVE_V-OUT',
+                'variable': 'PVALVE',
+                'element': 'CHOKE:',
+                'label': 'V-OUT',
+                'unit': '(PA)',
+                'description': 'Valve pressure'
+            }
+
+            self.assertEqual(tpl.columns.serialize()[10], expected)
+
+        with self.subTest(f"Time unit"):
+
+            self.assertEqual(tpl.columns.time_unit, '(S)')
 
     def test_data_structure(self):
 
-        pass
\ No newline at end of file
+        tpl = TPL()
+
+        df = tpl.read(filepath=self.filepath)
+
+        with self.subTest(f"Shape"):
+
+            self.assertEqual(df.shape, (51, 19))
+
+        with self.subTest(f"Columns"):
+
+            self.assertEqual(list(df.columns[:3]), ['TIME', 'KAPPA_POS-1378M', 'PT_POS-1378M'])
+
+        with self.subTest(f"Float64 matrix"):
+
+            self.assertTrue((df.dtypes == 'float64').all())
+
+        with self.subTest(f"Values"):
+
+            self.assertEqual(df['TIME'].iloc[-1], 5.017001)
+            self.assertEqual(df['PT_POS-1378M'].iloc[0], 3.609431e+005)
+
+        with self.subTest(f"Same result parsing the raw file"):
+
+            raw = TPL()
+            raw.read_raw_file(filepath=self.filepath)
+            raw.set_content()
+            self.assertTrue((raw.content.values == df.values).all())
+
+        with self.subTest(f"Metadata"):
+
+            self.assertEqual(df.attrs['info'], tpl.info.serialize())
+            self.assertEqual(len(df.attrs['catalog']), 18)
+
+        with self.subTest(f"Malformed values are not truncated"):
+
+            folder = tempfile.mkdtemp()
+            self.addCleanup(shutil.rmtree, folder)
+            filepath = os.path.join(folder, "malformed.tpl")
+
+            with open(self.filepath) as file:
+
+                text = file.read()
+
+            with open(filepath, 'w') as file:
+
+                # The values before the bad token fill whole rows
+                file.write(text.replace('1.262576e-001 ', '1.262576e-0x1 ', 1))
+
+            with self.assertRaises(ValueError):
+
+                TPL().read(filepath=filepath)
+
+            with self.assertRaises(ValueError):
+
+                list(TPL().read(filepath=filepath, chunksize=20))
+
+    def test_read_chunks(self):
+
+        df = TPL().read(filepath=self.filepath)
+
+        with self.subTest(f"Iterate by chunksize"):
+
+            chunks = list(TPL().read(filepath=self.filepath, chunksize=20))
+            self.assertEqual([len(chunk) for chunk in chunks], [20, 20, 11])
+            self.assertTrue(pd.concat(chunks).equals(df))
+
+        with self.subTest(f"Get chunks"):
+
+            with TPL().read(filepath=self.filepath, iterator=True) as reader:
+
+                chunk = reader.get_chunk(5)
+                self.assertEqual(list(chunk.index), [0, 1, 2, 3, 4])
+                self.assertEqual(len(reader.get_chunk()), 46)
+                self.assertEqual(reader.tpl.info.branch, 'PIPELINE')
+
+    def test_memory_map(self):
+
+        df = TPL().read(filepath=self.filepath)
+
+        with TPLMap(self.filepath, step=8) as tpl:
+
+            with self.subTest(f"Sparse index"):
+
+                self.assertEqual(tpl.nrows, 51)
+                self.assertEqual(len(tpl.offsets), 7)
+                self.assertTrue((tpl.times == df['TIME'].values[::8]).all())
+
+            with self.subTest(f"Rows by position"):
+
+                self.assertTrue(tpl.rows(10, 20).equals(df.iloc[10:20]))
+
+            with self.subTest(f"Time window"):
+
+                expected = df[(df['TIME'] >= 1.0) & (df['TIME'] <= 2.0)]
+                self.assertTrue(tpl.window(1.0, 2.0).equals(expected))
+                self.assertTrue(tpl.window(4.5, None).equals(df[df['TIME'] >= 4.5]))
+
+        with self.subTest(f"Read a window"):
+
+            self.assertTrue(TPL().read(filepath=self.filepath, window=(1.0, 2.0)).equals(expected))
+
+        with self.subTest(f"Trailing blank lines"):
+
+            folder = tempfile.mkdtemp()
+            self.addCleanup(shutil.rmtree, folder)
+            filepath = os.path.join(folder, "blank.tpl")
+            shutil.copy(self.filepath, filepath)
+
+            with open(filepath, 'ab') as file:
+
+                file.write(b"\r\n  \r\n")
+
+            for step in (1, 8, 51):
+
+                with TPLMap(filepath, step=step) as tpl:
+
+                    self.assertEqual(tpl.nrows, 51)
+                    self.assertTrue(tpl.rows().equals(df))
+                    self.assertTrue(tpl.window(4.5, None).equals(df[df['TIME'] >= 4.5]))
+
+    def test_usecols(self):
+
+        df = TPL().read(filepath=self.filepath)
+
+        with self.subTest(f"By variable"):
+
+            result = TPL().read(filepath=self.filepath, usecols=['PT', 'GT'])
+            self.assertEqual(list(result.columns), ['TIME', 'PT_POS-1378M', 'GT_POS-1378M'])
+            self.assertTrue(result.equals(df[result.columns]))
+            self.assertEqual(len(result.attrs['catalog']), 2)
+
+        with self.subTest(f"By element type"):
+
+            result = TPL().read(filepath=self.filepath, usecols='LEAK:')
+            self.assertEqual(list(result.columns), ['TIME', 'ACMLK_LEAK', 'GTLEAK_LEAK', 'PTLKUP_LEAK'])
+
+        with self.subTest(f"By label"):
+
+            result = TPL().read(filepath=self.filepath, usecols='V-IN')
+            self.assertEqual(list(result.columns), ['TIME', 'PVALVE_V-IN', 'VALVOP_V-IN'])
+
+        with self.subTest(f"By fields and callable"):
+
+            usecols = [{'variable': 'PVALVE', 'label': 'V-OUT'}, lambda column: column['unit'] == '(KG)']
+            result = TPL().read(filepath=self.filepath, usecols=usecols)
+            self.assertEqual(list(result.columns), ['TIME', 'ACMLK_LEAK', 'PVALVE_V-OUT'])
+
+        with self.subTest(f"Chunks and windows"):
+
+            chunks = list(TPL().read(filepath=self.filepath, chunksize=20, usecols='PT'))
+            self.assertTrue(pd.concat(chunks).equals(df[['TIME', 'PT_POS-1378M']]))
+            result = TPL().read(filepath=self.filepath, window=(1.0, 2.0), usecols='PT')
+            self.assertEqual(list(result.columns), ['TIME', 'PT_POS-1378M'])
+
+        with self.subTest(f"Same parser read again"):
+
+            tpl = TPL()
+            self.assertEqual(list(tpl.read(filepath=self.filepath, usecols='PT').columns), ['TIME', 'PT_POS-1378M'])
+            self.assertTrue(tpl.read(filepath=self.filepath).equals(df))
+            self.assertEqual(list(tpl.read(filepath=self.filepath, usecols='GT').columns), ['TIME', 'GT_POS-1378M'])
+            self.assertEqual(len(tpl.columns.catalog), df.shape[1] - 1)
+
+        with self.subTest(f"Unknown variable"):
+
+            with self.assertRaises(ValueError):
+
+                TPL().read(filepath=self.filepath, usecols='XYZ')
+
+    def test_read_cases(self):
+
+        from ..io.olga import OlgaFormatter
+
+        df = TPL().read(filepath=self.filepath)
+        filepath = os.path.join("data", "*", "*.tpl")
+
+        with self.subTest(f"Concatenated with a case key"):
+
+            result = OlgaFormatter.read(filepath, max_workers=2)
+            self.assertEqual(list(result.index.unique('CASE')), ['SF_SH_D0_R0', 'Example1'])
+            self.assertTrue(result.loc['SF_SH_D0_R0'].equals(df))
+            self.assertEqual(result.attrs['info']['Example1'], df.attrs['info'])
+
+        with self.subTest(f"Dict by case"):
+
+            result = OlgaFormatter.read(os.path.join("data", "olga"), concat=False, max_workers=1, usecols='PT')
+            self.assertEqual(list(result), ['SF_SH_D0_R0'])
+            self.assertEqual(list(result['SF_SH_D0_R0'].columns), ['TIME', 'PT_POS-1378M'])
+
+        with self.subTest(f"Repeated file names"):
+
+            with tempfile.TemporaryDirectory() as folder:
+
+                for name in ('D0', 'D1'):
+
+                    os.makedirs(os.path.join(folder, name))
+                    shutil.copy(self.filepath, os.path.join(folder, name, 'case.tpl'))
+
+                result = OlgaFormatter.read(os.path.join(folder, '*', '*.tpl'), max_workers=1, usecols='PT')
+                self.assertEqual(list(result.index.unique('CASE')), ['D0/case', 'D1/case'])
+                self.assertEqual(len(result), 2 * len(df))
+
+                with self.assertRaises(ValueError):
+
+                    OlgaFormatter.case_names([self.filepath, self.filepath])
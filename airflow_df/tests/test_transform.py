@@ -0,0 +1,325 @@
+import os
+import unittest
+import numpy as np
+import pandas as pd
+from ..transform import Transform
+from ..transform.pipeline import Pipeline, Exclude
+from ..transform.resample import StreamResampler
+from ..transform.interpolate import GridInterpolator
+from ..io.olga import TPL, OlgaFormatter
+
+
+class TestTransform(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.df = pd.DataFrame(
+            np.arange(12, dtype=float).reshape(3, 4),
+            columns=['a', 'b', 'c', 'd'],
+            index=pd.date_range('2023-06-07', periods=3, freq='s')
+        )
+        return super().setUp()
+
+    def test_pipeline_optimize(self):
+
+        with self.subTest(f"Merge renames"):
+
+            pipeline = Pipeline().rename_columns(columns={'a': 'x'}).rename_columns(columns={'x': 'y', 'b': 'z'}).optimize()
+            self.assertEqual(pipeline.serialize(), [Pipeline.step('rename_columns', kwargs={'columns': {'a': 'y', 'x': 'y', 'b': 'z'}})])
+
+        with self.subTest(f"Remove no-op renames"):
+
+            pipeline = Pipeline().rename_columns(columns=dict()).reset_index().optimize()
+            self.assertEqual([step['name'] for step in pipeline.steps], ['reset_index'])
+
+        with self.subTest(f"Push drops ahead of renames"):
+
+            pipeline = (
+                Pipeline()
+                .keep_columns(columns='d')
+                .rename_columns(columns={'a': 'x'})
+                .keep_columns(columns=['x', 'b'])
+                .optimize()
+            )
+            self.assertEqual(pipeline.serialize(), [
+                Pipeline.step('keep_columns', kwargs={'columns': ['d', 'a', 'b']}),
+                Pipeline.step('rename_columns', kwargs={'columns': {'a': 'x'}})
+            ])
+
+        with self.subTest(f"Drops stay behind barriers"):
+
+            pipeline = Pipeline().reset_index().keep_columns(columns=['index']).optimize()
+            self.assertEqual([step['name'] for step in pipeline.steps], ['reset_index', 'keep_columns'])
+
+    def test_run_pipeline(self):
+
+        pipeline = (
+            Transform.Pipeline()
+            .rename_columns(columns={'a': 'x'})
+            .rename_columns(columns={'b': 'y'})
+            .keep_columns(columns=['c', 'y'])
+            .reset_index()
+        )
+        expected = self.df.rename(columns={'a': 'x', 'b': 'y'}).drop(columns=['c', 'y']).reset_index()
+
+        with self.subTest(f"Optimized"):
+
+            df = Transform.run_pipeline.function(self.df, pipeline=pipeline)
+            self.assertTrue(df.equals(expected))
+
+        with self.subTest(f"Serialized steps"):
+
+            df = Transform.run_pipeline.function(self.df, pipeline=pipeline.serialize(), optimize=False)
+            self.assertTrue(df.equals(expected))
+            self.assertEqual(list(self.df.columns), ['a', 'b', 'c', 'd'])
+
+        with self.subTest(f"Unknown operation"):
+
+            with self.assertRaises(ValueError):
+
+                Transform.run_pipeline.function(self.df, pipeline=Pipeline().explode())
+
+    def test_pushdown(self):
+
+        with self.subTest(f"Plan"):
+
+            pipeline = (
+                Pipeline()
+                .read_csv(filepath='data.csv')
+                .keep_columns(columns=['a'])
+                .filter_rows("b > 0")
+                .keep_columns(columns=['b'])
+                .reset_index()
+                .optimize()
+            )
+            self.assertEqual(pipeline.serialize(), [
+                Pipeline.step('read_csv', kwargs={'filepath': 'data.csv', 'usecols': Exclude(['a']), 'where': "b > 0"}),
+                Pipeline.step('keep_columns', kwargs={'columns': ['b']}),
+                Pipeline.step('reset_index')
+            ])
+
+        with self.subTest(f"csv"):
+
+            filepath = os.path.join("data", "csv", "Employee Sample Data.csv")
+            df = pd.read_csv(filepath, encoding='unicode_escape')
+            pipeline = (
+                Transform.Pipeline()
+                .read_csv(filepath=filepath, encoding='unicode_escape', chunksize=100)
+                .keep_columns(columns=['Full Name', 'Exit Date'])
+                .filter_rows("Age > 50")
+            )
+            result = Transform.run_pipeline.function(pipeline=pipeline)
+            self.assertTrue(result.equals(df.drop(columns=['Full Name', 'Exit Date']).query("Age > 50")))
+
+        with self.subTest(f"tpl"):
+
+            filepath = os.path.join("data", "olga", "SF_SH_D0_R0.tpl")
+            df = Transform.run_pipeline.function(pipeline=Pipeline().read_tpl(filepath=filepath))
+            pipeline = (
+                Pipeline()
+                .read_tpl(filepath=filepath, chunksize=7)
+                .keep_columns(columns=['PT_POS-1378M'])
+                .filter_rows(expr="TIME >= 2.5")
+            )
+            result = Transform.run_pipeline.function(pipeline=pipeline)
+            self.assertTrue(result.equals(df.drop(columns=['PT_POS-1378M']).query("TIME >= 2.5")))
+            self.assertEqual(result.index[0], 25)
+            self.assertNotIn('PT_POS-1378M', [column['name'] for column in result.attrs['catalog']])
+
+    def test_convert_to_float(self):
+
+        filepath = os.path.join("data", "csv", "Employee Sample Data.csv")
+        df = pd.read_csv(filepath, encoding='unicode_escape', nrows=5)
+
+        with self.subTest(f"Currency and percentage"):
+
+            result = Transform.convert_to_float.function(df, columns=['Annual Salary', 'Bonus %'])
+            self.assertEqual(result['Annual Salary'].iloc[0], 92368.0)
+            self.assertEqual(result['Bonus %'].dtype, np.float64)
+            self.assertEqual(df['Annual Salary'].iloc[0], "$92,368 ")
+
+        with self.subTest(f"Only numeric columns by default"):
+
+            result = Transform.convert_to_float.function(df, downcast=True)
+            self.assertEqual(result['Annual Salary'].dtype, np.float32)
+            self.assertEqual(result['Full Name'].dtype, object)
+
+        with self.subTest(f"Blank cells by default"):
+
+            values = pd.DataFrame({'a': ['$1,000 ', ' ', '-', None], 'b': ['x', '', '1', None]})
+            result = Transform.convert_to_float.function(values)
+            np.testing.assert_allclose(result['a'], [1000.0, np.nan, np.nan, np.nan])
+            self.assertEqual(result['b'].dtype, object)
+
+        with self.subTest(f"Separators, exponents and negatives"):
+
+            values = pd.DataFrame({
+                'a': ['1.234,5 €', '(10,0)', '', None, '15%'],
+                'b': ['1.0e+000', '-2.5E-001', ' 3 ', 'nan', '4']
+            })
+            result = Transform.convert_to_float.function(values, columns=['a'], decimal=',', percent=True)
+            np.testing.assert_allclose(result['a'], [1234.5, -10.0, np.nan, np.nan, 0.15])
+            result = Transform.convert_to_float.function(values, columns='b')
+            np.testing.assert_allclose(result['b'], [1.0, -0.25, 3.0, np.nan, 4.0])
+
+        with self.subTest(f"Repeated values"):
+
+            values = pd.Series(["$1,000 ", "0% ", None] * 5000)
+            result = Transform.convert_to_float.function(pd.DataFrame({'a': values}))
+            np.testing.assert_allclose(result['a'].iloc[:3], [1000.0, 0.0, np.nan])
+
+        with self.subTest(f"Errors"):
+
+            with self.assertRaises(ValueError):
+
+                Transform.convert_to_float.function(df, columns=['Full Name'])
+
+            result = Transform.convert_to_float.function(df, columns=['Full Name'], errors='coerce')
+            self.assertTrue(result['Full Name'].isna().all())
+
+        with self.subTest(f"Drops are pushed ahead"):
+
+            pipeline = Pipeline().convert_to_float(columns=['a', 'b']).keep_columns(columns=['b']).optimize()
+            self.assertEqual(pipeline.serialize(), [
+                Pipeline.step('keep_columns', kwargs={'columns': ['b']}),
+                Pipeline.step('convert_to_float', kwargs={'columns': ['a']})
+            ])
+
+    def test_set_datetime_index(self):
+
+        with self.subTest(f"Date strings"):
+
+            filepath = os.path.join("data", "csv", "Employee Sample Data.csv")
+            df = pd.read_csv(filepath, encoding='unicode_escape')
+            result = Transform.set_datetime_index.function(df, column='Hire Date')
+            self.assertIsInstance(result.index, pd.DatetimeIndex)
+            self.assertEqual(result.index[0], pd.Timestamp('2022-02-05'))
+            self.assertNotIn('Hire Date', result.columns)
+            self.assertTrue(result.index.equals(pd.DatetimeIndex(pd.to_datetime(df['Hire Date'], format='%m/%d/%Y'))))
+
+        with self.subTest(f"Day first"):
+
+            df = pd.DataFrame({'date': ['2/5/2022', '23/10/2013'], 'a': [1, 2]})
+            result = Transform.set_datetime_index.function(df, column='date', dayfirst=True)
+            self.assertEqual(list(result.index), [pd.Timestamp('2022-05-02'), pd.Timestamp('2013-10-23')])
+
+        with self.subTest(f"Simulation times"):
+
+            tpl = TPL()
+            df = tpl.read(os.path.join("data", "olga", "SF_SH_D0_R0.tpl"))
+            result = Transform.set_datetime_index.function(df)
+            start = pd.Timestamp('2023-06-07 09:08:19')
+            self.assertEqual(result.index[0], start)
+            self.assertEqual(result.index[-1], start + pd.to_timedelta(df['TIME'].iloc[-1], unit='s').round('ns'))
+            self.assertNotIn('TIME', result.columns)
+
+        with self.subTest(f"Simulation times by case"):
+
+            df = OlgaFormatter.read_cases(os.path.join("data", "*", "*.tpl"), max_workers=1)
+            df.attrs['info']['Example1']['date'] = '23-06-08 09:08:19'
+            result = Transform.set_datetime_index.function(df, drop=False)
+            self.assertEqual(result.index.names, ['CASE', 'TIME'])
+            self.assertEqual(result.loc['Example1'].index[0], pd.Timestamp('2023-06-08 09:08:19'))
+            self.assertEqual(result.loc['SF_SH_D0_R0'].index[0], start)
+
+        with self.subTest(f"Unknown start"):
+
+            with self.assertRaises(ValueError):
+
+                Transform.set_datetime_index.function(pd.DataFrame({'TIME': [0.0, 1.0]}))
+
+    def test_resample(self):
+
+        index = pd.date_range('2023-06-07 09:08:19', periods=3000, freq='137ms')
+        df = pd.DataFrame({'a': np.random.rand(3000), 'b': np.arange(3000.0), 'c': 'x'}, index=index)
+        df.iloc[::7, 0] = np.nan
+        # Empty bins between two chunks
+        df = df.drop(index=index[1000:1500])
+
+        with self.subTest(f"DataFrame"):
+
+            result = Transform.resample.function(df, '1s')
+            self.assertIsInstance(result, pd.DataFrame)
+            self.assertTrue(result.equals(df[['a', 'b']].resample('1s').mean()))
+
+        for how in StreamResampler.aggregations:
+
+            with self.subTest(f"Chunks {how}"):
+
+                chunks = (df.iloc[start:start + 333] for start in range(0, len(df), 333))
+                result = Transform.resample.function(chunks, '1s', how=how)
+                expected = df[['a', 'b']].resample('1s').agg(how)
+                self.assertTrue(result.index.equals(expected.index))
+                np.testing.assert_allclose(result.to_numpy(dtype=float), expected.to_numpy(dtype=float))
+
+        with self.subTest(f"Simulation times"):
+
+            filepath = os.path.join("data", "olga", "SF_SH_D0_R0.tpl")
+            df = TPL().read(filepath)
+            pipeline = (
+                Pipeline()
+                .read_tpl(filepath=filepath, chunksize=7)
+                .keep_columns(columns=['PT_POS-1378M'])
+                .resample('1s', how=['mean', 'last'], on='TIME')
+            )
+            result = Transform.run_pipeline.function(pipeline=pipeline)
+            expected = df.drop(columns=['PT_POS-1378M']).assign(TIME=pd.to_timedelta(df['TIME'], unit='s')).resample('1s', on='TIME').agg(['mean', 'last'])
+            self.assertEqual(list(result.index), [0.0, 1.0, 2.0, 3.0, 4.0, 5.0])
+            np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+            self.assertEqual(result.columns[0], (expected.columns[0][0], 'mean'))
+
+            start = df.attrs['info']['date']
+            result = Transform.resample.function(df, '1s', on='TIME', origin=start)
+            self.assertEqual(result.index[0], pd.Timestamp('2023-06-07 09:08:19'))
+
+        with self.subTest(f"Unordered chunks"):
+
+            with self.assertRaises(ValueError):
+
+                Transform.resample.function([df.iloc[10:], df.iloc[:10]], '1s', on='TIME')
+
+    def test_interpolate(self):
+
+        df = TPL().read(os.path.join("data", "olga", "SF_SH_D0_R0.tpl"))
+        columns = df.columns[1:]
+
+        with self.subTest(f"Linear"):
+
+            result = Transform.interpolate.function(df, step=0.1)
+            self.assertEqual(list(result.columns), list(df.columns))
+            np.testing.assert_allclose(result['TIME'], np.arange(len(result)) * 0.1)
+            self.assertEqual(len(result), 51)
+
+            for column in columns[:5]:
+
+                np.testing.assert_allclose(result[column], np.interp(result['TIME'], df['TIME'], df[column]))
+
+        with self.subTest(f"Previous"):
+
+            result = Transform.interpolate.function(df, step='250ms', method='previous', end=6.0)
+            positions = np.searchsorted(df['TIME'], result['TIME'], side='right') - 1
+            expected = df[columns].to_numpy()[positions]
+            expected[result['TIME'] > df['TIME'].iloc[-1]] = np.nan
+            np.testing.assert_allclose(result[columns].to_numpy(), expected)
+            self.assertTrue(result[columns].iloc[-1].isna().all())
+
+        with self.subTest(f"Datetime index"):
+
+            dated = Transform.set_datetime_index.function(df)
+            result = Transform.interpolate.function(dated, step='100ms')
+            self.assertEqual(result.index[1], pd.Timestamp('2023-06-07 09:08:19.1'))
+            np.testing.assert_allclose(result.to_numpy(), Transform.interpolate.function(df, step=0.1)[columns].to_numpy())
+
+        with self.subTest(f"Empty series"):
+
+            grid, values = GridInterpolator(step=1.0).interpolate(np.array([]), np.empty((0, 2)))
+            self.assertEqual((grid.shape, values.shape), ((0,), (0, 2)))
+            result = Transform.interpolate.function(df.iloc[:0], step=0.1)
+            self.assertTrue(result.empty)
+            self.assertEqual(list(result.columns), list(df.columns))
+
+        with self.subTest(f"Unknown method"):
+
+            with self.assertRaises(ValueError):
+
+                Transform.interpolate.function(df, step=0.1, method='cubic')
@@ -0,0 +1,65 @@
+import os
+import unittest
+import numpy as np
+from ..io import IO
+from ..io.olga import Genkey, UnitConverter
+
+
+class TestUnits(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.tpl = os.path.join("data", "olga", "SF_SH_D0_R0.tpl")
+        self.genkey = os.path.join("data", "olga", "SF_SH_D0_R0.genkey")
+        self.df = IO.read_tpl.function(self.tpl)
+        self.units = {column['name']: column['unit'] for column in self.df.attrs['catalog']}
+        return super().setUp()
+
+    def test_convert(self):
+
+        pressure = next(name for name, unit in self.units.items() if unit == '(PA)')
+        temperature = next(name for name, unit in self.units.items() if unit == '(C)')
+        dimensionless = next(name for name, unit in self.units.items() if unit == '(-)')
+
+        with self.subTest(f"Custom mapping"):
+
+            df = UnitConverter({'pressure': 'BAR', 'C': 'K'}, base=None).convert(self.df)
+            np.testing.assert_allclose(df[pressure], self.df[pressure] / 1e5)
+            np.testing.assert_allclose(df[temperature], self.df[temperature] + 273.15)
+            np.testing.assert_array_equal(df[dimensionless], self.df[dimensionless])
+            np.testing.assert_array_equal(df['TIME'], self.df['TIME'])
+            units = {column['name']: column['unit'] for column in df.attrs['catalog']}
+            self.assertEqual(units[pressure], '(BAR)')
+            self.assertEqual(units[temperature], '(K)')
+            self.assertEqual(self.units[pressure], '(PA)')
+
+        with self.subTest(f"Field units"):
+
+            df = IO.read_tpl.function(self.tpl, units='field')
+            np.testing.assert_allclose(df[temperature], self.df[temperature] * 9 / 5 + 32)
+            np.testing.assert_allclose(df[pressure], self.df[pressure] / 6894.757293168361)
+            self.assertEqual(df.attrs['units'][pressure], 'PSIA')
+
+        with self.subTest(f"Round trip"):
+
+            field = UnitConverter('field').convert(self.df)
+            df = UnitConverter('SI').convert(field)
+            np.testing.assert_allclose(df[temperature], self.df[temperature] + 273.15)
+            np.testing.assert_allclose(df[pressure], self.df[pressure])
+
+        with self.subTest(f"Unknown unit system"):
+
+            with self.assertRaises(ValueError):
+
+                UnitConverter('imperial')
+
+    def test_convert_genkey(self):
+
+        genkey = UnitConverter({'length': 'MM', 'M3/H': 'M3/S'}, base=None).convert_genkey(Genkey().read(self.genkey))
+        wall = genkey.find('WALL', 'WALL-1')['parameters']
+        np.testing.assert_allclose(wall['THICKNESS']['value'], [10, 15.875, 10])
+        self.assertEqual(wall['THICKNESS']['unit'], 'MM')
+        pipe = genkey.find('PIPE', 'PIPE-7')['parameters']
+        self.assertAlmostEqual(pipe['LENGTH']['value'], 1026480)
+        integration = genkey['INTEGRATION'][0]['parameters']
+        self.assertEqual(integration['MINDT'], {'value': 0.02, 'unit': 's'})
@@ -1,4 +1,10 @@
 from ..helpers import Helpers
+from .pipeline import Pipeline
+from .numeric import FloatConverter
+from .dates import DateParser
+from .resample import StreamResampler
+from .interpolate import GridInterpolator
+import numpy as np
 import pandas as pd
 
 
@@ -8,6 +14,9 @@ class Transform:
     Documentation here
 
     """
+    # Lazy builder of fused operations, see run_pipeline
+    Pipeline = Pipeline
+
     @Helpers.check_airflow_task_args
     @staticmethod
     def rename_columns(df:pd.DataFrame, **kwargs)->pd.DataFrame:
@@ -28,13 +37,162 @@ class Transform:
     
     @Helpers.check_airflow_task_args
     @staticmethod
-    def resample(df:pd.DataFrame, rule, **kwargs)->pd.DataFrame:
+    def filter_rows(df:pd.DataFrame, expr:str, **kwargs)->pd.DataFrame:
         r"""
-        Documentation here
+        Keep the rows for which a boolean expression is True, see *pd.DataFrame.query*.
+
+        In a [pipeline](#run_pipeline) starting with an IO reader, the filter is evaluated by the reader on each chunk.
+
+        **Parameters**
+
+        - **df:** (pd.DataFrame)
+        - **expr:** (str) query expression, i.e. "TIME >= 3600 and `PT_POS-1378M` > 1e5".
+
+        **Returns**
+
+        - **df:** (pd.DataFrame)
+        """
+        return df.query(expr, **kwargs)
+
+    @Helpers.check_airflow_task_args
+    @staticmethod
+    def resample(df:pd.DataFrame, rule, how='mean', on:str=None, origin=None, unit:str='s', **kwargs)->pd.DataFrame:
+        r"""
+        Downsample the numeric columns of a time series into bins of *rule* width.
+
+        *df* can be also an iterator of time-ordered chunks, i.e. a chunked [IO.read_tpl](#read_tpl) or
+        [IO.read_csv](#read_csv) inside a [pipeline](#run_pipeline); then each chunk is aggregated as it is read and only
+        the bins are kept in memory, see [StreamResampler](#streamresampler). Chunks and numeric times, i.e. the tpl
+        'TIME' column in seconds, are resampled by chunks; a DataFrame with datetimes is resampled by pandas.
+
+        **Parameters**
+
+        - **df:** (pd.DataFrame or iterator of pd.DataFrame)
+        - **rule:** (str or pd.Timedelta) bin width, i.e. '1min'. Only fixed frequencies for chunks and numeric times.
+        - **how:** (str or list, default 'mean') 'mean', 'min', 'max', 'last', 'sum' or 'count'; with a list the columns
+        are (variable, aggregation).
+        - **on:** (str, optional) time column, by default the index.
+        - **origin:** (str or datetime, optional) start date of numeric times, then the bins are datetimes, i.e. the tpl
+        header date (*df.attrs['info']['date']*).
+        - **unit:** (str, default 's') unit of numeric times.
+        - Any other keyword argument is passed to *pd.DataFrame.resample*.
+
+        **Returns**
+
+        - **df:** (pd.DataFrame) one row by bin, labeled by its left edge.
+
+        ```python
+        from airflow_df.transform import Transform
+
+        pipeline = (
+            Transform.Pipeline()
+            .read_tpl(filepath="data/olga/SF_SH_D0_R0.tpl", chunksize=100000)
+            .resample('1min', how=['mean', 'max'], on='TIME', origin='23-06-07 09:08:19')
+        )
+        df = Transform.run_pipeline(pipeline=pipeline)
+        ```
         """
+        if isinstance(df, pd.DataFrame):
+
+            times = df[on] if on is not None else df.index
+
+            if origin is None and pd.api.types.is_datetime64_any_dtype(times.dtype):
+
+                numeric = [column for column in df.columns if column != on and pd.api.types.is_numeric_dtype(df[column].dtype)]
+
+                return df[numeric + ([on] if on is not None else [])].resample(rule, on=on, **kwargs).agg(how)
 
-        return df.resample(rule, **kwargs)
+            df = [df]
+
+        if kwargs:
+
+            raise TypeError(f"Options {list(kwargs)} are not supported resampling by chunks")
+
+        resampler = StreamResampler(rule, how=how, on=on, origin=origin, unit=unit)
+
+        for chunk in df:
+
+            resampler.update(chunk)
+
+        return resampler.result()
     
+    @Helpers.check_airflow_task_args
+    @staticmethod
+    def interpolate(
+        df:pd.DataFrame,
+        step,
+        method:str='linear',
+        on:str=None,
+        start=None,
+        end=None,
+        unit:str='s'
+    )->pd.DataFrame:
+        r"""
+        Interpolate the numeric columns of a variable time step series, i.e. an OLGA trend, onto a regular time grid.
+        All the columns are interpolated at once on the values matrix, see [GridInterpolator](#gridinterpolator).
+
+        **Parameters**
+
+        - **df:** (pd.DataFrame)
+        - **step:** (float, str or pd.Timedelta) grid step, i.e. 0.1 seconds for numeric times or '100ms'.
+        - **method:** ({'linear', 'previous'}, default 'linear') 'previous' keeps the last value at or before each grid
+        time.
+        - **on:** (str, optional) time column, by default the 'TIME' column of tpl files or the index.
+        - **start:** (optional) first grid time, by default the first time.
+        - **end:** (optional) last grid time, by default the last time.
+        - **unit:** (str, default 's') unit of numeric times, used with string steps.
+
+        **Returns**
+
+        - **df:** (pd.DataFrame) one row by grid time, grid times outside the series are missing values.
+
+        ```python
+        from airflow_df.io import IO
+        from airflow_df.transform import Transform
+
+        df = IO.read_tpl(filepath="data/olga/SF_SH_D0_R0.tpl")
+        df = Transform.interpolate(df, step=0.1)
+        ```
+        """
+        if on is None and 'TIME' in df.columns:
+
+            on = 'TIME'
+
+        times = df[on] if on is not None else df.index.to_series()
+        columns = [column for column in df.columns if column != on and pd.api.types.is_numeric_dtype(df[column].dtype)]
+        values = df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        if pd.api.types.is_datetime64_any_dtype(times.dtype):
+
+            # Nanoseconds from the first time, so float64 keeps their precision
+            origin = times.iloc[0] if len(times) else pd.Timestamp(0, tz=getattr(times.dtype, 'tz', None))
+            start, end = [None if value is None else (pd.Timestamp(value) - origin).value for value in (start, end)]
+            interpolator = GridInterpolator(pd.Timedelta(step).value, method=method, start=start, end=end)
+            grid, values = interpolator.interpolate((times - origin).to_numpy().astype(np.int64), values)
+            grid = origin + pd.to_timedelta(np.rint(grid).astype(np.int64), unit='ns')
+
+        else:
+
+            if isinstance(step, (str, pd.Timedelta)):
+
+                step = pd.Timedelta(step) / pd.Timedelta(1, unit=unit)
+
+            interpolator = GridInterpolator(step, method=method, start=start, end=end)
+            grid, values = interpolator.interpolate(times.to_numpy(dtype=np.float64), values)
+
+        if on is not None:
+
+            result = pd.DataFrame(values, columns=columns)
+            result.insert(0, on, grid)
+
+        else:
+
+            result = pd.DataFrame(values, columns=columns, index=pd.Index(grid, name=df.index.name))
+
+        result.attrs = df.attrs
+
+        return result
+
     @Helpers.check_airflow_task_args
     @staticmethod
     def reset_index(df:pd.DataFrame, **kwargs)->pd.DataFrame:
@@ -55,21 +213,138 @@ class Transform:
     
     @Helpers.check_airflow_task_args
     @staticmethod
-    def convert_to_float(df:pd.DataFrame, **kwargs)->pd.DataFrame:
+    def convert_to_float(
+        df:pd.DataFrame,
+        columns:list=None,
+        decimal:str='.',
+        thousands:str=None,
+        percent:bool=False,
+        downcast:bool=False,
+        errors:str='raise'
+    )->pd.DataFrame:
         r"""
-        Documentation here
+        Convert columns of numeric strings into floats, whole columns at once with pandas string kernels.
+
+        Currency and percentage strings ('$92,368 ', '0% '), thousands separators, decimal commas, negatives in parentheses
+        and OLGA exponents ('1.0e+000') are handled, blank strings are missing values. See
+        [FloatConverter](#floatconverter).
+
+        **Parameters**
+
+        - **df:** (pd.DataFrame)
+        - **columns:** (str or list, optional) columns to convert. By default all the non numeric columns whose values
+        are all numbers, the others are left as they are.
+        - **decimal:** (str, default '.') decimal separator, i.e. ',' for '1.234,5'.
+        - **thousands:** (str, optional) thousands separator, by default ',' or '.' when *decimal* is ','.
+        - **percent:** (bool, default False) divide percentages by 100, '15%' is 0.15 instead of 15.0.
+        - **downcast:** (bool, default False) float32 columns instead of float64.
+        - **errors:** ({'raise', 'coerce'}, default 'raise') with 'coerce', values that are not numbers are missing
+        values.
+
+        **Returns**
+
+        - **df:** (pd.DataFrame)
+
+        ```python
+        from airflow_df.transform import Transform
+
+        df = Transform.convert_to_float(df, columns=['Annual Salary', 'Bonus %'], percent=True)
+        ```
         """
+        converter = FloatConverter(decimal=decimal, thousands=thousands, percent=percent)
+        result = df.copy(deep=False)
 
-        pass
+        if columns is None:
+
+            for column in df.columns[~df.dtypes.map(pd.api.types.is_numeric_dtype).to_numpy(dtype=bool)]:
+
+                values = converter.convert(df[column], errors='coerce', downcast=downcast)
+
+                # Only columns whose values are all numbers or missing value tokens
+                if np.array_equal(np.isnan(values), converter.missing(df[column])):
+
+                    result[column] = values
+
+            return result
+
+        for column in [columns] if isinstance(columns, str) else columns:
+
+            result[column] = converter.convert(df[column], errors=errors, downcast=downcast)
+
+        return result
 
     @Helpers.check_airflow_task_args
     @staticmethod
-    def set_datetime_index(df:pd.DataFrame, **kwargs)->pd.DataFrame:
+    def set_datetime_index(
+        df:pd.DataFrame,
+        column:str=None,
+        format:str=None,
+        dayfirst:bool=False,
+        origin=None,
+        unit:str='s',
+        drop:bool=True
+    )->pd.DataFrame:
         r"""
-        Documentation here
+        Set a DatetimeIndex from a column of date strings or of simulation times.
+
+        - Date strings, i.e. 'Hire Date' ('2/5/2022'), are parsed with one format inferred from a sample of distinct
+        values, see [DateParser](#dateparser).
+        - Numeric columns, i.e. the tpl 'TIME' column, are elapsed times added to the simulation start at once. The start
+        is the tpl header date ('23-06-07 09:08:19') kept in *df.attrs['info']*, by case when several cases were read.
+
+        **Parameters**
+
+        - **df:** (pd.DataFrame)
+        - **column:** (str, optional) by default 'TIME'.
+        - **format:** (str, optional) strptime format of the date strings, inferred by default.
+        - **dayfirst:** (bool, default False) prefer day first formats for ambiguous dates.
+        - **origin:** (str or datetime, optional) start of the simulation times, by default the tpl header date.
+        - **unit:** (str, default 's') unit of the simulation times.
+        - **drop:** (bool, default True) remove the column.
+
+        **Returns**
+
+        - **df:** (pd.DataFrame) with a DatetimeIndex, the other levels of a MultiIndex, i.e. 'CASE', are kept.
+
+        ```python
+        from airflow_df.io import IO
+        from airflow_df.transform import Transform
+
+        df = IO.read_tpl(filepath="data/olga/SF_SH_D0_R0.tpl")
+        df = Transform.set_datetime_index(df)
+        ```
         """
+        column = column or 'TIME'
 
-        pass
+        if column not in df.columns:
+
+            raise ValueError(f"There is not a {column!r} column to set the datetime index")
+
+        values = df[column]
+
+        if pd.api.types.is_numeric_dtype(values.dtype):
+
+            if origin is None:
+
+                origin = Transform.__simulation_start(df)
+
+            dates = DateParser.offsets(values.to_numpy(), origin, unit=unit)
+
+        else:
+
+            dates = DateParser.parse(values, format=format, dayfirst=dayfirst).to_numpy()
+
+        result = df.drop(columns=column) if drop else df.copy(deep=False)
+        dates = pd.DatetimeIndex(dates, name=column)
+
+        if df.index.nlevels > 1:
+
+            levels = [df.index.get_level_values(level) for level in range(df.index.nlevels - 1)]
+            dates = pd.MultiIndex.from_arrays(levels + [dates])
+
+        result.index = dates
+
+        return result
 
     @Helpers.check_airflow_task_args
     @staticmethod
@@ -87,4 +362,54 @@ class Transform:
         Documentation here
         """
 
-        pass
\ No newline at end of file
+        pass
+
+    @Helpers.check_airflow_task_args
+    @staticmethod
+    def run_pipeline(df:pd.DataFrame=None, pipeline=None, optimize:bool=True)->pd.DataFrame:
+        r"""
+        Run a chain of Transform operations in a single task, only the final DataFrame is pushed to the next task.
+
+        The pipeline can start with an IO reader (*read_csv* or *read_tpl*), then no DataFrame is given and the column drops
+        and row filters that follow the reader are pushed into it.
+
+        **Parameters**
+
+        - **df:** (pd.DataFrame, optional) None if the pipeline starts with an IO reader.
+        - **pipeline:** (Pipeline or list) pipeline built with *Transform.Pipeline()*, or its serialized steps.
+        - **optimize:** (bool) merge renames and drops, move drops ahead and remove no-op steps before running.
+
+        **Returns**
+
+        - **df:** (pd.DataFrame)
+
+        ```python
+        from airflow_df.transform import Transform
+
+        pipeline = Transform.Pipeline().rename_columns(columns={"a": "b"}).keep_columns(columns=["c"]).reset_index()
+        df = Transform.run_pipeline(df, pipeline=pipeline)
+        ```
+        """
+        if not isinstance(pipeline, Pipeline):
+
+            pipeline = Pipeline(pipeline)
+
+        return pipeline.run(df, optimize=optimize)
+
+    @staticmethod
+    def __simulation_start(df:pd.DataFrame):
+
+        info = df.attrs.get('info') or dict()
+
+        if 'date' in info:
+
+            return info['date']
+
+        if 'CASE' in df.index.names and info:
+
+            # Several cases, one start by case
+            starts = {case: DateParser.origin(case_info['date']).to_datetime64() for case, case_info in info.items()}
+
+            return df.index.get_level_values('CASE').map(starts).to_numpy(dtype='datetime64[ns]')
+
+        raise ValueError("The simulation start is unknown, provide origin")
@@ -0,0 +1,135 @@
+import warnings
+import numpy as np
+import pandas as pd
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+
+# Simulation start in tpl headers, i.e. '23-06-07 09:08:19'
+OLGA_DATE_FORMAT = '%y-%m-%d %H:%M:%S'
+
+
+class DateParser:
+    r"""
+    Builds datetimes from whole columns: date strings are parsed with one format inferred from a sample, instead of
+    guessing it row by row, and simulation times are added to their start date at once.
+
+    ```python
+    from airflow_df.transform.dates import DateParser
+
+    dates = DateParser.parse(pd.Series(['2/5/2022', '10/23/2013']))
+    dates = DateParser.offsets(np.array([0.0, 0.126]), '23-06-07 09:08:19')
+    ```
+    """
+
+    sample = 100
+
+    @staticmethod
+    def guess_format(values:pd.Series, dayfirst:bool=False)->str:
+        r"""
+        Infer the format of date strings from a sample of their distinct values.
+
+        **Parameters**
+
+        - **values:** (pd.Series) date strings.
+        - **dayfirst:** (bool) prefer day first formats when a sample is ambiguous, i.e. '2/5/2022'.
+
+        **Returns**
+
+        - **format:** (str or None) strptime format that parses the whole sample, None if there is not one.
+        """
+        sample = pd.Series(values.dropna().unique()[:DateParser.sample], dtype=object).astype(str).str.strip()
+        candidates = list()
+
+        for value in sample.iloc[:5]:
+
+            for first in (dayfirst, not dayfirst):
+
+                with warnings.catch_warnings():
+
+                    # Both orders are tried on purpose
+                    warnings.simplefilter('ignore', UserWarning)
+                    candidate = guess_datetime_format(value, dayfirst=first)
+
+                if candidate is not None and candidate not in candidates:
+
+                    candidates.append(candidate)
+
+        for candidate in candidates:
+
+            try:
+
+                pd.to_datetime(sample, format=candidate)
+
+            except (ValueError, TypeError):
+
+                continue
+
+            return candidate
+
+        return None
+
+    @staticmethod
+    def parse(values:pd.Series, format:str=None, dayfirst:bool=False)->pd.Series:
+        r"""
+        Parse date strings with one format, inferred by [guess_format](#guess_format) if it is not provided. Values with
+        mixed formats are parsed one by one.
+
+        **Returns**
+
+        - **dates:** (pd.Series) datetime64 values.
+        """
+        if pd.api.types.is_datetime64_any_dtype(values.dtype):
+
+            return values
+
+        format = format or DateParser.guess_format(values, dayfirst=dayfirst)
+
+        if format is None:
+
+            return pd.to_datetime(values, format='mixed', dayfirst=dayfirst)
+
+        return pd.to_datetime(values, format=format, cache=True)
+
+    @staticmethod
+    def origin(date)->pd.Timestamp:
+        r"""
+        Parse a simulation start date, i.e. the tpl header date '23-06-07 09:08:19'.
+        """
+        if isinstance(date, str):
+
+            try:
+
+                return pd.Timestamp(pd.to_datetime(date.strip(), format=OLGA_DATE_FORMAT))
+
+            except ValueError:
+
+                pass
+
+        return pd.Timestamp(date)
+
+    @staticmethod
+    def offsets(times:np.ndarray, origin, unit:str='s')->np.ndarray:
+        r"""
+        Convert simulation times into datetimes with one vectorized operation.
+
+        **Parameters**
+
+        - **times:** (np.ndarray) elapsed times, i.e. the tpl 'TIME' column.
+        - **origin:** (str, datetime or np.ndarray) simulation start, or one start by row.
+        - **unit:** (str, default 's') unit of *times*.
+
+        **Returns**
+
+        - **dates:** (np.ndarray) datetime64[ns] values.
+        """
+        nanoseconds = np.rint(np.asarray(times, dtype=np.float64) * pd.Timedelta(1, unit=unit).value)
+        origin = np.asarray(origin if isinstance(origin, np.ndarray) else DateParser.origin(origin).to_datetime64(), dtype='datetime64[ns]')
+
+        missing = np.isnan(nanoseconds)
+        dates = origin + np.where(missing, 0, nanoseconds).astype(np.int64).astype('timedelta64[ns]')
+        dates[missing] = np.datetime64('NaT')
+
+        return dates
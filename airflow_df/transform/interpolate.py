@@ -0,0 +1,103 @@
+import numpy as np
+
+
+class GridInterpolator:
+    r"""
+    Interpolates variable time step series, i.e. OLGA trends, onto a regular time grid. All the columns are interpolated
+    at once on the values matrix: the grid times are located with one binary search and the rows around them are blended
+    with matrix operations, instead of one *np.interp* call by column.
+
+    Grid times outside the series are missing values.
+
+    ```python
+    from airflow_df.transform.interpolate import GridInterpolator
+
+    grid, values = GridInterpolator(0.1).interpolate(times, values)
+    ```
+    """
+
+    methods = ('linear', 'previous')
+
+    def __init__(self, step:float, method:str='linear', start:float=None, end:float=None):
+
+        if method not in self.methods:
+
+            raise ValueError(f"method must be one of {list(self.methods)}, got {method!r}")
+
+        if not step > 0:
+
+            raise ValueError(f"step must be positive, got {step}")
+
+        self.step = step
+        self.method = method
+        self.start = start
+        self.end = end
+
+    def grid(self, times:np.ndarray)->np.ndarray:
+        r"""
+        Regular grid from *start* (by default the first time) to *end* (by default the last time), empty when there are
+        no times to take a missing bound from.
+        """
+        if not len(times) and (self.start is None or self.end is None):
+
+            return np.empty(0)
+
+        start = times[0] if self.start is None else self.start
+        end = times[-1] if self.end is None else self.end
+        # Tolerance for an end time that is a multiple of step
+        size = int(np.floor((end - start) / self.step + 1e-9)) + 1
+
+        return start + np.arange(max(size, 0)) * self.step
+
+    def interpolate(self, times:np.ndarray, values:np.ndarray, grid:np.ndarray=None):
+        r"""
+        Interpolate a values matrix onto the grid.
+
+        **Parameters**
+
+        - **times:** (np.ndarray) increasing times of the rows.
+        - **values:** (np.ndarray) matrix with one row by time.
+        - **grid:** (np.ndarray, optional) grid times, by default [grid](#grid).
+
+        **Returns**
+
+        - **(grid, values):** (tuple) grid times and interpolated matrix, one row by grid time.
+        """
+        times = np.asarray(times, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+
+        if values.ndim == 1:
+
+            values = values[:, None]
+
+        if np.any(np.diff(times) < 0):
+
+            raise ValueError("times must be increasing")
+
+        grid = self.grid(times) if grid is None else np.asarray(grid, dtype=np.float64)
+        result = np.full((len(grid), values.shape[1]), np.nan)
+
+        if not len(times):
+
+            return grid, result
+
+        inside = (grid >= times[0]) & (grid <= times[-1])
+        positions = np.searchsorted(times, grid[inside], side='right') - 1
+
+        if self.method == 'previous':
+
+            result[inside] = values[positions]
+
+            return grid, result
+
+        left = np.minimum(positions, len(times) - 2) if len(times) > 1 else positions
+        right = np.minimum(left + 1, len(times) - 1)
+        span = times[right] - times[left]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+
+            weight = np.where(span > 0, (grid[inside] - times[left]) / span, 0.0)
+
+        result[inside] = values[left] + (values[right] - values[left]) * weight[:, None]
+
+        return grid, result
@@ -0,0 +1,150 @@
+import re
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow
+    import pyarrow.compute
+except ImportError:
+    pyarrow = None
+
+CURRENCY = '$€£¥'
+# Strings read as missing values, as pd.read_csv does
+NA_VALUES = ['', '-', 'nan', 'NaN', 'NA', 'N/A', 'n/a', 'null', 'NULL', 'None']
+
+
+class FloatConverter:
+    r"""
+    Converts columns of numeric strings into floats with pandas string kernels, i.e. currency and percentage strings
+    ('$92,368 ', '0% '), thousands separators, decimal commas ('1.234,5'), negatives in parentheses ('(12.5)') and OLGA
+    exponents ('1.0e+000'). Blank strings and the usual missing value markers ('nan', 'N/A', 'null') are missing values.
+
+    Only the distinct strings are cleaned when a column repeats its values, otherwise the string kernels run on Arrow
+    strings when *pyarrow* is installed.
+
+    ```python
+    from airflow_df.transform.numeric import FloatConverter
+
+    converter = FloatConverter(decimal=',')
+    values = converter.convert(pd.Series(['1.234,5 €', '(10,0)', '']))
+    ```
+    """
+
+    # Columns with less distinct values than this fraction of the sampled rows are cleaned by distinct value
+    repeated = 0.5
+    sample = 10000
+
+    def __init__(self, decimal:str='.', thousands:str=None, percent:bool=False):
+
+        if thousands is None:
+
+            thousands = ',' if decimal == '.' else '.'
+
+        if thousands == decimal:
+
+            raise ValueError(f"thousands and decimal separators must be different, got {thousands!r}")
+
+        self.decimal = decimal
+        self.thousands = thousands
+        self.percent = percent
+        self.pattern = f"[\\s{re.escape(CURRENCY + '%' + (thousands or ''))}]"
+
+    def convert(self, values:pd.Series, errors:str='raise', downcast:bool=False)->np.ndarray:
+        r"""
+        Convert a column into floats.
+
+        **Parameters**
+
+        - **values:** (pd.Series)
+        - **errors:** ({'raise', 'coerce'}) with 'coerce', strings that are not numbers are missing values.
+        - **downcast:** (bool) return float32 instead of float64.
+
+        **Returns**
+
+        - **values:** (np.ndarray)
+        """
+        dtype = np.float32 if downcast else np.float64
+
+        if pd.api.types.is_numeric_dtype(values.dtype) or pd.api.types.is_bool_dtype(values.dtype):
+
+            return values.to_numpy(dtype=dtype, na_value=np.nan)
+
+        sample = values.iloc[:self.sample]
+
+        if sample.nunique() < self.repeated * len(sample):
+
+            codes, uniques = pd.factorize(values)
+            floats = self.clean(pd.Series(uniques, dtype=object), errors=errors)
+
+            return np.where(codes < 0, np.nan, floats[codes]).astype(dtype, copy=False)
+
+        return self.clean(values, errors=errors).astype(dtype, copy=False)
+
+    @staticmethod
+    def missing(values:pd.Series)->np.ndarray:
+        r"""
+        Missing values of a column before conversion: null values and strings that are missing value tokens once
+        stripped, i.e. blank strings or '-'.
+
+        **Returns**
+
+        - **missing:** (np.ndarray) boolean mask.
+        """
+        strings = values.astype('string[pyarrow]' if pyarrow is not None else 'string').str.strip()
+
+        return strings.isin(NA_VALUES).to_numpy(dtype=bool) | values.isna().to_numpy(dtype=bool)
+
+    def clean(self, values:pd.Series, errors:str='raise')->np.ndarray:
+        r"""
+        Strip symbols and separators from numeric strings and parse them.
+
+        **Returns**
+
+        - **values:** (np.ndarray) float64 values.
+        """
+        strings = values.astype('string[pyarrow]' if pyarrow is not None else 'string').str.strip()
+        negative = (strings.str.startswith('(') & strings.str.endswith(')')).fillna(False).to_numpy(dtype=bool)
+
+        if negative.any():
+
+            strings = strings.str.strip('()')
+
+        if self.percent:
+
+            percent = strings.str.endswith('%').fillna(False).to_numpy(dtype=bool)
+
+        strings = strings.str.replace(self.pattern, '', regex=True)
+
+        if self.decimal != '.':
+
+            strings = strings.str.replace(self.decimal, '.', regex=False)
+
+        strings = strings.mask(strings.isin(NA_VALUES))
+        floats = self.parse(strings, errors=errors)
+        floats[negative] *= -1
+
+        if self.percent:
+
+            floats[percent] /= 100
+
+        return floats
+
+    @staticmethod
+    def parse(strings:pd.Series, errors:str='raise')->np.ndarray:
+        r"""
+        Parse clean numeric strings, with the Arrow cast kernel when *pyarrow* is installed.
+        """
+        if pyarrow is not None:
+
+            try:
+
+                floats = pyarrow.compute.cast(pyarrow.array(strings), pyarrow.float64())
+
+                return floats.to_numpy(zero_copy_only=False, writable=True)
+
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError):
+
+                # Let pandas raise or coerce the invalid strings
+                pass
+
+        return pd.to_numeric(strings, errors=errors).to_numpy(dtype=np.float64, na_value=np.nan)
@@ -0,0 +1,426 @@
+import contextlib
+import pandas as pd
+
+
+class Pipeline:
+    r"""
+    Lazy chain of [Transform](#transform) operations.
+
+    Calling a Transform operation on a pipeline records it instead of running it, so a whole chain is executed in a
+    single task with [Transform.run_pipeline](#run_pipeline) and no intermediate DataFrame goes through XCom or the
+    result backend. Before running, the chain is optimized:
+
+    - Consecutive *rename_columns* and consecutive *keep_columns* steps are merged into one.
+    - Column drops (*keep_columns*) are moved ahead of the operations they commute with, so fewer columns are renamed,
+    converted, resampled or interpolated.
+    - Steps that do nothing, i.e. an empty rename, are removed.
+
+    - A pipeline can start with an IO reader, i.e. *read_csv* or *read_tpl*. Then the drops and row filters
+    (*filter_rows*) right after the reader are pushed into it, as *usecols* and *where*, so dropped columns are never
+    parsed and filtered rows never accumulate in memory.
+
+    Steps run with copy-on-write enabled, so renames, drops and index resets share the column buffers instead of copying
+    them.
+
+    ```python
+    from airflow_df.io import IO
+    from airflow_df.transform import Transform
+
+    pipeline = (
+        Transform.Pipeline()
+        .rename_columns(columns={"PT_POSITION:_PIPE-1_1": "pressure"})
+        .keep_columns(columns=["TM_POSITION:_PIPE-1_1"])
+        .reset_index()
+    )
+    df = IO.read_tpl(filepath="data/olga/SF_SH_D0_R0.tpl")
+    df = Transform.run_pipeline(df, pipeline=pipeline)
+
+    pipeline = (
+        Transform.Pipeline()
+        .read_csv(filepath="exports/*.csv")
+        .keep_columns(columns=["Notes"])
+        .filter_rows("Salary > 50000")
+    )
+    df = Transform.run_pipeline(pipeline=pipeline)
+    ```
+    """
+
+    # Operations a column drop can be moved ahead of, see pushdown
+    pushdown = ('rename_columns', 'resample', 'interpolate', 'convert_to_float')
+    # IO readers that accept pushed down drops and filters, with the catalog field matched by usecols callables
+    sources = {'read_csv': None, 'read_tpl': 'name'}
+
+    def __init__(self, steps:list=None):
+
+        self.steps = [self.step(*step) if isinstance(step, (list, tuple)) else self.step(**step) for step in steps or list()]
+
+    def __getattr__(self, name:str):
+
+        if name.startswith('_'):
+
+            raise AttributeError(name)
+
+        def record(*args, **kwargs):
+
+            return Pipeline(self.steps + [self.step(name, list(args), kwargs)])
+
+        return record
+
+    def __len__(self):
+
+        return len(self.steps)
+
+    def __repr__(self):
+
+        return " -> ".join(step['name'] for step in self.steps) or "Pipeline()"
+
+    @staticmethod
+    def step(name:str, args:list=None, kwargs:dict=None)->dict:
+        r"""
+        Builds a pipeline step.
+
+        **Parameters**
+
+        - **name:** (str) Transform operation.
+        - **args:** (list, optional) positional arguments after the DataFrame.
+        - **kwargs:** (dict, optional) keyword arguments.
+
+        **Returns**
+
+        - **step:** (dict) with keys *name*, *args* and *kwargs*.
+        """
+        return {'name': name, 'args': list(args or list()), 'kwargs': dict(kwargs or dict())}
+
+    def serialize(self)->list:
+        r"""
+        JSON serializable steps, a pipeline can be built again with *Pipeline(steps)*.
+        """
+        return [self.step(**step) for step in self.steps]
+
+    def optimize(self)->'Pipeline':
+        r"""
+        Returns an equivalent pipeline with merged renames and drops, drops moved ahead and no-op steps removed.
+        """
+        steps = list()
+
+        for step in self.serialize():
+
+            if self.is_drop(step):
+
+                step['kwargs']['columns'] = self.as_list(step['kwargs']['columns'])
+                steps = self.push_drop(steps, step)
+
+            elif self.is_rename(step):
+
+                mapping = step['kwargs']['columns']
+
+                if steps and self.is_rename(steps[-1]):
+
+                    mapping = self.merge_renames(steps.pop()['kwargs']['columns'], mapping)
+
+                if mapping:
+
+                    steps.append(self.step('rename_columns', kwargs={'columns': mapping}))
+
+            else:
+
+                steps.append(step)
+
+        return Pipeline(self.push_to_source(steps))
+
+    def run(self, df:pd.DataFrame=None, optimize:bool=True)->pd.DataFrame:
+        r"""
+        Run the pipeline on a DataFrame.
+
+        **Parameters**
+
+        - **df:** (pd.DataFrame, optional) input DataFrame, None if the pipeline starts with an IO reader.
+        - **optimize:** (bool) optimize the steps before running them.
+
+        **Returns**
+
+        - **df:** (pd.DataFrame)
+        """
+        from . import Transform
+        from ..io import IO
+
+        pipeline = self.optimize() if optimize else self
+
+        with self.copy_on_write():
+
+            for position, step in enumerate(pipeline.steps):
+
+                if position == 0 and step['name'] in self.sources:
+
+                    df = getattr(IO, step['name']).function(*step['args'], result_backend=None, **step['kwargs'])
+                    continue
+
+                operation = getattr(Transform, step['name'], None)
+
+                if step['name'].startswith('_') or not hasattr(operation, 'function'):
+
+                    raise ValueError(f"{step['name']!r} is not a Transform operation")
+
+                df = operation.function(df, *step['args'], result_backend=None, **step['kwargs'])
+
+        return df
+
+    def push_to_source(self, steps:list)->list:
+        r"""
+        Moves the drops and row filters that follow an IO reader into its *usecols* and *where* arguments.
+        """
+        if not steps or steps[0]['name'] not in self.sources:
+
+            return steps
+
+        source = self.step(**steps[0])
+        kwargs = source['kwargs']
+        steps = steps[1:]
+
+        while steps:
+
+            step = steps[0]
+
+            if self.is_filter(step):
+
+                expr = (step['args'] or [step['kwargs'].get('expr')])[0]
+                kwargs['where'] = f"({kwargs['where']}) and ({expr})" if kwargs.get('where') else expr
+
+            elif self.is_drop(step):
+
+                usecols = self.project(source, step['kwargs']['columns'])
+
+                if usecols is None:
+
+                    break
+
+                kwargs['usecols'] = usecols
+
+            else:
+
+                break
+
+            steps = steps[1:]
+
+        return [source] + steps
+
+    def project(self, source:dict, columns:list):
+        r"""
+        *usecols* of a reader without *columns*, None if the drop can not be pushed into the reader.
+        """
+        usecols = source['kwargs'].get('usecols')
+        where = source['kwargs'].get('where') or ''
+
+        if any(str(column) in where for column in columns):
+
+            # The filter needs the column
+            return None
+
+        if source['name'] == 'read_tpl':
+
+            if 'TIME' in columns:
+
+                return None
+
+            if usecols is None:
+
+                return Exclude(columns, key=self.sources['read_tpl'])
+
+            if isinstance(usecols, Exclude):
+
+                return Exclude(usecols.columns + columns, key=usecols.key)
+
+            return None
+
+        if usecols is None:
+
+            return Exclude(columns)
+
+        if isinstance(usecols, Exclude):
+
+            return Exclude(usecols.columns + columns)
+
+        if isinstance(usecols, (list, tuple)) and all(isinstance(column, str) for column in usecols):
+
+            return [column for column in usecols if column not in columns]
+
+        return None
+
+    def push_drop(self, steps:list, drop:dict)->list:
+        r"""
+        Appends a drop to *steps*, moving it ahead of the last steps it commutes with and merging it with a previous drop.
+        """
+        position = len(steps)
+        columns = drop['kwargs']['columns']
+
+        while position > 0:
+
+            previous = steps[position - 1]
+
+            if self.is_drop(previous):
+
+                merged = previous['kwargs']['columns'] + [column for column in columns if column not in previous['kwargs']['columns']]
+                steps[position - 1] = self.step('keep_columns', kwargs={'columns': merged})
+
+                return steps
+
+            if previous['name'] not in self.pushdown:
+
+                break
+
+            if self.is_rename(previous):
+
+                sources = self.rename_sources(previous['kwargs']['columns'], columns)
+
+                if sources is None:
+
+                    break
+
+                columns = sources
+
+            elif previous['name'] == 'convert_to_float':
+
+                converted = previous['kwargs'].get('columns')
+
+                if previous['args'] or isinstance(converted, str):
+
+                    break
+
+                if converted is not None:
+
+                    # The dropped columns are not converted anymore
+                    kwargs = {**previous['kwargs'], 'columns': [column for column in converted if column not in columns]}
+                    steps[position - 1] = self.step('convert_to_float', kwargs=kwargs)
+
+            elif previous['name'] in ('resample', 'interpolate'):
+
+                if (previous['kwargs'].get('on') or 'TIME') in columns or 'level' in previous['kwargs']:
+
+                    break
+
+            else:
+
+                break
+
+            position -= 1
+
+        steps.insert(position, self.step('keep_columns', kwargs={'columns': columns}))
+
+        return steps
+
+    @staticmethod
+    def is_drop(step:dict)->bool:
+        r"""
+        True if the step drops a list of columns by name.
+        """
+        return step['name'] == 'keep_columns' and not step['args'] and list(step['kwargs']) == ['columns']
+
+    @staticmethod
+    def is_filter(step:dict)->bool:
+        r"""
+        True if the step filters rows with a query expression.
+        """
+        return (
+            step['name'] == 'filter_rows' and len(step['args']) + len(step['kwargs']) == 1 and
+            set(step['kwargs']) <= {'expr'}
+        )
+
+    @staticmethod
+    def is_rename(step:dict)->bool:
+        r"""
+        True if the step renames columns with a mapping.
+        """
+        return (
+            step['name'] == 'rename_columns' and not step['args'] and list(step['kwargs']) == ['columns'] and
+            isinstance(step['kwargs']['columns'], dict)
+        )
+
+    @staticmethod
+    def as_list(columns)->list:
+
+        if isinstance(columns, (list, tuple, set, pd.Index)):
+
+            return list(columns)
+
+        return [columns]
+
+    @staticmethod
+    def merge_renames(first:dict, second:dict)->dict:
+        r"""
+        Mapping equivalent to renaming with *first* and then with *second*.
+        """
+        merged = dict()
+
+        for column in list(first) + [column for column in second if column not in first]:
+
+            renamed = first.get(column, column)
+            merged[column] = second.get(renamed, renamed)
+
+        return {column: name for column, name in merged.items() if column != name}
+
+    @staticmethod
+    def rename_sources(mapping:dict, columns:list):
+        r"""
+        Column names before a rename of the *columns* after it, None if a column is not produced by the rename. Renames
+        are assumed not to collide with existing columns, so a renamed column only comes from the mapping.
+        """
+        sources = list()
+
+        for column in columns:
+
+            found = [source for source in mapping if mapping[source] == column]
+
+            if not found and column not in mapping:
+
+                found = [column]
+
+            if not found:
+
+                return None
+
+            sources.extend(source for source in found if source not in sources)
+
+        return sources
+
+    @staticmethod
+    def copy_on_write():
+        r"""
+        Context enabling pandas copy-on-write, which is always enabled since pandas 3.
+        """
+        try:
+
+            pd.get_option('mode.copy_on_write')
+
+        except (KeyError, pd.errors.OptionError):
+
+            return contextlib.nullcontext()
+
+        return pd.option_context('mode.copy_on_write', True)
+
+
+class Exclude:
+    r"""
+    Picklable *usecols* callable that keeps every column but *columns*. With *key*, it is evaluated against a catalog
+    entry, i.e. the *name* of a tpl variable.
+    """
+
+    def __init__(self, columns:list, key:str=None):
+
+        self.columns = list(columns)
+        self.key = key
+
+    def __call__(self, column)->bool:
+
+        if self.key is not None:
+
+            column = column[self.key]
+
+        return column not in self.columns
+
+    def __eq__(self, other):
+
+        return isinstance(other, Exclude) and (self.columns, self.key) == (other.columns, other.key)
+
+    def __repr__(self):
+
+        return f"Exclude({self.columns!r})"
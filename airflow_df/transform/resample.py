@@ -0,0 +1,233 @@
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+from .dates import DateParser
+
+
+class StreamResampler:
+    r"""
+    Downsamples time-ordered chunks, i.e. from chunked csv or tpl reads, into fixed-width bins without keeping the data
+    in memory. Each chunk is reduced to sums, counts, minimums, maximums and last values by bin, and the bin still open at
+    the end of a chunk is merged with the beginning of the next one.
+
+    Bins are closed and labeled on the left, as pandas does for fixed frequencies. Datetime bins start at the midnight of
+    the first time; numeric times, i.e. the tpl 'TIME' column in seconds, give numeric bins starting at 0. Missing values
+    are skipped, and empty bins between two chunks are kept.
+
+    ```python
+    from airflow_df.io.olga import TPL
+    from airflow_df.transform.resample import StreamResampler
+
+    resampler = StreamResampler('1min', how=['mean', 'max'], on='TIME')
+
+    for chunk in TPL().read("data/olga/SF_SH_D0_R0.tpl", chunksize=100000):
+
+        resampler.update(chunk)
+
+    df = resampler.result()
+    ```
+    """
+
+    aggregations = ('mean', 'min', 'max', 'last', 'sum', 'count')
+
+    def __init__(self, rule, how='mean', on:str=None, origin=None, unit:str='s'):
+
+        try:
+
+            self.width = to_offset(rule).nanos
+
+        except ValueError:
+
+            raise ValueError(f"Only fixed frequencies can be resampled by chunks, got {rule!r}")
+
+        self.how = [how] if isinstance(how, str) else list(how)
+        unknown = [name for name in self.how if name not in self.aggregations]
+
+        if unknown:
+
+            raise ValueError(f"Unknown aggregations {unknown}, available aggregations are {list(self.aggregations)}")
+
+        self.on = on
+        self.origin = origin
+        self.unit = unit
+        self.anchor = None
+        self.numeric = None
+        self.name = None
+        self.columns = None
+        self.bins = list()
+        self.open = None
+
+    def update(self, chunk:pd.DataFrame):
+        r"""
+        Aggregate a chunk, its times must not be before the times of the previous chunk.
+        """
+        times, chunk = self.times(chunk)
+
+        if not len(times):
+
+            return
+
+        if self.columns is None:
+
+            self.columns = [column for column in chunk.columns if pd.api.types.is_numeric_dtype(chunk[column].dtype)]
+            self.numeric = not np.issubdtype(times.dtype, np.datetime64)
+            self.anchor = 0 if self.numeric else times[0].astype('datetime64[D]').astype('datetime64[ns]').astype(np.int64)
+
+        values = chunk[self.columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        keys = self.keys(times)
+
+        if self.open is not None and keys[0] < self.open['key']:
+
+            raise ValueError("Chunks must be ordered by time")
+
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(keys)) + 1))
+
+        if np.any(keys[starts[1:]] < keys[starts[:-1]]):
+
+            raise ValueError("Chunks must be ordered by time")
+
+        valid = ~np.isnan(values)
+        positions = np.where(valid, np.arange(len(values))[:, None], -1)
+        last = np.maximum.reduceat(positions, starts, axis=0)
+        partial = {
+            'key': keys[starts],
+            'sum': np.add.reduceat(np.where(valid, values, 0.0), starts, axis=0),
+            'count': np.add.reduceat(valid, starts, axis=0).astype(np.int64),
+            'min': np.fmin.reduceat(values, starts, axis=0),
+            'max': np.fmax.reduceat(values, starts, axis=0),
+            'last': np.where(last >= 0, np.take_along_axis(values, np.maximum(last, 0), axis=0), np.nan)
+        }
+
+        if self.open is not None:
+
+            if partial['key'][0] == self.open['key']:
+
+                self.merge(partial, self.open)
+
+            else:
+
+                self.bins.append({key: np.atleast_1d(value) if key == 'key' else value[None, :] for key, value in self.open.items()})
+
+        # The last bin may go on in the next chunk
+        self.open = {key: value[-1] for key, value in partial.items()}
+        self.bins.append({key: value[:-1] for key, value in partial.items()})
+
+    def result(self)->pd.DataFrame:
+        r"""
+        Finish the open bin and build the resampled DataFrame, one column by variable or, for several aggregations, by
+        (variable, aggregation).
+        """
+        bins = list(self.bins)
+
+        if self.open is not None:
+
+            bins.append({key: np.atleast_1d(value) if key == 'key' else value[None, :] for key, value in self.open.items()})
+
+        bins = [part for part in bins if len(part['key'])]
+
+        if not bins:
+
+            return pd.DataFrame(columns=self.columns)
+
+        state = {key: np.concatenate([part[key] for part in bins]) for key in bins[0]}
+        keys = np.arange(state['key'][0], state['key'][-1] + 1)
+        rows = state['key'] - keys[0]
+        shape = (len(keys), len(self.columns))
+        sums = np.zeros(shape)
+        counts = np.zeros(shape, dtype=np.int64)
+        sums[rows], counts[rows] = state['sum'], state['count']
+        empty = counts == 0
+        results = dict()
+
+        for name in self.how:
+
+            if name == 'sum':
+
+                results[name] = sums
+
+            elif name == 'count':
+
+                results[name] = counts
+
+            elif name == 'mean':
+
+                with np.errstate(invalid='ignore', divide='ignore'):
+
+                    results[name] = np.where(empty, np.nan, sums / np.maximum(counts, 1))
+
+            else:
+
+                values = np.full(shape, np.nan)
+                values[rows] = state[name]
+                results[name] = values
+
+        index = self.labels(keys)
+
+        if len(self.how) == 1:
+
+            return pd.DataFrame(results[self.how[0]], index=index, columns=self.columns)
+
+        columns = pd.MultiIndex.from_product([self.columns, self.how])
+        data = np.stack([results[name] for name in self.how], axis=2).reshape(len(keys), -1)
+
+        return pd.DataFrame(data, index=index, columns=columns)
+
+    def times(self, chunk:pd.DataFrame):
+        r"""
+        Times of a chunk, from the *on* column or the index, and the chunk without the *on* column.
+        """
+        if self.on is not None:
+
+            times = chunk[self.on].to_numpy()
+            chunk = chunk.drop(columns=self.on)
+
+        else:
+
+            times = chunk.index.to_numpy()
+
+        self.name = self.on if self.on is not None else chunk.index.name
+
+        if self.origin is not None and not np.issubdtype(times.dtype, np.datetime64):
+
+            times = DateParser.offsets(times, self.origin, unit=self.unit)
+
+        if np.issubdtype(times.dtype, np.datetime64):
+
+            times = times.astype('datetime64[ns]')
+
+        elif not np.issubdtype(times.dtype, np.number):
+
+            raise ValueError("Chunks must have datetime or numeric times")
+
+        return times, chunk
+
+    def keys(self, times:np.ndarray)->np.ndarray:
+        r"""
+        Bin number of each time.
+        """
+        if self.numeric:
+
+            return np.floor(times * (pd.Timedelta(1, unit=self.unit).value / self.width)).astype(np.int64)
+
+        return (times.astype(np.int64) - self.anchor) // self.width
+
+    def labels(self, keys:np.ndarray)->pd.Index:
+        r"""
+        Left edge of the bins.
+        """
+        if self.numeric:
+
+            return pd.Index(keys * (self.width / pd.Timedelta(1, unit=self.unit).value), name=self.name)
+
+        return pd.DatetimeIndex((self.anchor + keys * self.width).astype('datetime64[ns]'), name=self.name)
+
+    @staticmethod
+    def merge(partial:dict, open:dict):
+        r"""
+        Merge the open bin of the previous chunk into the first bin of a chunk.
+        """
+        partial['sum'][0] += open['sum']
+        partial['count'][0] += open['count']
+        partial['min'][0] = np.fmin(partial['min'][0], open['min'])
+        partial['max'][0] = np.fmax(partial['max'][0], open['max'])
+        partial['last'][0] = np.where(np.isnan(partial['last'][0]), open['last'], partial['last'][0])
@@ -0,0 +1,114 @@
+'OLGA 2017.2.0.107'
+TIME PLOT
+INPUT FILE
+'SF_SH_D0_R0.genkey'
+PVT FILE
+'../../../00 Nuevos fluidos/Diesel_1.tab' 
+DATE
+'23-06-07 09:08:19'
+PROJECT
+'Supe'
+TITLE
+''
+AUTHOR
+'Jesus E Varajas'
+NETWORK
+1
+GEOMETRY' (M)  '
+BRANCH
+'PIPELINE'
+52
+0.0000000000000000e+000 1.5000000000000000e+000 3.0000000000000000e+000 9.8499999999999996e+000 1.6699999999999999e+001 
+1.7199999999999999e+001 1.7699999999999999e+001 1.9199999999999999e+001 2.0699999999999999e+001 2.9299999999999997e+001 
+3.7899999999999999e+001 4.5399999999999999e+001 5.2899999999999999e+001 5.6613999999999999e+002 1.0793800000000001e+003 
+1.0838800000000001e+003 1.0883800000000001e+003 1.0913800000000001e+003 1.0943800000000001e+003 1.0951800000000001e+003 
+1.0959800000000000e+003 1.1207800000000000e+003 1.1455799999999999e+003 1.2250799999999999e+003 1.3045799999999999e+003 
+1.3328799999999999e+003 1.3611799999999998e+003 1.3629299999999998e+003 1.3646799999999998e+003 1.3656799999999998e+003 
+1.3666799999999998e+003 1.3714299999999998e+003 1.3761799999999998e+003 1.3771799999999998e+003 1.3781799999999998e+003 
+1.3846799999999998e+003 1.3911799999999998e+003 1.3914299999999998e+003 1.3916799999999998e+003 1.3989299999999998e+003 
+1.4061799999999998e+003 1.4072800000000000e+003 1.4083800000000001e+003 1.4096300000000001e+003 1.4108800000000001e+003 
+1.4111300000000001e+003 1.4113800000000001e+003 1.4118800000000001e+003 1.4123800000000001e+003 1.4128800000000001e+003 
+1.4133800000000001e+003 1.4533800000000001e+003 1.4933800000000001e+003 
+0.0000000000000000e+000 0.0000000000000000e+000 0.0000000000000000e+000 6.8499999999999996e+000 1.3699999999999999e+001 
+1.3699999999999999e+001 1.3699999999999999e+001 1.3699999999999999e+001 1.3699999999999999e+001 5.1000000000000014e+000 
+-3.5000000000000000e+000 -3.5000000000000000e+000 -3.5000000000000000e+000 2.7500000000000000e+000 9.0000000000000000e+000 
+9.0000000000000000e+000 9.0000000000000000e+000 9.0000000000000000e+000 9.0000000000000000e+000 9.0000000000000000e+000 
+9.0000000000000000e+000 9.0000000000000000e+000 9.0000000000000000e+000 9.0000000000000000e+000 9.0000000000000000e+000 
+9.0000000000000000e+000 9.0000000000000000e+000 9.0000000000000000e+000 8.9999999999997726e+000 9.9999999999997726e+000 
+1.1000000000000000e+001 1.1000000000000000e+001 1.1000000000000000e+001 1.1000000000000000e+001 1.1000000000000000e+001 
+1.1000000000000000e+001 1.1000000000000000e+001 1.1000000000000000e+001 1.1000000000000000e+001 1.1000000000000000e+001 
+1.1000000000000000e+001 1.1000000000000000e+001 1.1000000000000000e+001 1.1000000000000000e+001 1.1000000000000000e+001 
+1.1000000000000000e+001 1.1000000000000000e+001 1.1000000000000000e+001 1.1000000000000000e+001 1.1000000000000000e+001 
+1.1000000000000000e+001 1.1000000000000000e+001 1.1000000000000000e+001 
+CATALOG 
+18
+KAPPA 'POSITION:' 'POS-1378M' '(1/Pa)' 'Compressibility of fluid'
+PT 'POSITION:' 'POS-1378M' '(PA)' 'Pressure'
+TM 'POSITION:' 'POS-1378M' '(C)' 'Fluid temperature'
+GT 'POSITION:' 'POS-1378M' '(KG/S)' 'Total mass flow'
+QLT 'POSITION:' 'POS-1378M' '(M3/S)' 'Total liquid volume flow'
+ROHL 'POSITION:' 'POS-1378M' '(KG/M3)' 'Oil density'
+ACMLK 'LEAK:' 'LEAK' '(KG)' 'Leakage accumulated released mass'
+GTLEAK 'LEAK:' 'LEAK' '(KG/S)' 'Leakage total mass flow rate'
+PTLKUP 'LEAK:' 'LEAK' '(PA)' 'Pressure at the position where Leak is positioned'
+PVALVE 'CHOKE:' 'V-IN' '(PA)' 'Valve pressure'
+PVALVE 'CHOKE:' 'V-OUT' '(PA)' 'Valve pressure'
+VALVOP 'CHOKE:' 'V-IN' '(-)' 'Relative valve opening'
+VALVOP 'CHOKE:' 'V-OUT' '(-)' 'Relative valve opening'
+CONTR 'CONTROLLER:' 'CONTROL-VOUT' '(-)' 'Controller output'
+CONTR 'CONTROLLER:' 'CONTROL-LEAK' '(-)' 'Controller output'
+CONTR 'CONTROLLER:' 'CONTROL-VIN' '(-)' 'Controller output'
+CONTR 'CONTROLLER:' 'CONTROL-TKIN' '(-)' 'Controller output'
+CONTR 'CONTROLLER:' 'CONTROL-SOURCE' '(-)' 'Controller output'
+TIME SERIES  ' (S)  '
+0.000000e+000 7.936948e-010 3.609431e+005 3.012824e+001 1.226712e+002 1.472899e-001 8.328555e+002 0.000000e+000 0.000000e+000 3.620429e+005 7.806019e+005 1.962281e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+1.262576e-001 7.936925e-010 3.613126e+005 3.012830e+001 1.226465e+002 1.472602e-001 8.328557e+002 0.000000e+000 0.000000e+000 3.623033e+005 7.768944e+005 1.955935e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+2.143284e-001 7.936912e-010 3.615189e+005 3.012833e+001 1.226366e+002 1.472482e-001 8.328559e+002 0.000000e+000 0.000000e+000 3.625032e+005 7.785108e+005 1.958409e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+3.023991e-001 7.936900e-010 3.617074e+005 3.012836e+001 1.226326e+002 1.472435e-001 8.328560e+002 0.000000e+000 0.000000e+000 3.626984e+005 7.790863e+005 1.960225e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+4.345053e-001 7.936857e-010 3.623874e+005 3.012847e+001 1.226419e+002 1.472546e-001 8.328563e+002 0.000000e+000 0.000000e+000 3.631692e+005 7.804629e+005 1.964518e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+5.225760e-001 7.936793e-010 3.633873e+005 3.012863e+001 1.226765e+002 1.472960e-001 8.328569e+002 0.000000e+000 0.000000e+000 3.639577e+005 7.815309e+005 1.970245e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+6.106279e-001 7.936687e-010 3.650630e+005 3.012889e+001 1.227516e+002 1.473861e-001 8.328578e+002 0.000000e+000 0.000000e+000 3.653267e+005 7.825950e+005 1.980220e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+7.425854e-001 7.936422e-010 3.692580e+005 3.012955e+001 1.229848e+002 1.476656e-001 8.328601e+002 0.000000e+000 0.000000e+000 3.689536e+005 7.840113e+005 2.005604e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+8.304050e-001 7.936165e-010 3.733121e+005 3.013019e+001 1.232492e+002 1.479827e-001 8.328623e+002 0.000000e+000 0.000000e+000 3.726408e+005 7.847556e+005 2.030779e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+9.180269e-001 7.935852e-010 3.782645e+005 3.013098e+001 1.236189e+002 1.484261e-001 8.328650e+002 0.000000e+000 0.000000e+000 3.773330e+005 7.853095e+005 2.062026e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+1.005374e+000 7.935498e-010 3.838409e+005 3.013186e+001 1.241008e+002 1.490041e-001 8.328680e+002 0.000000e+000 0.000000e+000 3.828207e+005 7.856744e+005 2.097355e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+1.135708e+000 7.934948e-010 3.925282e+005 3.013324e+001 1.250244e+002 1.501122e-001 8.328727e+002 0.000000e+000 0.000000e+000 3.917551e+005 7.859154e+005 2.151443e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+1.222035e+000 7.934607e-010 3.979224e+005 3.013410e+001 1.257507e+002 1.509837e-001 8.328756e+002 0.000000e+000 0.000000e+000 3.975516e+005 7.859234e+005 2.183407e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+1.307847e+000 7.934314e-010 4.025582e+005 3.013484e+001 1.265361e+002 1.519261e-001 8.328782e+002 0.000000e+000 0.000000e+000 4.027300e+005 7.858416e+005 2.208627e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+1.435540e+000 7.934000e-010 4.075257e+005 3.013564e+001 1.277567e+002 1.533912e-001 8.328808e+002 0.000000e+000 0.000000e+000 4.086357e+005 7.856471e+005 2.229486e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+1.519980e+000 7.933886e-010 4.093356e+005 3.013594e+001 1.285527e+002 1.543467e-001 8.328818e+002 0.000000e+000 0.000000e+000 4.110591e+005 7.855350e+005 2.230915e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+1.603894e+000 7.933847e-010 4.099481e+005 3.013604e+001 1.293015e+002 1.552457e-001 8.328821e+002 0.000000e+000 0.000000e+000 4.122182e+005 7.854316e+005 2.222726e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+1.728874e+000 7.933914e-010 4.089040e+005 3.013590e+001 1.302861e+002 1.564280e-001 8.328816e+002 0.000000e+000 0.000000e+000 4.117650e+005 7.852941e+005 2.195332e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+1.811684e+000 7.934022e-010 4.072085e+005 3.013564e+001 1.308293e+002 1.570803e-001 8.328806e+002 0.000000e+000 0.000000e+000 4.102955e+005 7.851970e+005 2.169961e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+1.935292e+000 7.934243e-010 4.037329e+005 3.013510e+001 1.314599e+002 1.578378e-001 8.328787e+002 0.000000e+000 0.000000e+000 4.069088e+005 7.849984e+005 2.126448e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+2.017391e+000 7.934408e-010 4.011265e+005 3.013469e+001 1.317587e+002 1.581968e-001 8.328773e+002 0.000000e+000 0.000000e+000 4.042223e+005 7.848027e+005 2.096875e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+2.140232e+000 7.934654e-010 3.972503e+005 3.013409e+001 1.320418e+002 1.585372e-001 8.328752e+002 0.000000e+000 0.000000e+000 4.000775e+005 7.843758e+005 2.055628e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+2.222001e+000 7.934803e-010 3.949041e+005 3.013372e+001 1.321364e+002 1.586510e-001 8.328739e+002 0.000000e+000 0.000000e+000 3.974861e+005 7.839909e+005 2.031888e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+2.303724e+000 7.934931e-010 3.928734e+005 3.013340e+001 1.321708e+002 1.586925e-001 8.328728e+002 0.000000e+000 0.000000e+000 3.951831e+005 7.835287e+005 2.012038e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+2.426290e+000 7.935078e-010 3.905525e+005 3.013303e+001 1.321400e+002 1.586558e-001 8.328716e+002 0.000000e+000 0.000000e+000 3.924478e+005 7.827107e+005 1.990281e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+2.508000e+000 7.935143e-010 3.895270e+005 3.013286e+001 1.320906e+002 1.585966e-001 8.328710e+002 0.000000e+000 0.000000e+000 3.911762e+005 7.821159e+005 1.981187e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+2.630566e+000 7.935201e-010 3.886008e+005 3.013271e+001 1.319930e+002 1.584795e-001 8.328705e+002 0.000000e+000 0.000000e+000 3.899738e+005 7.812184e+005 1.973174e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+2.712277e+000 7.935214e-010 3.883944e+005 3.013267e+001 1.319258e+002 1.583988e-001 8.328704e+002 0.000000e+000 0.000000e+000 3.895981e+005 7.806619e+005 1.971612e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+2.834843e+000 7.935195e-010 3.886955e+005 3.013271e+001 1.318387e+002 1.582943e-001 8.328706e+002 0.000000e+000 0.000000e+000 3.896776e+005 7.799656e+005 1.974584e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+2.916553e+000 7.935165e-010 3.891614e+005 3.013278e+001 1.317975e+002 1.582447e-001 8.328708e+002 0.000000e+000 0.000000e+000 3.900961e+005 7.796285e+005 1.979191e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+3.039119e+000 7.935106e-010 3.900821e+005 3.013293e+001 1.317686e+002 1.582099e-001 8.328713e+002 0.000000e+000 0.000000e+000 3.909643e+005 7.793533e+005 1.987203e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+3.120830e+000 7.935062e-010 3.907794e+005 3.013304e+001 1.317714e+002 1.582132e-001 8.328717e+002 0.000000e+000 0.000000e+000 3.917015e+005 7.793325e+005 1.993258e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+3.202540e+000 7.935006e-010 3.916726e+005 3.013318e+001 1.317874e+002 1.582323e-001 8.328722e+002 0.000000e+000 0.000000e+000 3.924842e+005 7.794355e+005 2.000279e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+3.325106e+000 7.934912e-010 3.931617e+005 3.013342e+001 1.318532e+002 1.583112e-001 8.328730e+002 0.000000e+000 0.000000e+000 3.939675e+005 7.797843e+005 2.011005e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+3.406817e+000 7.934843e-010 3.942523e+005 3.013360e+001 1.319252e+002 1.583975e-001 8.328736e+002 0.000000e+000 0.000000e+000 3.950616e+005 7.801197e+005 2.018498e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+3.529383e+000 7.934727e-010 3.960798e+005 3.013389e+001 1.320799e+002 1.585831e-001 8.328746e+002 0.000000e+000 0.000000e+000 3.968649e+005 7.807105e+005 2.029785e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+3.611094e+000 7.934638e-010 3.974970e+005 3.013412e+001 1.322157e+002 1.587459e-001 8.328753e+002 0.000000e+000 0.000000e+000 3.982387e+005 7.811244e+005 2.038050e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+3.733586e+000 7.934483e-010 3.999518e+005 3.013452e+001 1.324728e+002 1.590544e-001 8.328767e+002 0.000000e+000 0.000000e+000 4.006387e+005 7.817148e+005 2.052019e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+3.815109e+000 7.934367e-010 4.017865e+005 3.013482e+001 1.326820e+002 1.593053e-001 8.328777e+002 0.000000e+000 0.000000e+000 4.024522e+005 7.820592e+005 2.062203e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+3.937142e+000 7.934180e-010 4.047566e+005 3.013530e+001 1.330533e+002 1.597509e-001 8.328793e+002 0.000000e+000 0.000000e+000 4.054304e+005 7.824693e+005 2.078219e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+4.018301e+000 7.934051e-010 4.067969e+005 3.013564e+001 1.333373e+002 1.600916e-001 8.328804e+002 0.000000e+000 0.000000e+000 4.075161e+005 7.826624e+005 2.088835e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+4.139703e+000 7.933866e-010 4.097379e+005 3.013612e+001 1.338087e+002 1.606573e-001 8.328819e+002 0.000000e+000 0.000000e+000 4.106001e+005 7.828315e+005 2.103224e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+4.220394e+000 7.933756e-010 4.114855e+005 3.013641e+001 1.341448e+002 1.610606e-001 8.328829e+002 0.000000e+000 0.000000e+000 4.124884e+005 7.828701e+005 2.110831e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+4.300880e+000 7.933662e-010 4.129696e+005 3.013665e+001 1.344897e+002 1.614746e-001 8.328837e+002 0.000000e+000 0.000000e+000 4.141382e+005 7.828552e+005 2.116179e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+4.421217e+000 7.933562e-010 4.145789e+005 3.013693e+001 1.350054e+002 1.620936e-001 8.328845e+002 0.000000e+000 0.000000e+000 4.160173e+005 7.827384e+005 2.119182e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+4.501185e+000 7.933523e-010 4.151937e+005 3.013704e+001 1.353355e+002 1.624899e-001 8.328849e+002 0.000000e+000 0.000000e+000 4.168095e+005 7.826236e+005 2.117626e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+4.620775e+000 7.933511e-010 4.154080e+005 3.013709e+001 1.357905e+002 1.630361e-001 8.328850e+002 0.000000e+000 0.000000e+000 4.172639e+005 7.824437e+005 2.110089e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+4.700282e+000 7.933530e-010 4.151081e+005 3.013706e+001 1.360571e+002 1.633562e-001 8.328848e+002 0.000000e+000 0.000000e+000 4.170897e+005 7.823062e+005 2.101990e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+4.819262e+000 7.933593e-010 4.141315e+005 3.013692e+001 1.363903e+002 1.637564e-001 8.328843e+002 0.000000e+000 0.000000e+000 4.162271e+005 7.820809e+005 2.086455e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+4.937972e+000 7.933684e-010 4.127121e+005 3.013672e+001 1.366370e+002 1.640528e-001 8.328835e+002 0.000000e+000 0.000000e+000 4.148375e+005 7.818323e+005 2.068711e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
+5.017001e+000 7.933753e-010 4.116295e+005 3.013656e+001 1.367534e+002 1.641926e-001 8.328829e+002 0.000000e+000 0.000000e+000 4.137324e+005 7.816529e+005 2.056601e+005 1.000000e+000 2.727000e-001 2.727000e-001 0.000000e+000 1.000000e+000 7.884000e-001 0.000000e+000
@@ -1,6 +1,11 @@
 from unittest import TestLoader, TestSuite, TextTestRunner
 from airflow_df.tests.test_io import TestIO
 from airflow_df.tests.test_tpl import TestTPL
+from airflow_df.tests.test_cache import TestTPLCache
+from airflow_df.tests.test_helpers import TestResultBackend
+from airflow_df.tests.test_transform import TestTransform
+from airflow_df.tests.test_genkey import TestGenkey
+from airflow_df.tests.test_units import TestUnits
 
 def suite():
     r"""
@@ -10,6 +15,11 @@ def suite():
     suite = TestSuite()
     tests.append(TestLoader().loadTestsFromTestCase(TestIO))
     tests.append(TestLoader().loadTestsFromTestCase(TestTPL))
+    tests.append(TestLoader().loadTestsFromTestCase(TestTPLCache))
+    tests.append(TestLoader().loadTestsFromTestCase(TestResultBackend))
+    tests.append(TestLoader().loadTestsFromTestCase(TestTransform))
+    tests.append(TestLoader().loadTestsFromTestCase(TestGenkey))
+    tests.append(TestLoader().loadTestsFromTestCase(TestUnits))
 
     suite = TestSuite(tests)
     return suite